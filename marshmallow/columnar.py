@@ -0,0 +1,334 @@
+# -*- coding: utf-8 -*-
+"""Column-at-a-time serialization and deserialization, used by
+:meth:`Schema.dump_columns <marshmallow.Schema.dump_columns>` and
+:meth:`Schema.load_columns <marshmallow.Schema.load_columns>`.
+
+The columns of `Integer`, `Float`, `Number`, `Decimal`, `Boolean` and
+`DateTime` fields are `numpy` arrays. Numeric columns without null values are
+converted by a single call to `numpy` instead of a call to the field per row.
+
+.. warning::
+
+    This module is treated as private API.
+    Users should not need to use this module directly.
+"""
+from __future__ import absolute_import, unicode_literals
+
+import datetime as dt
+
+from marshmallow import fields, utils
+from marshmallow.compat import iteritems
+from marshmallow.compiler import (
+    get_accessor_strategy, _can_inline_serialize, _can_inline_deserialize
+)
+from marshmallow.marshalling import get_column
+from marshmallow.exceptions import ValidationError
+from marshmallow.utils import missing
+
+numpy_available = False
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy = None
+
+__all__ = [
+    'dump_columns',
+    'load_columns',
+]
+
+# Errors raised by numpy when a value can't be converted to the column type
+_CONVERSION_ERRORS = (TypeError, ValueError, OverflowError)
+
+
+def get_dtype(field_obj):
+    """Return the `numpy` dtype of the column of ``field_obj``, or `None` if the
+    column is a list.
+    """
+    field_class = type(field_obj)
+    if field_class is fields.Boolean:
+        return 'bool'
+    if field_class is fields.DateTime:
+        return 'datetime64[us]'
+    if field_class in (fields.Number, fields.Integer, fields.Float, fields.Decimal):
+        if field_obj.as_string:
+            return None
+        return 'int64' if field_obj.num_type is int else 'float64'
+    return None
+
+
+def _to_naive_utc(value):
+    if isinstance(value, dt.datetime) and value.tzinfo is not None:
+        return value.astimezone(utils.UTC).replace(tzinfo=None)
+    return value
+
+
+def _to_array(values, dtype):
+    """Return ``values`` as an array of ``dtype``, or `None` if some values
+    can't be converted.
+    """
+    if dtype.startswith('datetime64'):
+        if not all(isinstance(value, dt.datetime) for value in values):
+            return None
+        values = [_to_naive_utc(value) for value in values]
+    try:
+        return numpy.array(values, dtype=dtype)
+    except _CONVERSION_ERRORS:
+        return None
+
+
+def _get_timestamp_unit(field_obj):
+    """Return the unit of the timestamps of a `DateTime` field, or `None` if
+    its values are not formatted as timestamps.
+    """
+    if type(field_obj) is not fields.DateTime:
+        return None
+    return fields.TIMESTAMP_FORMATS.get(field_obj.dateformat)
+
+
+def _has_null(values):
+    # Compare by identity: ``in`` would call the __eq__ method of each value
+    return any(value is None or value is missing for value in values)
+
+
+def _can_vectorize_dump(field_obj):
+    """Return `True` if the column of ``field_obj`` may be built directly from
+    the values of the objects, without calling the field per object.
+    """
+    field_class = type(field_obj)
+    return (
+        field_class in (fields.Number, fields.Integer, fields.Float, fields.DateTime) and
+        get_dtype(field_obj) is not None and
+        field_obj._CHECK_ATTRIBUTE and
+        _can_inline_serialize(field_obj)
+    )
+
+
+def _dump_column(objs, attr_name, field_obj, key, accessor, strategy, store_error,
+                 index_errors):
+    dtype = get_dtype(field_obj)
+    if _can_vectorize_dump(field_obj):
+        values = get_column(objs, attr_name, field_obj, accessor, strategy)
+        if not _has_null(values):
+            column = _to_array(values, dtype)
+            if column is not None:
+                unit = _get_timestamp_unit(field_obj)
+                if unit is not None:
+                    # Microseconds since the epoch, rounded down to the unit
+                    return column.astype('int64') // (1000000 // utils.TIMESTAMP_UNITS[unit])
+                return column
+    column = []
+    valid = True
+    for idx, obj in enumerate(objs):
+        try:
+            value = field_obj.serialize(attr_name, obj, accessor=accessor)
+        except ValidationError as err:
+            store_error(err, key, field_obj, idx if index_errors else None)
+            value = None
+            valid = False
+        column.append(None if value is missing else value)
+    # Formatted datetimes stay in a list
+    if valid and dtype in ('bool', 'int64', 'float64') and not _has_null(column):
+        array = _to_array(column, dtype)
+        if array is not None:
+            return array
+    return column
+
+
+def dump_columns(objs, fields_dict, accessor, store_error, prefix='',
+                 dict_class=dict, index_errors=True, obj_type=None):
+    """Serialize the sequence ``objs`` one field at a time and return a
+    dictionary that maps each output key to a column of values, one per object.
+
+    Columns of fields with a `numpy` dtype (see :func:`get_dtype`) are arrays,
+    unless a value is missing, null or invalid. Those columns, and the columns
+    of all other fields, are lists in which missing and invalid values are `None`.
+
+    :param objs: The objects to serialize.
+    :param dict fields_dict: Mapping of field names to bound :class:`Field` objects.
+    :param callable accessor: Function to use for getting values from the objects.
+    :param callable store_error: Function called with a `ValidationError`, the
+        output key, the field and the index of the object to store an error.
+    :param str prefix: Optional prefix that will be prepended to all the
+        serialized field names.
+    :param type dict_class: Dictionary class used to construct the output.
+    :param bool index_errors: Whether to pass the index of invalid objects to
+        ``store_error``.
+    :param type obj_type: If given and all objects are of this type, the values
+        of numeric and datetime fields are pulled with `operator.itemgetter` or
+        `operator.attrgetter` (see :func:`get_accessor_strategy
+        <marshmallow.compiler.get_accessor_strategy>`) instead of ``accessor``.
+        Only pass this if ``accessor`` is
+        :func:`utils.get_value <marshmallow.utils.get_value>`.
+    """
+    if not isinstance(objs, (list, tuple)):
+        objs = list(objs)
+    strategy = None
+    if obj_type is not None and set(map(type, objs)) == set([obj_type]):
+        strategy = get_accessor_strategy(obj_type)
+    ret = dict_class()
+    for attr_name, field_obj in iteritems(fields_dict):
+        if getattr(field_obj, 'load_only', False):
+            continue
+        key = ''.join([prefix or '', field_obj.dump_to or attr_name])
+        ret[key] = _dump_column(objs, attr_name, field_obj, key, accessor, strategy,
+                                store_error, index_errors)
+    return ret
+
+
+def _get_length(columns):
+    lengths = set(len(column) for column in columns.values())
+    if len(lengths) > 1:
+        raise ValueError('All columns must have the same length.')
+    return lengths.pop() if lengths else 0
+
+
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _int64_overflows(raw):
+    """Return the indices of the values of an array of unsigned integers that
+    don't fit in a signed 64-bit integer.
+    """
+    if not isinstance(raw, numpy.ndarray) or raw.dtype.kind != 'u' or raw.dtype.itemsize < 8:
+        return set()
+    return set(numpy.flatnonzero(raw > _INT64_MAX).tolist())
+
+
+def _load_array(raw, field_obj):
+    """Return the array of a column of ``field_obj`` if ``raw`` is an array
+    whose values are all valid without conversion, otherwise `None`.
+    """
+    if not isinstance(raw, numpy.ndarray) or not _can_inline_deserialize(field_obj):
+        return None
+    dtype = get_dtype(field_obj)
+    field_class = type(field_obj)
+    kind = raw.dtype.kind
+    if field_class is fields.Boolean:
+        valid = kind == 'b'
+    elif field_class is fields.DateTime:
+        unit = _get_timestamp_unit(field_obj)
+        if unit is not None and kind in 'iu' and not _int64_overflows(raw):
+            # Timestamps are converted to microseconds since the epoch
+            per_second = utils.TIMESTAMP_UNITS[unit]
+            raw = raw.astype('int64') * (1000000 // per_second)
+            raw = raw.astype('datetime64[us]')
+            kind = 'M'
+        valid = kind == 'M' and not numpy.isnat(raw).any()
+    elif field_class is fields.Integer:
+        valid = kind in 'biu' and not _int64_overflows(raw)
+    elif field_class in (fields.Number, fields.Float):
+        valid = kind in 'biuf'
+    else:
+        valid = False
+    if not valid:
+        return None
+    return raw.astype(dtype)
+
+
+def _validate_array(array, name, field_obj, store_error, index_errors):
+    """Run the validators of ``field_obj`` on ``array``. Return ``array`` if all
+    values are valid, otherwise a list of its values in which the invalid values
+    are `None`.
+    """
+    errors = field_obj._validate_many(array)
+    if not errors:
+        return array
+    column = array.tolist()
+    for idx in sorted(errors):
+        store_error(ValidationError(errors[idx]), name, field_obj,
+                    idx if index_errors else None)
+        column[idx] = None
+    return column
+
+
+def _load_column(raw, length, attr_name, name, field_obj, store_error, index_errors):
+    array = _load_array(raw, field_obj)
+    if array is not None:
+        if not field_obj.validators:
+            return array
+        return _validate_array(array, name, field_obj, store_error, index_errors)
+    # Datetimes of a datetime64 column only need to be validated
+    is_datetime = (
+        isinstance(raw, numpy.ndarray) and raw.dtype.kind == 'M' and
+        type(field_obj) is fields.DateTime
+    )
+    if raw is missing:
+        missing_value = field_obj.missing
+        values = [missing_value() if callable(missing_value) else missing_value
+                  for _ in range(length)]
+    elif is_datetime:
+        # NaT values become None
+        values = raw.astype('datetime64[us]').tolist()
+    elif isinstance(raw, numpy.ndarray):
+        values = raw.tolist()
+    else:
+        values = raw
+    # Values that would wrap around in an int64 column are invalid
+    overflows = _int64_overflows(raw) if get_dtype(field_obj) == 'int64' else ()
+    column = []
+    valid = True
+    for idx, value in enumerate(values):
+        try:
+            if idx in overflows:
+                raise field_obj.make_error('invalid')
+            if is_datetime and value is not None:
+                field_obj._validate(value)
+            else:
+                value = field_obj.deserialize(value, attr_name, values)
+        except ValidationError as err:
+            store_error(err, name, field_obj, idx if index_errors else None)
+            value = None
+            valid = False
+        column.append(None if value is missing else value)
+    dtype = get_dtype(field_obj)
+    if valid and dtype is not None and not _has_null(column):
+        array = _to_array(column, dtype)
+        if array is not None:
+            return array
+    return column
+
+
+def load_columns(columns, fields_dict, store_error, partial=False, dict_class=dict,
+                 index_errors=True):
+    """Deserialize a dictionary that maps input keys to columns of values and
+    return a dictionary that maps attribute names to columns of deserialized
+    values. All columns must have the same length.
+
+    `numpy` arrays of booleans, numbers and datetimes that are already valid for
+    their field are converted at once; only the field validators are called per
+    value. All other columns are deserialized one value at a time. The columns of
+    fields with a `numpy` dtype are returned as arrays, unless a value is null
+    or invalid. Invalid values are `None`.
+
+    Schema-level validators are not run.
+
+    :param dict columns: The columns to deserialize.
+    :param dict fields_dict: Mapping of field names to bound :class:`Field` objects.
+    :param callable store_error: Function called with a `ValidationError`, the
+        input key, the field and the row index to store an error.
+    :param bool partial: If `True`, ignore missing columns.
+    :param type dict_class: Dictionary class used to construct the output.
+    :param bool index_errors: Whether to pass the row index of invalid values to
+        ``store_error``.
+    :raise ValueError: If the columns don't all have the same length.
+    """
+    length = _get_length(columns)
+    ret = dict_class()
+    for attr_name, field_obj in iteritems(fields_dict):
+        if field_obj.dump_only:
+            continue
+        name = attr_name
+        raw = columns.get(attr_name, missing)
+        if raw is missing and field_obj.load_from:
+            name = field_obj.load_from
+            raw = columns.get(name, missing)
+        if raw is missing:
+            if partial:
+                continue
+            if field_obj.missing is missing and not field_obj.required:
+                continue
+        key = field_obj.attribute or attr_name
+        ret[key] = _load_column(raw, length, field_obj.load_from or attr_name, name,
+                                field_obj, store_error, index_errors)
+    return ret
@@ -0,0 +1,663 @@
+# -*- coding: utf-8 -*-
+"""Code generation for schema-specialized (de)serialization functions.
+
+The :class:`Marshaller <marshmallow.marshalling.Marshaller>` walks a dictionary
+of fields for every object it serializes. The functions in this module take a
+dictionary of bound fields and generate the source of a Python function that
+does the same work for a single object, with the attribute reads, output keys,
+defaults and formatting calls unrolled into straight-line code.
+
+.. warning::
+
+    This module is treated as private API.
+    Users should not need to use this module directly.
+"""
+
+from __future__ import absolute_import, unicode_literals
+
+import collections
+import json
+from json.encoder import encode_basestring_ascii
+
+from marshmallow import fields, utils
+from marshmallow.compat import iteritems, text_type, basestring
+from marshmallow.exceptions import ValidationError
+from marshmallow.utils import missing
+
+__all__ = [
+    'get_accessor_strategy',
+    'compile_serializer',
+    'compile_json_serializer',
+    'compile_deserializer',
+    'compile_validator',
+    'can_validate_many',
+    'can_serialize_many',
+    'can_return_errors',
+]
+
+_INDENT = '    '
+
+# Code objects by generated source. Schema instances of the same class
+# generate the same source, so compiling it once per class is enough.
+_code_cache = {}
+
+
+def _get_func(klass, name):
+    """Return the plain function implementing ``klass.name``, so that methods
+    can be compared across classes on both Python 2 and 3.
+    """
+    method = getattr(klass, name, None)
+    return getattr(method, '__func__', method)
+
+
+def _overrides(field_obj, base_class, name):
+    return _get_func(type(field_obj), name) is not _get_func(base_class, name)
+
+
+def _can_inline_serialize(field_obj):
+    """Return `True` if the value lookup and default handling of
+    `Field.serialize` may be unrolled for ``field_obj``.
+    """
+    if _overrides(field_obj, fields.Field, 'get_value'):
+        return False
+    serialize = _get_func(type(field_obj), 'serialize')
+    if serialize is _get_func(fields.Field, 'serialize'):
+        return True
+    # Number.serialize only differs from Field.serialize when as_string=True
+    return (
+        serialize is _get_func(fields.Number, 'serialize') and
+        not getattr(field_obj, 'as_string', False)
+    )
+
+
+def _get_owner(klass, name):
+    """Return the class of the MRO of ``klass`` that defines ``name``."""
+    for base in klass.__mro__:
+        if name in base.__dict__:
+            return base
+    return None
+
+
+def _is_most_derived(field_obj, name, dependencies):
+    """Return `True` if the method ``name`` of ``field_obj`` is defined by a
+    class that is at least as derived as the classes that define each of the
+    methods ``dependencies``.
+    """
+    field_class = type(field_obj)
+    owner = _get_owner(field_class, name)
+    return all(
+        issubclass(owner, _get_owner(field_class, dependency))
+        for dependency in dependencies
+        if _get_owner(field_class, dependency) is not None
+    )
+
+
+# Methods that the builtin `_serialize_many` implementations stand in for
+_SERIALIZE_MANY_DEPENDENCIES = ('_serialize', '_validated', '_format_num')
+
+# Methods that the builtin `_deserialize_or_error` implementations stand in for
+_DESERIALIZE_OR_ERROR_DEPENDENCIES = ('_deserialize', '_validated', '_format_num')
+
+
+def can_serialize_many(field_obj):
+    """Return `True` if the ``_serialize_many`` method of ``field_obj`` may be
+    called in place of its ``_serialize`` method for each value, i.e. if
+    ``_serialize_many`` is defined by a class that is at least as derived as the
+    classes that define ``_serialize`` and the methods it relies on.
+    """
+    return _is_most_derived(field_obj, '_serialize_many', _SERIALIZE_MANY_DEPENDENCIES)
+
+
+def can_return_errors(field_obj):
+    """Return `True` if the ``_deserialize_or_error`` method of ``field_obj``
+    may be called in place of its ``_deserialize`` method, so that invalid
+    values are reported by returning a `ValidationError` instead of raising it.
+    """
+    return _is_most_derived(field_obj, '_deserialize_or_error',
+                            _DESERIALIZE_OR_ERROR_DEPENDENCIES)
+
+
+def _format_lines(field_obj, n, namespace):
+    """Return the source lines that format ``value`` for ``field_obj``. The
+    formatting of a few builtin field classes is inlined; all other fields
+    call their bound ``_serialize`` method.
+    """
+    field_class = type(field_obj)
+    if field_class in (fields.Field, fields.Raw):
+        return []
+    if field_class is fields.String:
+        return [
+            'if value is not None and type(value) is not text_type:',
+            _INDENT + 'value = ensure_text_type(value)',
+        ]
+    if field_class in (fields.Number, fields.Integer, fields.Float):
+        namespace['num_type_{0}'.format(n)] = field_obj.num_type
+        return [
+            'if value is not None:',
+            _INDENT + 'try:',
+            _INDENT * 2 + 'value = num_type_{0}(value)'.format(n),
+            _INDENT + 'except (TypeError, ValueError):',
+            _INDENT * 2 + "field_{0}.fail('invalid')".format(n),
+        ]
+    namespace['format_{0}'.format(n)] = field_obj._serialize
+    return ['value = format_{0}(value, attr_{0}, obj)'.format(n)]
+
+
+MAPPING = 'mapping'
+ATTRIBUTE = 'attribute'
+
+
+def get_accessor_strategy(obj_type):
+    """Return how values may be pulled from objects of type ``obj_type``
+    without going through :func:`utils.get_value <marshmallow.utils.get_value>`:
+    ``MAPPING`` for mappings, ``ATTRIBUTE`` for objects that don't support
+    item access (including keyed tuples) or `None` if there is no faster way.
+    """
+    if issubclass(obj_type, collections.Mapping):
+        return MAPPING
+    getitem = getattr(obj_type, '__getitem__', None)
+    if getitem is None:
+        return ATTRIBUTE
+    if (issubclass(obj_type, tuple) and hasattr(obj_type, '_fields') and
+            getitem is tuple.__getitem__):
+        # Indexing a keyed tuple with a string raises a TypeError
+        return ATTRIBUTE
+    return None
+
+
+def _lookup_lines(key, strategy):
+    """Return the source lines that pull ``key`` from ``obj`` into ``value``,
+    using ``missing`` as default. Only the first part of a dotted key is
+    looked up according to ``strategy``.
+    """
+    if strategy == MAPPING:
+        return [
+            'try:',
+            _INDENT + 'value = obj[{0}]'.format(key),
+            'except (KeyError, AttributeError, IndexError, TypeError):',
+            _INDENT + 'value = get_value({0}, obj, missing)'.format(key),
+        ]
+    return [
+        'value = getattr(obj, {0}, missing)'.format(key),
+        'if callable(value):',
+        _INDENT + 'try:',
+        _INDENT * 2 + 'value = value()',
+        _INDENT + 'except AttributeError:',
+        _INDENT * 2 + 'value = missing',
+    ]
+
+
+def _get_value_lines(n, namespace, strategy):
+    """Return the source lines that pull the value for ``field_obj`` from ``obj``."""
+    check_key = namespace['check_key_{0}'.format(n)]
+    if strategy is None or not isinstance(check_key, basestring):
+        return ['value = accessor(check_key_{0}, obj, missing)'.format(n)]
+    keys = check_key.split('.')
+    if len(keys) == 1:
+        return _lookup_lines('check_key_{0}'.format(n), strategy)
+    namespace['first_key_{0}'.format(n)] = keys[0]
+    namespace['other_keys_{0}'.format(n)] = keys[1:]
+    lines = _lookup_lines('first_key_{0}'.format(n), strategy)
+    lines.extend([
+        'if value is not missing:',
+        _INDENT + 'value = get_value_for_keys(other_keys_{0}, value, missing)'.format(n),
+    ])
+    return lines
+
+
+def _serialize_lines(field_obj, n, namespace, strategy=None, encode=False):
+    """Return the source lines that compute ``value`` for ``field_obj``, or its
+    JSON text if ``encode`` is `True`.
+    """
+    encode_lines = _encode_lines(field_obj, n) if encode else []
+    if not _can_inline_serialize(field_obj):
+        return ['value = field_{0}.serialize(attr_{0}, obj, accessor=accessor)'.format(n)
+                ] + encode_lines
+    format_lines = _format_lines(field_obj, n, namespace) + encode_lines
+    if not field_obj._CHECK_ATTRIBUTE:
+        # Fields that don't read from the object, e.g. Method and Function
+        return ['value = None'] + format_lines
+    default = field_obj.default
+    namespace['default_{0}'.format(n)] = default
+    lines = _get_value_lines(n, namespace, strategy)
+    lines.extend([
+        'if value is missing:',
+        _INDENT + 'value = default_{0}{1}'.format(n, '()' if callable(default) else ''),
+    ])
+    if encode:
+        # Defaults are not formatted, so the specialized encoders don't apply
+        lines.extend([
+            _INDENT + 'if value is not missing:',
+            _INDENT * 2 + 'value = encode(value)',
+        ])
+    if format_lines:
+        lines.append('else:')
+        lines.extend(_INDENT + line for line in format_lines)
+    return lines
+
+
+def compile_serializer(fields_dict, prefix='', obj_type=None):
+    """Generate a function that serializes a single object according to
+    ``fields_dict``, equivalent to calling
+    :meth:`Marshaller.serialize <marshmallow.marshalling.Marshaller.serialize>`
+    with ``many=False``.
+
+    The returned function has the signature
+    ``serialize(obj, accessor, dict_class, store_error, index)``, where
+    ``store_error`` is
+    :meth:`ErrorStore.store_error <marshmallow.marshalling.ErrorStore.store_error>`
+    of the marshaller that collects the errors.
+
+    The configuration of each field (e.g. ``load_only``, ``dump_to`` and
+    ``default``) is read once, when the function is generated.
+
+    :param dict fields_dict: Mapping of field names to bound :class:`Field` objects.
+    :param str prefix: Optional prefix that will be prepended to all the
+        serialized field names.
+    :param type obj_type: If given, the attribute lookups of the generated
+        function are specialized for objects of this type (see
+        :func:`get_accessor_strategy`) instead of calling ``accessor``. Objects
+        of other types are passed to a generic function. Only pass this if
+        ``accessor`` is :func:`utils.get_value <marshmallow.utils.get_value>`.
+    """
+    return _compile_serializer(fields_dict, prefix, obj_type, encode=False)
+
+
+def compile_json_serializer(fields_dict, prefix='', obj_type=None):
+    """Same as :func:`compile_serializer`, except the generated function returns
+    the JSON text of the serialized object, as encoded by `json.dumps` with its
+    default arguments, without building a dictionary first.
+
+    The JSON-encoded keys are computed when the function is generated. The
+    values of `String`, `Integer`, `Float`, `Number`, `Boolean`, `DateTime` and
+    `UUID` fields are encoded by specialized functions, the values of other
+    fields by `json.dumps`.
+    """
+    return _compile_serializer(fields_dict, prefix, obj_type, encode=True)
+
+
+_INFINITY = float('inf')
+
+
+def _encode_float(value):
+    """Encode a float like `json.dumps`."""
+    if value != value:
+        return 'NaN'
+    if value == _INFINITY:
+        return 'Infinity'
+    if value == -_INFINITY:
+        return '-Infinity'
+    return float.__repr__(value)
+
+
+def _encode_lines(field_obj, n):
+    """Return the source lines that replace ``value`` by its JSON text."""
+    field_class = type(field_obj)
+    if not _can_inline_serialize(field_obj):
+        encoder = 'encode'
+    elif field_class is fields.DateTime and field_obj.dateformat in fields.TIMESTAMP_FORMATS:
+        encoder = 'encode_int'
+    elif field_class in (fields.String, fields.DateTime, fields.UUID):
+        encoder = 'encode_string'
+    elif field_class in (fields.Number, fields.Integer, fields.Float):
+        encoder = 'encode_int' if field_obj.num_type is int else 'encode_float'
+    elif field_class is fields.Boolean:
+        return [
+            'if value is True:',
+            _INDENT + "value = 'true'",
+            'elif value is False:',
+            _INDENT + "value = 'false'",
+            'elif value is not missing:',
+            _INDENT + 'value = encode(value)',
+        ]
+    else:
+        encoder = 'encode'
+    if encoder == 'encode':
+        return ['if value is not missing:', _INDENT + 'value = encode(value)']
+    return [
+        'if value is None:',
+        _INDENT + "value = 'null'",
+        'elif value is not missing:',
+        _INDENT + 'value = {0}(value)'.format(encoder),
+    ]
+
+
+def _compile_serializer(fields_dict, prefix, obj_type, encode):
+    namespace = {
+        'ValidationError': ValidationError,
+        'missing': missing,
+        'text_type': text_type,
+        'ensure_text_type': utils.ensure_text_type,
+        'get_value': utils.get_value,
+        'get_value_for_keys': utils._get_value_for_keys,
+    }
+    if encode:
+        namespace.update({
+            'encode': json.dumps,
+            'encode_string': encode_basestring_ascii,
+            'encode_int': text_type,
+            'encode_float': _encode_float,
+        })
+    body = []
+    strategy = None
+    if obj_type is not None:
+        strategy = get_accessor_strategy(obj_type)
+    if strategy is not None:
+        namespace['obj_type'] = obj_type
+        namespace['serialize_other'] = _compile_serializer(fields_dict, prefix, None, encode)
+        body.extend([
+            'if type(obj) is not obj_type:',
+            _INDENT + 'return serialize_other(obj, accessor, dict_class, store_error, index)',
+        ])
+    body.append('ret = []' if encode else 'ret = dict_class()')
+    if encode:
+        body.append('append = ret.append')
+    key_jsons = []
+    n = 0
+    for attr_name, field_obj in iteritems(fields_dict):
+        if getattr(field_obj, 'load_only', False):
+            continue
+        key = ''.join([prefix or '', field_obj.dump_to or attr_name])
+        namespace['field_{0}'.format(n)] = field_obj
+        namespace['attr_{0}'.format(n)] = attr_name
+        namespace['key_{0}'.format(n)] = key
+        attribute = getattr(field_obj, 'attribute', None)
+        namespace['check_key_{0}'.format(n)] = attr_name if attribute is None else attribute
+        body.append('try:')
+        body.extend(
+            _INDENT + line
+            for line in _serialize_lines(field_obj, n, namespace, strategy, encode))
+        body.extend([
+            'except ValidationError as err:',
+            _INDENT + 'value = store_error(err, key_{0}, field_{0}, index)'.format(n),
+        ])
+        if encode:
+            key_jsons.append(encode_basestring_ascii(key) + ': ')
+            body.extend([
+                _INDENT + 'if value is not missing:',
+                _INDENT * 2 + 'value = encode(value)',
+                'append(value)',
+            ])
+        else:
+            body.extend([
+                'if value is not missing:',
+                _INDENT + 'ret[key_{0}] = value'.format(n),
+            ])
+        n += 1
+    if encode:
+        # All values are usually present, in which case a single template
+        # formats the whole object
+        namespace['key_jsons'] = key_jsons
+        namespace['template'] = '{' + ', '.join(
+            key_json.replace('%', '%%') + '%s' for key_json in key_jsons) + '}'
+        body.extend([
+            'if missing in ret:',
+            _INDENT + "return '{' + ', '.join([key_json + value for key_json, value "
+            "in zip(key_jsons, ret) if value is not missing]) + '}'",
+            'return template % tuple(ret)',
+        ])
+    else:
+        body.append('return ret')
+    source = '\n'.join(
+        ['def serialize(obj, accessor, dict_class, store_error, index):'] +
+        [_INDENT + line for line in body]
+    )
+    return _build_function('serialize', source, namespace)
+
+
+def _can_inline_deserialize(field_obj):
+    """Return `True` if the missing/null checks and validation of
+    `Field.deserialize` may be unrolled for ``field_obj``.
+    """
+    return not any(
+        _overrides(field_obj, fields.Field, name)
+        for name in ('deserialize', '_validate_missing', '_validate')
+    )
+
+
+def _convert_lines(field_obj, n, namespace):
+    """Return the source lines that convert ``raw`` to ``value`` for
+    ``field_obj``, and whether ``value`` may be a `ValidationError` to store
+    instead. The conversion of a few builtin field classes is inlined; all
+    other fields call their bound ``_deserialize_or_error`` method if
+    :func:`can_return_errors` returns `True`, or else their ``_deserialize``
+    method.
+    """
+    field_class = type(field_obj)
+    if field_class in (fields.Field, fields.Raw):
+        return ['value = raw'], False
+    if field_class is fields.String:
+        return [
+            'if type(raw) is text_type:',
+            _INDENT + 'value = raw',
+            'elif isinstance(raw, basestring):',
+            _INDENT + 'value = ensure_text_type(raw)',
+            'else:',
+            _INDENT + "value = field_{0}.make_error('invalid')".format(n),
+        ], True
+    if field_class in (fields.Number, fields.Integer, fields.Float):
+        namespace['num_type_{0}'.format(n)] = field_obj.num_type
+        return [
+            'try:',
+            _INDENT + 'value = num_type_{0}(raw)'.format(n),
+            'except (TypeError, ValueError):',
+            _INDENT + "value = field_{0}.make_error('invalid')".format(n),
+        ], True
+    if can_return_errors(field_obj):
+        namespace['convert_{0}'.format(n)] = field_obj._deserialize_or_error
+        return ['value = convert_{0}(raw, load_attr_{0}, data)'.format(n)], True
+    namespace['convert_{0}'.format(n)] = field_obj._deserialize
+    return [
+        'try:',
+        _INDENT + 'value = convert_{0}(raw, load_attr_{0}, data)'.format(n),
+        'except ValidationError as err:',
+        _INDENT + 'value = err',
+    ], True
+
+
+# Fields whose deserialization only returns None for a null input, so that the
+# values to validate can be told apart from null ones after deserialization
+_BATCH_VALIDATED_FIELDS = (
+    fields.Field, fields.Raw, fields.String, fields.Number, fields.Integer, fields.Float,
+    fields.Decimal, fields.Boolean, fields.DateTime, fields.Date, fields.UUID,
+    fields.Url, fields.Email,
+)
+
+
+def can_validate_many(field_obj):
+    """Return `True` if the validation of ``field_obj`` is deferred by the
+    functions generated by ``compile_deserializer(fields_dict, validate_many=True)``.
+    """
+    return (
+        bool(field_obj.validators) and
+        type(field_obj) in _BATCH_VALIDATED_FIELDS and
+        _can_inline_deserialize(field_obj)
+    )
+
+
+def _deserialize_lines(field_obj, n, namespace, name, validate_many=False):
+    """Return the source lines that compute ``value`` from ``raw`` for
+    ``field_obj``. Errors are stored with ``store_error`` under the key
+    ``name``, an expression, and ``value`` is then the value it returns.
+
+    Errors of the inlined missing and null checks, of validation and of the
+    conversion of builtin fields are created without being raised.
+    """
+    store = 'value = store_error({{0}}, {0}, field_{1}, index)'.format(name, n)
+    if not _can_inline_deserialize(field_obj):
+        namespace['deserialize_{0}'.format(n)] = field_obj.deserialize
+        return [
+            'try:',
+            _INDENT + 'value = deserialize_{0}(raw, load_attr_{0}, data)'.format(n),
+            'except ValidationError as err:',
+            _INDENT + store.format('err'),
+        ]
+    namespace['validators_{0}'.format(n)] = field_obj.validators
+    namespace['validation_error_{0}'.format(n)] = field_obj._validation_error
+    lines = []
+    if field_obj.required:
+        # Only reachable if the value is missing and the field is required
+        lines.extend([
+            'if raw is missing:',
+            _INDENT + store.format("field_{0}.make_error('required')".format(n)),
+            'elif raw is None:',
+        ])
+    else:
+        lines.append('if raw is None:')
+    if field_obj.allow_none is True:
+        lines.append(_INDENT + 'value = None')
+    else:
+        lines.append(_INDENT + store.format("field_{0}.make_error('null')".format(n)))
+    lines.append('else:')
+    convert_lines, may_fail = _convert_lines(field_obj, n, namespace)
+    lines.extend(_INDENT + line for line in convert_lines)
+    validate_lines = []
+    if not (validate_many and can_validate_many(field_obj)):
+        validate_lines = [
+            'if validators_{0}:'.format(n),
+            _INDENT + 'err = validation_error_{0}(value)'.format(n),
+            _INDENT + 'if err is not None:',
+            _INDENT * 2 + store.format('err'),
+        ]
+    if may_fail:
+        lines.extend([
+            _INDENT + 'if isinstance(value, ValidationError):',
+            _INDENT * 2 + store.format('value'),
+        ])
+        if validate_lines:
+            validate_lines[0] = 'el' + validate_lines[0]
+    lines.extend(_INDENT + line for line in validate_lines)
+    return lines
+
+
+def compile_deserializer(fields_dict, validate_many=False):
+    """Generate a function that deserializes a single input dictionary according
+    to ``fields_dict``, equivalent to calling
+    :meth:`Unmarshaller.deserialize <marshmallow.marshalling.Unmarshaller.deserialize>`
+    with ``many=False``.
+
+    The returned function has the signature
+    ``deserialize(data, partial, dict_class, store_error, store_type_error,
+    index, item_index)``, where ``store_error`` and ``store_type_error`` are
+    methods of the unmarshaller that collects the errors, ``index`` is the
+    index used to store field errors and ``item_index`` is the position of
+    ``data`` in the collection being deserialized.
+
+    The configuration of each field (e.g. ``load_from``, ``missing``,
+    ``required`` and ``allow_none``) is read once, when the function is generated.
+
+    :param dict fields_dict: Mapping of field names to bound :class:`Field` objects.
+    :param bool validate_many: If `True`, the validators of the fields for which
+        :func:`can_validate_many` returns `True` are not run, so that the
+        unmarshaller may run them once for a whole collection.
+    """
+    return _compile_load(fields_dict, validate_many=validate_many)
+
+
+def compile_validator(fields_dict):
+    """Generate a function that validates a single input dictionary according
+    to ``fields_dict``, equivalent to calling
+    :meth:`Unmarshaller.validate <marshmallow.marshalling.Unmarshaller.validate>`
+    with ``many=False``. It stores the same errors as the function returned by
+    :func:`compile_deserializer`, but builds no output dictionary.
+
+    The returned function has the signature
+    ``validate(data, partial, store_error, store_type_error, index, item_index)``,
+    with the same meaning as the arguments of the function returned by
+    :func:`compile_deserializer`.
+
+    :param dict fields_dict: Mapping of field names to bound :class:`Field` objects.
+    """
+    return _compile_load(fields_dict, build_output=False)
+
+
+def _compile_load(fields_dict, validate_many=False, build_output=True):
+    """Generate the function returned by :func:`compile_deserializer` if
+    ``build_output`` is `True`, or else by :func:`compile_validator`.
+    """
+    namespace = {
+        'ValidationError': ValidationError,
+        'missing': missing,
+        'text_type': text_type,
+        'basestring': basestring,
+        'ensure_text_type': utils.ensure_text_type,
+    }
+    if build_output:
+        body = ['ret = dict_class()']
+        ret = 'ret'
+    else:
+        body = []
+        ret = 'None'
+    n = 0
+    for attr_name, field_obj in iteritems(fields_dict):
+        if field_obj.dump_only:
+            continue
+        if n == 0:
+            # Input that is not a dict fails on the first field that is loaded
+            namespace['field_0'] = field_obj
+            body.extend([
+                'try:',
+                _INDENT + 'data_get = data.get',
+                'except AttributeError:',
+                _INDENT + 'store_type_error(field_0, data, item_index)',
+                _INDENT + 'return ' + ret,
+            ])
+        namespace['field_{0}'.format(n)] = field_obj
+        namespace['attr_{0}'.format(n)] = attr_name
+        namespace['load_attr_{0}'.format(n)] = field_obj.load_from or attr_name
+        namespace['key_{0}'.format(n)] = field_obj.attribute or attr_name
+        body.append('raw = data_get(attr_{0}, missing)'.format(n))
+        if field_obj.load_from:
+            namespace['load_from_{0}'.format(n)] = field_obj.load_from
+            body.extend([
+                'name = attr_{0}'.format(n),
+                'if raw is missing:',
+                _INDENT + 'name = load_from_{0}'.format(n),
+                _INDENT + 'raw = data_get(load_from_{0}, missing)'.format(n),
+            ])
+            name = 'name'
+        else:
+            name = 'attr_{0}'.format(n)
+        missing_value = field_obj.missing
+        if missing_value is not missing:
+            namespace['missing_{0}'.format(n)] = missing_value
+            body.extend([
+                'if raw is missing and not partial:',
+                _INDENT + 'raw = missing_{0}{1}'.format(
+                    n, '()' if callable(missing_value) else ''),
+            ])
+        if field_obj.required:
+            body.append('if raw is not missing or not partial:')
+        else:
+            body.append('if raw is not missing:')
+        block = _deserialize_lines(field_obj, n, namespace, name, validate_many)
+        if build_output:
+            block.extend([
+                'if value is not missing:',
+                _INDENT + 'ret[key_{0}] = value'.format(n),
+            ])
+        body.extend(_INDENT + line for line in block)
+        n += 1
+    body.append('return ' + ret)
+    if build_output:
+        func_name, params = 'deserialize', 'data, partial, dict_class'
+    else:
+        func_name, params = 'validate', 'data, partial'
+    source = '\n'.join(
+        ['def {0}({1}, store_error, store_type_error, index, item_index):'.format(
+            func_name, params)] +
+        [_INDENT + line for line in body]
+    )
+    return _build_function(func_name, source, namespace)
+
+
+def _build_function(name, source, namespace):
+    try:
+        code = _code_cache[source]
+    except KeyError:
+        code = compile(source, '<marshmallow.compiler.{0}>'.format(name), 'exec')
+        _code_cache[source] = code
+    exec(code, namespace)
+    func = namespace[name]
+    func.__source__ = source
+    return func
@@ -46,12 +46,42 @@ __all__ = [
     'Constant',
 ]
 
+# The default `Validator.validate_many`, which doesn't know the error messages
+# of fields
+_DEFAULT_VALIDATE_MANY = getattr(validate.Validator.validate_many, '__func__',
+                                 validate.Validator.validate_many)
+
 MISSING_ERROR_MESSAGE = (
     'ValidationError raised by `{class_name}`, but error key `{key}` does '
     'not exist in the `error_messages` dictionary.'
 )
 _RECURSIVE_NESTED = 'self'
 
+# Units of the epoch timestamp formats of `DateTime`, `Date` and `Time`
+TIMESTAMP_FORMATS = {
+    'timestamp': 's',
+    'timestamp_ms': 'ms',
+    'timestamp_us': 'us',
+}
+
+
+def _check_format(format):
+    """Return ``format`` if it is a valid format for `Date` and `Time`."""
+    if format not in (None, 'iso', 'iso8601') and format not in TIMESTAMP_FORMATS:
+        formats = ['iso'] + sorted(TIMESTAMP_FORMATS)
+        raise ValueError('The format must be {0} or "{1}".'.format(
+            ', '.join('"{0}"'.format(each) for each in formats[:-1]), formats[-1]))
+    return format
+
+
+def _raise_error(value):
+    """Raise ``value`` if it is a `ValidationError` returned by a
+    ``_deserialize_or_error`` method, otherwise return it.
+    """
+    if isinstance(value, ValidationError):
+        raise value
+    return value
+
 
 class Field(FieldABC):
     """Basic field from which other fields should extend. It applies no
@@ -85,6 +115,12 @@ class Field(FieldABC):
     :param missing: Default deserialization value for the field if the field is not
         found in the input data. May be a value or a callable.
     :param dict error_messages: Overrides for `Field.default_error_messages`.
+    :param cache: Cache the results of converting input strings, so that a
+        repeated input is only parsed once. Either `True`, the maximum number of
+        cached results, or a :class:`LRUCache <marshmallow.utils.LRUCache>`,
+        which may be shared by several fields of the same class and
+        configuration. Only fields whose results are immutable support caching:
+        `DateTime`, `Date`, `Time`, `UUID` and `Decimal`.
     :param metadata: Extra arguments to be stored as metadata.
 
     .. versionchanged:: 2.0.0
@@ -105,12 +141,20 @@ class Field(FieldABC):
     .. versionchanged:: 2.0.0
         ``default`` value is only used if explicitly set. Otherwise, missing values
         inputs are excluded from serialized output.
+
+    .. versionchanged:: 2.3.0
+        Added `cache` parameter.
     """
     # Some fields, such as Method fields and Function fields, are not expected
     #  to exists as attributes on the objects to serialize. Set this to False
     #  for those fields
     _CHECK_ATTRIBUTE = True
     _creation_index = 0  # Used for sorting
+    # Set this to True for fields whose deserialized values are immutable, so
+    #  that they may be cached
+    _CACHEABLE = False
+    # Default number of results cached by fields created with cache=True
+    _CACHE_SIZE = 1024
 
     #: Default error messages for various kinds of errors. The keys in this dictionary
     #: are passed to `Field.fail`. The values are error messages passed to
@@ -124,7 +168,8 @@ class Field(FieldABC):
 
     def __init__(self, default=missing_, attribute=None, load_from=None, dump_to=None,
                  error=None, validate=None, required=False, allow_none=None, load_only=False,
-                 dump_only=False, missing=missing_, error_messages=None, **metadata):
+                 dump_only=False, missing=missing_, error_messages=None, cache=None,
+                 **metadata):
         self.default = default
         self.attribute = attribute
         self.load_from = load_from  # this flag is used by Unmarshaller
@@ -155,6 +200,7 @@ class Field(FieldABC):
         self.load_only = load_only
         self.dump_only = dump_only
         self.missing = missing
+        self.cache = self._make_cache(cache)
         self.metadata = metadata
         self._creation_index = Field._creation_index
         Field._creation_index += 1
@@ -167,6 +213,31 @@ class Field(FieldABC):
         messages.update(error_messages or {})
         self.error_messages = messages
 
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name[0] != '_':
+            # The functions generated for the schema read the configuration of
+            # its fields once, so they are generated again
+            parent = self.__dict__.get('parent')
+            while isinstance(parent, FieldABC):
+                parent = parent.__dict__.get('parent')
+            reset_compiled = getattr(parent, '_reset_compiled', None)
+            if reset_compiled is not None:
+                reset_compiled()
+
+    def _make_cache(self, cache):
+        """Return the `LRUCache` for the ``cache`` argument, or `None`."""
+        if cache is None or cache is False:
+            return None
+        if not self._CACHEABLE:
+            raise ValueError('{0} fields do not support caching.'.format(
+                self.__class__.__name__))
+        if isinstance(cache, utils.LRUCache):
+            return cache
+        if cache is True:
+            return utils.LRUCache(self._CACHE_SIZE)
+        return utils.LRUCache(cache)
+
     def __repr__(self):
         return ('<fields.{ClassName}(default={self.default!r}, '
                 'attribute={self.attribute!r}, '
@@ -189,23 +260,88 @@ class Field(FieldABC):
         """Perform validation on ``value``. Raise a :exc:`ValidationError` if validation
         does not succeed.
         """
+        error = self._validation_error(value)
+        if error is not None:
+            raise error
+
+    def _validation_error(self, value):
+        """Same as :meth:`_validate`, except that the `ValidationError` is
+        returned instead of raised. Return `None` if ``value`` is valid.
+
+        .. versionadded:: 2.3.0
+        """
         errors = []
         for validator in self.validators:
             try:
                 if validator(value) is False:
-                    self.fail('validator_failed')
+                    errors.extend(self.make_error('validator_failed').messages)
             except ValidationError as err:
                 if isinstance(err.messages, dict):
                     errors.append(err.messages)
                 else:
                     errors.extend(err.messages)
         if errors:
-            raise ValidationError(errors)
+            return ValidationError(errors)
+        return None
 
-    # Hat tip to django-rest-framework.
-    def fail(self, key, **kwargs):
-        """A helper method that simply raises a `ValidationError`.
+    def _validate_many(self, values):
+        """Perform validation on each value of the sequence ``values``, as
+        :meth:`_validate` would. Return a dictionary that maps the position of each
+        invalid value to its list of error messages.
+
+        Validators that override the ``validate_many`` method of
+        :class:`Validator <marshmallow.validate.Validator>`, such as the builtin
+        validators, are called once for all values.
+
+        .. versionadded:: 2.3.0
+        """
+        errors = {}
+        false_indices = None
+        for validator in self.validators:
+            validate_many = getattr(validator, 'validate_many', None)
+            if (validate_many is None or
+                    getattr(validate_many, '__func__', None) is _DEFAULT_VALIDATE_MANY):
+                # Call the validator for each value, so that returning False
+                # fails with the message of this field
+                for idx, value in enumerate(values):
+                    try:
+                        if validator(value) is False:
+                            errors.setdefault(idx, []).extend(
+                                self.make_error('validator_failed').messages)
+                    except ValidationError as err:
+                        if isinstance(err.messages, dict):
+                            errors.setdefault(idx, []).append(err.messages)
+                        else:
+                            errors.setdefault(idx, []).extend(err.messages)
+                continue
+            validator_errors = validate_many(values)
+            if false_indices is None:
+                # Validators return valid values, so _validate rejects False
+                items = values.tolist() if hasattr(values, 'tolist') else values
+                false_indices = [idx for idx, value in enumerate(items) if value is False]
+            for idx in false_indices:
+                if idx not in validator_errors:
+                    validator_errors[idx] = self.make_error('validator_failed').messages
+            for idx in sorted(validator_errors):
+                errors.setdefault(idx, []).extend(validator_errors[idx])
+        return errors
+
+    def make_error(self, key, **kwargs):
+        """Return a `ValidationError` with the message of ``self.error_messages``
+        for ``key``, formatted with ``kwargs``, without raising it. If a subclass
+        overrides :meth:`fail`, the error it raises is returned instead.
+
+        .. versionadded:: 2.3.0
         """
+        fail = type(self).fail
+        if getattr(fail, '__func__', fail) is not _DEFAULT_FAIL:
+            try:
+                self.fail(key, **kwargs)
+            except ValidationError as error:
+                return error
+        return self._make_error(key, **kwargs)
+
+    def _make_error(self, key, **kwargs):
         try:
             msg = self.error_messages[key]
         except KeyError:
@@ -214,7 +350,13 @@ class Field(FieldABC):
             raise AssertionError(msg)
         if isinstance(msg, basestring):
             msg = msg.format(**kwargs)
-        raise ValidationError(msg)
+        return ValidationError(msg)
+
+    # Hat tip to django-rest-framework.
+    def fail(self, key, **kwargs):
+        """A helper method that simply raises a `ValidationError`.
+        """
+        raise self._make_error(key, **kwargs)
 
     def _validate_missing(self, value):
         """Validate missing values. Raise a :exc:`ValidationError` if
@@ -265,6 +407,17 @@ class Field(FieldABC):
 
     # Methods for concrete classes to override.
 
+    def _copy(self):
+        """Return a shallow copy of the field that can be bound to a schema
+        instance without modifying ``self``. Called by
+        :meth:`__set_field_attrs <marshmallow.Schema.__set_field_attrs>`.
+
+        .. versionadded:: 2.3.0
+        """
+        ret = object.__new__(self.__class__)
+        ret.__dict__ = self.__dict__.copy()
+        return ret
+
     def _add_to_schema(self, field_name, schema):
         """Update field with values from its parent schema. Called by
             :meth:`__set_field_attrs <marshmallow.Schema.__set_field_attrs>`.
@@ -295,6 +448,61 @@ class Field(FieldABC):
         """
         return value
 
+    def _serialize_many(self, values, attr, objs):
+        """Serialize each of ``values``, pulled from the corresponding object of
+        ``objs``, as :meth:`_serialize` would. Used when a collection is dumped
+        one field at a time (see the ``dump_by_column`` class Meta option).
+
+        Return a tuple of the form (``results``, ``errors``), where ``results``
+        is the list of serialized values and ``errors`` maps the position of each
+        value that could not be serialized to its `ValidationError`. The default
+        implementation calls :meth:`_serialize` for each value; concrete
+        :class:`Field` classes may override it to convert all values at once.
+
+        :param list values: The values to be serialized.
+        :param str attr: The attribute or key on the objects to be serialized.
+        :param list objs: The objects the values were pulled from.
+
+        .. versionadded:: 2.3.0
+        """
+        results = []
+        errors = {}
+        _serialize = self._serialize
+        for idx, value in enumerate(values):
+            try:
+                results.append(_serialize(value, attr, objs[idx]))
+            except ValidationError as err:
+                errors[idx] = err
+                results.append(missing_)
+        return results, errors
+
+    def _deserialize_many(self, values, attr, data):
+        """Deserialize each of ``values`` as :meth:`_deserialize` would. Used by
+        `List` to convert all elements of a list at once.
+
+        Return a tuple of the form (``results``, ``errors``), where ``results``
+        is the list of deserialized values and ``errors`` maps the position of
+        each invalid value to its `ValidationError`. The default implementation
+        calls :meth:`_deserialize` for each value; concrete :class:`Field`
+        classes may override it to convert all values at once.
+
+        :param list values: The values to be deserialized.
+        :param str attr: The attribute or key to get the values from.
+        :param dict data: The raw data to be deserialized.
+
+        .. versionadded:: 2.3.0
+        """
+        results = []
+        errors = {}
+        _deserialize = self._deserialize
+        for idx, value in enumerate(values):
+            try:
+                results.append(_deserialize(value, attr, data))
+            except ValidationError as err:
+                errors[idx] = err
+                results.append(missing_)
+        return results, errors
+
     def _deserialize(self, value, attr, data):
         """Deserialize value. Concrete :class:`Field` classes should implement this method.
 
@@ -309,6 +517,34 @@ class Field(FieldABC):
         """
         return value
 
+    def _convert_cached(self, convert, value, key):
+        """Return ``convert(value)``. If the field has a cache and ``value`` is a
+        string, the result is cached under ``key``. Returned or raised
+        `ValidationError` instances are not cached.
+
+        .. versionadded:: 2.3.0
+        """
+        cache = self.cache
+        if cache is None or type(value) is not text_type:
+            return convert(value)
+        ret = cache.get(key, missing_)
+        if ret is missing_:
+            ret = convert(value)
+            if not isinstance(ret, ValidationError):
+                cache.set(key, ret)
+        return ret
+
+    def _deserialize_or_error(self, value, attr, data):
+        """Same as :meth:`_deserialize`, except that a `ValidationError` may be
+        returned instead of raised (see :meth:`make_error`), which is cheaper
+        when many values are invalid. The unmarshaller stores returned errors
+        as if they had been raised. The default implementation calls
+        :meth:`_deserialize`; the builtin fields return their errors.
+
+        .. versionadded:: 2.3.0
+        """
+        return self._deserialize(value, attr, data)
+
     # Properties
 
     @property
@@ -324,6 +560,9 @@ class Field(FieldABC):
             ret = ret.parent
         return ret
 
+_DEFAULT_FAIL = getattr(Field.fail, '__func__', Field.fail)
+
+
 class Raw(Field):
     """Field that applies no formatting or validation."""
     pass
@@ -424,6 +663,43 @@ class Nested(Field):
                 return ret[self.only]
         return ret
 
+    def _serialize_many(self, values, attr, objs):
+        """Serialize the nested objects of all ``values`` with a single call to
+        the nested schema's ``dump`` method, and split the result back into one
+        value per parent object.
+        """
+        schema = self.schema
+        if not self._can_serialize_many():
+            return super(Nested, self)._serialize_many(values, attr, objs)
+        if self.many:
+            if not all(value is None or utils.is_collection(value) for value in values):
+                return super(Nested, self)._serialize_many(values, attr, objs)
+            values = [None if value is None else list(value) for value in values]
+            nested_objs = [each for value in values if value is not None for each in value]
+        else:
+            nested_objs = [value for value in values if value is not None]
+        if not nested_objs:
+            return [None if value is None else [] for value in values], {}
+        if not self.__updated_fields:
+            schema._update_fields(obj=nested_objs, many=True)
+            self.__updated_fields = True
+        ret = schema.dump(nested_objs, many=True, update_fields=False).data
+        if isinstance(self.only, basestring):  # self.only is a field name
+            ret = utils.pluck(ret, key=self.only)
+        ret = iter(ret)
+        if self.many:
+            return [
+                None if value is None else [next(ret) for _ in value]
+                for value in values
+            ], {}
+        return [None if value is None else next(ret) for value in values], {}
+
+    def _can_serialize_many(self):
+        """Return `True` if :meth:`_serialize_many` may serialize the nested
+        objects of all values at once.
+        """
+        return self.schema._can_dump_at_once()
+
     def _deserialize(self, value, attr, data):
         if self.many and not utils.is_collection(value):
             self.fail('type', input=value, type=value.__class__.__name__)
@@ -518,6 +794,12 @@ class List(Field):
             return self.container.get_value(self.container.attribute, value)
         return value
 
+    def _copy(self):
+        # The container is bound to the list, so each bound list needs its own
+        ret = super(List, self)._copy()
+        ret.container = self.container._copy()
+        return ret
+
     def _add_to_schema(self, field_name, schema):
         super(List, self)._add_to_schema(field_name, schema)
         self.container.parent = self
@@ -526,16 +808,34 @@ class List(Field):
     def _serialize(self, value, attr, obj):
         if value is None:
             return None
-        if utils.is_collection(value):
-            return [self.container._serialize(each, attr, obj) for each in value]
-        return [self.container._serialize(value, attr, obj)]
+        container = self.container
+        if type(value) is not list and not utils.is_collection(value):
+            return [container._serialize(value, attr, obj)]
+        if type(container) in _BATCH_LIST_FIELDS:
+            values = list(value)
+            results, errors = container._serialize_many(values, attr, [obj] * len(values))
+            if errors:
+                raise errors[min(errors)]
+            return results
+        return [container._serialize(each, attr, obj) for each in value]
 
     def _deserialize(self, value, attr, data):
-        if utils.is_collection(value):
-            # Convert all instances in typed list to container type
-            return [self.container.deserialize(each) for each in value]
-        else:
+        if type(value) is not list and not utils.is_collection(value):
             self.fail('invalid')
+        container = self.container
+        if type(container) in _BATCH_LIST_FIELDS:
+            values = list(value)
+            # Null and missing values are checked by `deserialize`
+            if not any(each is None or each is missing_ for each in values):
+                results, errors = container._deserialize_many(values, attr, data)
+                if not errors and (not container.validators or
+                                   not container._validate_many(results)):
+                    return results
+            # Null and invalid values are handled one at a time, so that the
+            # error of the first one is raised as `deserialize` would
+            value = values
+        # Convert all instances in typed list to container type
+        return [container.deserialize(each) for each in value]
 
 class String(Field):
     """A string field.
@@ -555,23 +855,52 @@ class String(Field):
             return None
         return utils.ensure_text_type(value)
 
+    def _serialize_many(self, values, attr, objs):
+        if set(map(type, values)) <= set([text_type]):
+            return list(values), {}
+        return super(String, self)._serialize_many(values, attr, objs)
+
     def _deserialize(self, value, attr, data):
+        return _raise_error(self._deserialize_or_error(value, attr, data))
+
+    def _deserialize_or_error(self, value, attr, data):
         if not isinstance(value, basestring):
-            self.fail('invalid')
+            return self.make_error('invalid')
         return utils.ensure_text_type(value)
 
+    def _deserialize_many(self, values, attr, data):
+        if set(map(type, values)) <= set([text_type]):
+            return list(values), {}
+        return super(String, self)._deserialize_many(values, attr, data)
+
 
 class UUID(String):
     """A UUID field."""
+    _CACHEABLE = True
     default_error_messages = {
         'invalid_guid': 'Not a valid UUID.'
     }
 
     def _deserialize(self, value, attr, data):
+        return _raise_error(self._deserialize_or_error(value, attr, data))
+
+    def _deserialize_or_error(self, value, attr, data):
+        return self._convert_cached(self._parse, value, value)
+
+    def _parse(self, value):
         try:
             return uuid.UUID(value)
-        except (ValueError, AttributeError):
-            self.fail('invalid_guid')
+        except (ValueError, AttributeError, TypeError):
+            return self.make_error('invalid_guid')
+
+    def _deserialize_many(self, values, attr, data):
+        if self.cache is None and set(map(type, values)) <= set([text_type]):
+            try:
+                return list(map(uuid.UUID, values)), {}
+            except ValueError:
+                pass
+        # Cached or invalid values are parsed one at a time
+        return Field._deserialize_many(self, values, attr, data)
 
 
 class Number(Field):
@@ -615,9 +944,32 @@ class Number(Field):
     def _serialize(self, value, attr, obj):
         return self._validated(value)
 
+    def _serialize_many(self, values, attr, objs):
+        try:
+            return list(map(self.num_type, values)), {}
+        except (TypeError, ValueError):
+            # Null values, or an invalid value that needs its error
+            return super(Number, self)._serialize_many(values, attr, objs)
+
     def _deserialize(self, value, attr, data):
         return self._validated(value)
 
+    def _deserialize_or_error(self, value, attr, data):
+        try:
+            return self._format_num(value)
+        except (TypeError, ValueError):
+            return self.make_error('invalid')
+
+    def _deserialize_many(self, values, attr, data):
+        num_type = self.num_type
+        if set(map(type, values)) <= set([num_type]):
+            return list(values), {}
+        try:
+            return list(map(num_type, values)), {}
+        except (TypeError, ValueError):
+            # Null values, or an invalid value that needs its error
+            return super(Number, self)._deserialize_many(values, attr, data)
+
 
 class Integer(Number):
     """An integer field.
@@ -659,6 +1011,7 @@ class Decimal(Number):
     """
 
     num_type = decimal.Decimal
+    _CACHEABLE = True
 
     default_error_messages = {
         'special': 'Special numeric values are not permitted.',
@@ -672,6 +1025,9 @@ class Decimal(Number):
 
     # override Number
     def _format_num(self, value):
+        return self._convert_cached(self._parse, value, value)
+
+    def _parse(self, value):
         if value is None:
             return None
 
@@ -696,6 +1052,23 @@ class Decimal(Number):
         except decimal.InvalidOperation:
             self.fail('invalid')
 
+    # override Number
+    def _serialize_many(self, values, attr, objs):
+        try:
+            nums = list(map(decimal.Decimal, values))
+        except (TypeError, ValueError, decimal.InvalidOperation):
+            nums = None
+        if nums is None or not all(num.is_finite() for num in nums):
+            # Null and special values are handled one at a time
+            return Field._serialize_many(self, values, attr, objs)
+        if self.places is not None:
+            places, rounding = self.places, self.rounding
+            nums = [num.quantize(places, rounding=rounding) for num in nums]
+        return nums, {}
+
+    # Number._deserialize_many doesn't check special values nor quantize
+    _deserialize_many = Field._deserialize_many
+
 
 class Boolean(Field):
     """A boolean field.
@@ -723,6 +1096,9 @@ class Boolean(Field):
         return bool(value)
 
     def _deserialize(self, value, attr, data):
+        return _raise_error(self._deserialize_or_error(value, attr, data))
+
+    def _deserialize_or_error(self, value, attr, data):
         if not self.truthy:
             return bool(value)
         else:
@@ -733,7 +1109,7 @@ class Boolean(Field):
                     return False
             except TypeError:
                 pass
-        self.fail('invalid')
+        return self.make_error('invalid')
 
 class FormattedString(Field):
     """Interpolate other values from the object into this field. The syntax for
@@ -787,9 +1163,17 @@ class DateTime(Field):
     objects that are timezone-aware.
 
     :param str format: Either ``"rfc"`` (for RFC822), ``"iso"`` (for ISO8601),
+        ``"timestamp"``, ``"timestamp_ms"`` or ``"timestamp_us"`` (for the integer
+        number of seconds, milliseconds or microseconds since the Unix epoch),
         or a date format string. If `None`, defaults to "iso".
+    :param bool use_dateutil: If `True`, strings that are not valid RFC822 or
+        ISO8601 are parsed with the fuzzy parser of python-dateutil, if it is
+        installed.
     :param kwargs: The same keyword arguments that :class:`Field` receives.
 
+    .. versionchanged:: 2.3.0
+        RFC822 and ISO8601 strings are parsed by marshmallow; python-dateutil
+        is only used if ``use_dateutil`` is `True`. Added timestamp formats.
     """
 
     DATEFORMAT_SERIALIZATION_FUNCS = {
@@ -808,60 +1192,114 @@ class DateTime(Field):
 
     DEFAULT_FORMAT = 'iso'
 
+    _CACHEABLE = True
     localtime = False
     default_error_messages = {
         'invalid': 'Not a valid datetime.',
         'format': '"{input}" cannot be formatted as a datetime.',
     }
 
-    def __init__(self, format=None, **kwargs):
+    def __init__(self, format=None, use_dateutil=False, **kwargs):
         super(DateTime, self).__init__(**kwargs)
-        # Allow this to be None. It may be set later in the ``_serialize``
-        # or ``_desrialize`` methods This allows a Schema to dynamically set the
-        # dateformat, e.g. from a Meta option
+        # Allow this to be None. It may be set later by the ``_add_to_schema``
+        # method. This allows a Schema to dynamically set the dateformat,
+        # e.g. from a Meta option
         self.dateformat = format
+        self.use_dateutil = use_dateutil
+
+    @property
+    def dateformat(self):
+        return self._dateformat
+
+    @dateformat.setter
+    def dateformat(self, value):
+        self._dateformat = value
+        # The formatter is resolved whenever the format changes, so that
+        # serialization only reads attributes of the field
+        self._formatter = self._get_formatter(value or self.DEFAULT_FORMAT)
+
+    def _get_formatter(self, dateformat):
+        """Return a function that formats a datetime according to
+        ``dateformat``.
+        """
+        if dateformat in TIMESTAMP_FORMATS:
+            unit = TIMESTAMP_FORMATS[dateformat]
+            return lambda value: utils.to_timestamp(value, unit)
+        format_func = self.DATEFORMAT_SERIALIZATION_FUNCS.get(dateformat, None)
+        if format_func is None:
+            return utils.make_strftime(dateformat)
+        if not self.localtime:
+            if format_func is utils.isoformat:
+                return utils.isoformat_utc
+            if format_func is utils.rfcformat:
+                return utils.rfcformat_utc
+        localtime = self.localtime
+        return lambda value: format_func(value, localtime=localtime)
 
     def _add_to_schema(self, field_name, schema):
         super(DateTime, self)._add_to_schema(field_name, schema)
-        self.dateformat = self.dateformat or schema.opts.dateformat
+        if not self.dateformat and schema.opts.dateformat:
+            self.dateformat = schema.opts.dateformat
 
     def _serialize(self, value, attr, obj):
         if value is None:
             return None
-        self.dateformat = self.dateformat or self.DEFAULT_FORMAT
-        format_func = self.DATEFORMAT_SERIALIZATION_FUNCS.get(self.dateformat, None)
-        if format_func:
-            try:
-                return format_func(value, localtime=self.localtime)
-            except (AttributeError, ValueError) as err:
-                self.fail('format', input=value)
-        else:
-            return value.strftime(self.dateformat)
+        try:
+            return self._formatter(value)
+        except (AttributeError, ValueError) as err:
+            self.fail('format', input=value)
+
+    def _serialize_many(self, values, attr, objs):
+        if set(map(type, values)) - set([dt.datetime]):
+            # Null values, or values that may fail to be formatted
+            return super(DateTime, self)._serialize_many(values, attr, objs)
+        return list(map(self._formatter, values)), {}
 
     def _deserialize(self, value, attr, data):
+        return _raise_error(self._deserialize_or_error(value, attr, data))
+
+    def _deserialize_or_error(self, value, attr, data):
+        if self.cache is None:
+            return self._parse(value)
+        # Bound copies of the field share its cache, but may have another format
+        return self._convert_cached(self._parse, value, (self.dateformat, value))
+
+    def _parse(self, value):
+        dateformat = self.dateformat or self.DEFAULT_FORMAT
+        if dateformat in TIMESTAMP_FORMATS:
+            try:
+                return utils.from_timestamp(value, TIMESTAMP_FORMATS[dateformat])
+            except (TypeError, ValueError, OverflowError):
+                return self.make_error('invalid')
         if not value:  # Falsy values, e.g. '', None, [] are not valid
-            raise self.fail('invalid')
-        self.dateformat = self.dateformat or self.DEFAULT_FORMAT
-        func = self.DATEFORMAT_DESERIALIZATION_FUNCS.get(self.dateformat)
+            return self.make_error('invalid')
+        func = self.DATEFORMAT_DESERIALIZATION_FUNCS.get(dateformat)
         if func:
             try:
                 return func(value)
-            except (TypeError, AttributeError, ValueError):
-                raise self.fail('invalid')
-        elif self.dateformat:
+            except ValueError:
+                if self.use_dateutil and utils.dateutil_available:
+                    try:
+                        return utils.from_datestring(value)
+                    except (TypeError, ValueError, OverflowError):
+                        pass
+                return self.make_error('invalid')
+            except (TypeError, AttributeError):
+                return self.make_error('invalid')
+        elif dateformat:
             try:
-                return dt.datetime.strptime(value, self.dateformat)
+                return dt.datetime.strptime(value, dateformat)
             except (TypeError, AttributeError, ValueError):
-                raise self.fail('invalid')
+                return self.make_error('invalid')
         elif utils.dateutil_available:
             try:
                 return utils.from_datestring(value)
             except TypeError:
-                raise self.fail('invalid')
+                return self.make_error('invalid')
         else:
             warnings.warn('It is recommended that you install python-dateutil '
                           'for improved datetime deserialization.')
-            raise self.fail('invalid')
+            return self.make_error('invalid')
 
 
 class LocalDateTime(DateTime):
@@ -877,16 +1315,36 @@ class LocalDateTime(DateTime):
 class Time(Field):
     """ISO8601-formatted time string.
 
+    :param str format: Either ``"iso"`` (for ISO8601), or ``"timestamp"``,
+        ``"timestamp_ms"`` or ``"timestamp_us"`` (for the integer number of
+        seconds, milliseconds or microseconds since midnight). If `None`,
+        defaults to "iso".
+    :param bool use_dateutil: If `True`, strings that are not valid ISO8601 are
+        parsed with the fuzzy parser of python-dateutil, if it is installed.
     :param kwargs: The same keyword arguments that :class:`Field` receives.
+
+    .. versionchanged:: 2.3.0
+        Added ``format`` and ``use_dateutil`` parameters.
     """
+    _CACHEABLE = True
     default_error_messages = {
         'invalid': 'Not a valid time.',
         'format': '"{input}" cannot be formatted as a time.',
     }
 
+    def __init__(self, format=None, use_dateutil=False, **kwargs):
+        super(Time, self).__init__(**kwargs)
+        self.timeformat = _check_format(format)
+        self.use_dateutil = use_dateutil
+
     def _serialize(self, value, attr, obj):
         if value is None:
             return None
+        if self.timeformat in TIMESTAMP_FORMATS:
+            try:
+                return utils.time_to_timestamp(value, TIMESTAMP_FORMATS[self.timeformat])
+            except AttributeError:
+                self.fail('format', input=value)
         try:
             ret = value.isoformat()
         except AttributeError:
@@ -897,27 +1355,57 @@ class Time(Field):
 
     def _deserialize(self, value, attr, data):
         """Deserialize an ISO8601-formatted time to a :class:`datetime.time` object."""
+        return self._convert_cached(self._parse, value, value)
+
+    def _parse(self, value):
+        if self.timeformat in TIMESTAMP_FORMATS:
+            try:
+                return utils.time_from_timestamp(value, TIMESTAMP_FORMATS[self.timeformat])
+            except (TypeError, ValueError, OverflowError):
+                self.fail('invalid')
         if not value:   # falsy values are invalid
             self.fail('invalid')
             raise err
         try:
-            return utils.from_iso_time(value)
-        except (AttributeError, TypeError, ValueError):
+            return utils.from_iso_time(value, use_dateutil=self.use_dateutil)
+        except (AttributeError, TypeError, ValueError, OverflowError):
             self.fail('invalid')
 
 class Date(Field):
     """ISO8601-formatted date string.
 
+    :param str format: Either ``"iso"`` (for ISO8601), or ``"timestamp"``,
+        ``"timestamp_ms"`` or ``"timestamp_us"`` (for the integer number of
+        seconds, milliseconds or microseconds since the Unix epoch of midnight
+        UTC of the date). If `None`, defaults to "iso".
+    :param bool use_dateutil: If `True`, strings that are not valid ISO8601 are
+        parsed with the fuzzy parser of python-dateutil, if it is installed.
     :param kwargs: The same keyword arguments that :class:`Field` receives.
+
+    .. versionchanged:: 2.3.0
+        Added ``format`` and ``use_dateutil`` parameters.
     """
+    _CACHEABLE = True
     default_error_messages = {
         'invalid': 'Not a valid date.',
         'format': '"{input}" cannot be formatted as a date.',
     }
 
+    def __init__(self, format=None, use_dateutil=False, **kwargs):
+        super(Date, self).__init__(**kwargs)
+        self.dateformat = _check_format(format)
+        self.use_dateutil = use_dateutil
+
     def _serialize(self, value, attr, obj):
         if value is None:
             return None
+        if self.dateformat in TIMESTAMP_FORMATS:
+            if isinstance(value, dt.datetime):
+                value = value.date()
+            try:
+                return utils.to_timestamp(value, TIMESTAMP_FORMATS[self.dateformat])
+            except TypeError:
+                self.fail('format', input=value)
         try:
             return value.isoformat()
         except AttributeError:
@@ -928,12 +1416,23 @@ class Date(Field):
         """Deserialize an ISO8601-formatted date string to a
         :class:`datetime.date` object.
         """
+        return _raise_error(self._deserialize_or_error(value, attr, data))
+
+    def _deserialize_or_error(self, value, attr, data):
+        return self._convert_cached(self._parse, value, value)
+
+    def _parse(self, value):
+        if self.dateformat in TIMESTAMP_FORMATS:
+            try:
+                return utils.from_timestamp(value, TIMESTAMP_FORMATS[self.dateformat]).date()
+            except (TypeError, ValueError, OverflowError):
+                return self.make_error('invalid')
         if not value:  # falsy values are invalid
-            self.fail('invalid')
+            return self.make_error('invalid')
         try:
-            return utils.from_iso_date(value)
-        except (AttributeError, TypeError, ValueError):
-            self.fail('invalid')
+            return utils.from_iso_date(value, use_dateutil=self.use_dateutil)
+        except (AttributeError, TypeError, ValueError, OverflowError):
+            return self.make_error('invalid')
 
 
 class TimeDelta(Field):
@@ -1207,6 +1706,10 @@ class Constant(Field):
         return self.constant
 
 
+# Exact field classes whose `List` containers are (de)serialized by their
+# ``_serialize_many`` and ``_deserialize_many`` methods
+_BATCH_LIST_FIELDS = (String, UUID, Number, Integer, Float)
+
 # Aliases
 URL = Url
 Str = String
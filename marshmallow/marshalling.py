@@ -10,8 +10,15 @@ and from primitive types.
 
 from __future__ import unicode_literals
 
+from operator import attrgetter, itemgetter
+
 from marshmallow.utils import missing
+from marshmallow import fields
 from marshmallow.compat import text_type, iteritems
+from marshmallow.compiler import (
+    MAPPING, get_accessor_strategy, can_validate_many, can_serialize_many,
+    can_return_errors, _can_inline_serialize, _can_inline_deserialize
+)
 from marshmallow.exceptions import (
     ValidationError,
 )
@@ -24,6 +31,73 @@ __all__ = [
 # Key used for field-level validation errors on nested fields
 FIELD = '_field'
 
+
+def get_column(objs, attr_name, field_obj, accessor, strategy=None):
+    """Return the list of the values of ``field_obj`` pulled from each of
+    ``objs``, with `missing` for missing values.
+
+    :param list objs: The objects to pull the values from.
+    :param str attr_name: The name of the field.
+    :param Field field_obj: The field.
+    :param callable accessor: Function to use for getting values from the objects.
+    :param strategy: If all objects are of a type for which
+        :func:`get_accessor_strategy <marshmallow.compiler.get_accessor_strategy>`
+        returns ``strategy``, the values are pulled with `operator.itemgetter` or
+        `operator.attrgetter` if possible. Only pass this if ``accessor`` is
+        :func:`utils.get_value <marshmallow.utils.get_value>`.
+    """
+    return _get_column(objs, attr_name, field_obj, accessor, strategy)[0]
+
+
+def _get_column(objs, attr_name, field_obj, accessor, strategy):
+    """Same as `get_column`, but return a tuple of the form (``values``,
+    ``complete``), where ``complete`` is `True` if no value is missing.
+    """
+    check_key = attr_name if field_obj.attribute is None else field_obj.attribute
+    if strategy is not None and '.' not in check_key:
+        getter = itemgetter(check_key) if strategy == MAPPING else attrgetter(check_key)
+        try:
+            values = list(map(getter, objs))
+        except (KeyError, AttributeError, IndexError, TypeError):
+            # Some values are missing
+            pass
+        else:
+            # Callable attributes are called by get_value
+            if not any(map(callable, values)):
+                return values, True
+    return [field_obj.get_value(attr_name, obj, accessor=accessor) for obj in objs], False
+
+
+def _deserialize_or_error(field_obj, value, attr, data):
+    """Same as ``field_obj.deserialize(value, attr, data)``, except that a
+    `ValidationError` is returned instead of raised when ``value`` is invalid.
+    Only call this if :func:`_can_inline_deserialize
+    <marshmallow.compiler._can_inline_deserialize>` returns `True` for
+    ``field_obj``.
+    """
+    if value is missing:
+        if field_obj.required:
+            return field_obj.make_error('required')
+    elif value is None:
+        if field_obj.allow_none is True:
+            return None
+        return field_obj.make_error('null')
+    if can_return_errors(field_obj):
+        output = field_obj._deserialize_or_error(value, attr, data)
+        if isinstance(output, ValidationError):
+            return output
+    else:
+        try:
+            output = field_obj._deserialize(value, attr, data)
+        except ValidationError as err:
+            return err
+    if field_obj.validators:
+        error = field_obj._validation_error(output)
+        if error is not None:
+            return error
+    return output
+
+
 class ErrorStore(object):
 
     def __init__(self):
@@ -35,6 +109,8 @@ class ErrorStore(object):
         self.error_field_names = []
         #: True while (de)serializing a collection
         self._pending = False
+        #: If True, `store_error` raises `FailFast` once the error is stored
+        self.fail_fast = False
 
     def reset_errors(self):
         self.errors = {}
@@ -64,21 +140,35 @@ class ErrorStore(object):
         try:
             value = getter_func(data)
         except ValidationError as err:  # Store validation errors
-            self.error_fields.append(field_obj)
-            self.error_field_names.append(field_name)
-            errors = self.get_errors(index=index)
-            # Warning: Mutation!
-            if isinstance(err.messages, dict):
-                errors[field_name] = err.messages
-            elif isinstance(errors.get(field_name), dict):
-                errors[field_name].setdefault(FIELD, []).extend(err.messages)
-            else:
-                errors.setdefault(field_name, []).extend(err.messages)
-            # When a Nested field fails validation, the marshalled data is stored
-            # on the ValidationError's data attribute
-            value = err.data or missing
+            value = self.store_error(err, field_name, field_obj, index=index)
         return value
 
+    def store_error(self, err, field_name, field_obj, index=None):
+        """Store the messages of a `ValidationError` raised or returned by a field
+        and return the value to use in place of the field's output.
+
+        :param ValidationError err: The error raised or returned by the field.
+        :param str field_name: Field name.
+        :param FieldABC field_obj: Field object that raised the error.
+        :param int index: Index of the item being validated, if validating a collection,
+            otherwise `None`.
+        """
+        self.error_fields.append(field_obj)
+        self.error_field_names.append(field_name)
+        errors = self.get_errors(index=index)
+        # Warning: Mutation!
+        if isinstance(err.messages, dict):
+            errors[field_name] = err.messages
+        elif isinstance(errors.get(field_name), dict):
+            errors[field_name].setdefault(FIELD, []).extend(err.messages)
+        else:
+            errors.setdefault(field_name, []).extend(err.messages)
+        if self.fail_fast:
+            raise FailFast()
+        # When a Nested field fails validation, the marshalled data is stored
+        # on the ValidationError's data attribute
+        return err.data or missing
+
 class Marshaller(ErrorStore):
     """Callable class responsible for serializing data and storing errors.
 
@@ -90,7 +180,8 @@ class Marshaller(ErrorStore):
         ErrorStore.__init__(self)
 
     def serialize(self, obj, fields_dict, many=False,
-                  accessor=None, dict_class=dict, index_errors=True, index=None):
+                  accessor=None, dict_class=dict, index_errors=True, index=None,
+                  serializer=None, by_column=False, obj_type=None):
         """Takes raw data (a dict, list, or other object) and a dict of
         fields to output and serializes the data based on those fields.
 
@@ -104,20 +195,41 @@ class Marshaller(ErrorStore):
             ``self.errors`` when ``many=True``.
         :param int index: Index of the item being serialized (for storing errors) if
             serializing a collection, otherwise `None`.
+        :param callable serializer: Function generated by
+            :func:`marshmallow.compiler.compile_serializer` for ``fields_dict``. If
+            given, it is used in place of the generic loop over ``fields_dict``.
+        :param bool by_column: If `True` and ``many`` is `True`, serialize the
+            collection one field at a time (see :meth:`_serialize_columns`).
+        :param type obj_type: Type of the objects of the collection, if
+            ``by_column`` is `True` and ``accessor`` is
+            :func:`utils.get_value <marshmallow.utils.get_value>`.
         :return: A dictionary of the marshalled data
 
         .. versionchanged:: 1.0.0
             Renamed from ``marshal``.
+
+        .. versionchanged:: 2.3.0
+            Added ``serializer``, ``by_column`` and ``obj_type`` parameters.
         """
         # Reset errors dict if not serializing a collection
         if not self._pending:
             self.reset_errors()
         if many and obj is not None:
             self._pending = True
-            ret = [self.serialize(d, fields_dict, many=False,
-                                    dict_class=dict_class, accessor=accessor,
-                                    index=idx, index_errors=index_errors)
-                    for idx, d in enumerate(obj)]
+            if by_column:
+                ret = self._serialize_columns(obj, fields_dict, accessor=accessor,
+                                              dict_class=dict_class,
+                                              index_errors=index_errors, obj_type=obj_type)
+            elif serializer is not None:
+                store_error = self.store_error
+                ret = [serializer(d, accessor, dict_class, store_error,
+                                  idx if index_errors else None)
+                       for idx, d in enumerate(obj)]
+            else:
+                ret = [self.serialize(d, fields_dict, many=False,
+                                        dict_class=dict_class, accessor=accessor,
+                                        index=idx, index_errors=index_errors)
+                        for idx, d in enumerate(obj)]
             self._pending = False
             if self.errors:
                 raise ValidationError(
@@ -127,6 +239,23 @@ class Marshaller(ErrorStore):
                     data=ret,
                 )
             return ret
+        if serializer is not None:
+            ret = serializer(obj, accessor, dict_class, self.store_error,
+                             index if index_errors else None)
+        else:
+            ret = self._serialize_fields(obj, fields_dict, accessor=accessor,
+                                         dict_class=dict_class,
+                                         index=(index if index_errors else None))
+        if self.errors and not self._pending:
+            raise ValidationError(
+                self.errors,
+                field_names=self.error_field_names,
+                fields=self.error_fields,
+                data=ret
+            )
+        return ret
+
+    def _serialize_fields(self, obj, fields_dict, accessor, dict_class, index):
         items = []
         for attr_name, field_obj in iteritems(fields_dict):
             if getattr(field_obj, 'load_only', False):
@@ -140,35 +269,128 @@ class Marshaller(ErrorStore):
                 data=obj,
                 field_name=key,
                 field_obj=field_obj,
-                index=(index if index_errors else None)
+                index=index
             )
             if value is missing:
                 continue
             items.append((key, value))
-        ret = dict_class(items)
-        if self.errors and not self._pending:
-            raise ValidationError(
-                self.errors,
-                field_names=self.error_field_names,
-                fields=self.error_fields,
-                data=ret
-            )
+        return dict_class(items)
+
+    def _serialize_columns(self, objs, fields_dict, accessor, dict_class, index_errors,
+                           obj_type=None):
+        """Serialize the collection ``objs`` one field at a time and assemble the
+        serialized dictionaries at the end.
+
+        The values of each field are pulled from all objects and passed to the
+        field's ``_serialize_many`` method at once (see
+        :meth:`Field._serialize_many <marshmallow.fields.Field._serialize_many>`).
+        Fields whose value lookup or ``serialize`` method is overridden are
+        serialized one object at a time.
+        """
+        if not isinstance(objs, (list, tuple)):
+            objs = list(objs)
+        strategy = None
+        if obj_type is not None and set(map(type, objs)) == set([obj_type]):
+            strategy = get_accessor_strategy(obj_type)
+        keys = []
+        columns = []
+        for attr_name, field_obj in iteritems(fields_dict):
+            if getattr(field_obj, 'load_only', False):
+                continue
+            key = ''.join([self.prefix or '', field_obj.dump_to or attr_name])
+            keys.append(key)
+            columns.append(self._serialize_column(objs, attr_name, field_obj, key,
+                                                  accessor, strategy, index_errors))
+        if not columns:
+            return [dict_class() for _ in objs]
+        ret = [dict_class(zip(keys, row)) for row in zip(*[col for col, _ in columns])]
+        for key, (column, complete) in zip(keys, columns):
+            if not complete:
+                for idx in [idx for idx, value in enumerate(column) if value is missing]:
+                    del ret[idx][key]
         return ret
 
+    def _serialize_column(self, objs, attr_name, field_obj, key, accessor, strategy,
+                          index_errors):
+        """Return a tuple of the form (``column``, ``complete``), where ``column``
+        is the list of the serialized values of ``field_obj`` for ``objs``, with
+        `missing` for the values to leave out, and ``complete`` is `True` if no
+        value is left out.
+        """
+        if not (field_obj._CHECK_ATTRIBUTE and _can_inline_serialize(field_obj)):
+            return [
+                self.call_and_store(
+                    getter_func=lambda obj: field_obj.serialize(attr_name, obj,
+                                                                accessor=accessor),
+                    data=obj,
+                    field_name=key,
+                    field_obj=field_obj,
+                    index=idx if index_errors else None,
+                )
+                for idx, obj in enumerate(objs)
+            ], False
+        values, complete = _get_column(objs, attr_name, field_obj, accessor, strategy)
+        # Missing values take the default, which is not formatted
+        missing_positions = []
+        if not complete:
+            missing_positions = [idx for idx, value in enumerate(values) if value is missing]
+        if missing_positions:
+            present = [idx for idx, value in enumerate(values) if value is not missing]
+            values = [values[idx] for idx in present]
+            present_objs = [objs[idx] for idx in present]
+        else:
+            present = None
+            present_objs = objs
+        if can_serialize_many(field_obj):
+            results, errors = field_obj._serialize_many(values, attr_name, present_objs)
+        else:
+            results, errors = fields.Field._serialize_many(field_obj, values, attr_name,
+                                                           present_objs)
+        for position in sorted(errors):
+            idx = position if present is None else present[position]
+            results[position] = self.store_error(errors[position], key, field_obj,
+                                                 index=idx if index_errors else None)
+        if present is None:
+            return results, not errors
+        column = [missing] * len(objs)
+        for position, idx in enumerate(present):
+            column[idx] = results[position]
+        default = field_obj.default
+        for idx in missing_positions:
+            column[idx] = default() if callable(default) else default
+        return column, False
+
     # Make an instance callable
     __call__ = serialize
 
 # Key used for schema-level validation errors
 SCHEMA = '_schema'
 
+
+class FailFast(Exception):
+    """Raised by an `Unmarshaller` with ``fail_fast=True`` once it has stored
+    an error, to stop deserializing.
+    """
+    pass
+
+
 class Unmarshaller(ErrorStore):
     """Callable class responsible for deserializing data and storing errors.
 
+    :param bool fail_fast: If `True`, stop deserializing at the first error.
+
     .. versionadded:: 1.0.0
+
+    .. versionchanged:: 2.3.0
+        Added ``fail_fast`` parameter.
     """
 
     default_schema_validation_error = 'Invalid data.'
 
+    def __init__(self, fail_fast=False):
+        ErrorStore.__init__(self)
+        self.fail_fast = fail_fast
+
     def run_validator(self, validator_func, output,
             original_data, fields_dict, index=None,
             many=False, pass_original=False):
@@ -212,7 +434,8 @@ class Unmarshaller(ErrorStore):
             )
 
     def deserialize(self, data, fields_dict, many=False, partial=False,
-            dict_class=dict, index_errors=True, index=None):
+            dict_class=dict, index_errors=True, index=None, deserializer=None,
+            validate_many=False):
         """Deserialize ``data`` based on the schema defined by ``fields_dict``.
 
         :param dict data: The data to deserialize.
@@ -225,57 +448,170 @@ class Unmarshaller(ErrorStore):
             ``self.errors`` when ``many=True``.
         :param int index: Index of the item being serialized (for storing errors) if
             serializing a collection, otherwise `None`.
-        :return: A dictionary of the deserialized data.
+        :param callable deserializer: Function generated by
+            :func:`marshmallow.compiler.compile_deserializer` for ``fields_dict``. If
+            given, it is used in place of the generic loop over ``fields_dict``.
+        :param bool validate_many: Set to `True` if ``deserializer`` was generated
+            with ``validate_many=True``. The validators it skips are then run once
+            per field for all items of the collection (see :meth:`_validate_many`).
+        :return: A dictionary of the deserialized data. If ``self.fail_fast`` is
+            `True` and an error occurs, the data is incomplete: a collection
+            ends with the first invalid item.
+
+        .. versionchanged:: 2.3.0
+            Added ``deserializer`` and ``validate_many`` parameters.
+        """
+        ret = self.collect(data, fields_dict, many=many, partial=partial,
+                           dict_class=dict_class, index_errors=index_errors, index=index,
+                           deserializer=deserializer, validate_many=validate_many)
+        if self.errors and not self._pending:
+            raise ValidationError(
+                self.errors,
+                field_names=self.error_field_names,
+                fields=self.error_fields,
+                data=ret,
+            )
+        return ret
+
+    def collect(self, data, fields_dict, many=False, partial=False, dict_class=dict,
+                index_errors=True, index=None, deserializer=None, validate_many=False):
+        """Same as :meth:`deserialize`, except that errors are only stored in
+        ``self.errors``: no `ValidationError` is raised when ``data`` is invalid.
+
+        .. versionadded:: 2.3.0
         """
         # Reset errors if not deserializing a collection
         if not self._pending:
             self.reset_errors()
         if many and data is not None:
             self._pending = True
-            ret = [self.deserialize(d, fields_dict, many=False,
-                        partial=partial, dict_class=dict_class,
-                        index=idx, index_errors=index_errors)
-                    for idx, d in enumerate(data)]
+            if self.fail_fast:
+                # Deserialize and validate each item before the next one
+                ret = []
+                for idx, d in enumerate(data):
+                    ret.append(self.collect(d, fields_dict, many=False,
+                                                partial=partial, dict_class=dict_class,
+                                                index_errors=index_errors, index=idx,
+                                                deserializer=deserializer,
+                                                validate_many=validate_many))
+                    if self.errors:
+                        break
+            elif deserializer is not None:
+                store_error = self.store_error
+                store_type_error = self._store_type_error
+                ret = [deserializer(d, partial, dict_class, store_error, store_type_error,
+                                    idx if index_errors else None, idx)
+                       if d is not None else None
+                       for idx, d in enumerate(data)]
+                if validate_many:
+                    self._validate_many(data, ret, fields_dict, many=True,
+                                        index_errors=index_errors)
+            else:
+                ret = [self.collect(d, fields_dict, many=False,
+                            partial=partial, dict_class=dict_class,
+                            index=idx, index_errors=index_errors)
+                        for idx, d in enumerate(data)]
 
             self._pending = False
-            if self.errors:
-                raise ValidationError(
-                    self.errors,
-                    field_names=self.error_field_names,
-                    fields=self.error_fields,
-                    data=ret,
-                )
             return ret
-        if data is not None:
-            items = []
-            for attr_name, field_obj in iteritems(fields_dict):
-                if field_obj.dump_only:
+        ret = None
+        try:
+            if data is None:
+                pass
+            elif deserializer is not None:
+                ret = deserializer(data, partial, dict_class, self.store_error,
+                                   self._store_type_error,
+                                   index if index_errors else None, index)
+                if validate_many:
+                    self._validate_many(data, ret, fields_dict, many=False,
+                                        index_errors=index_errors, index=index)
+            else:
+                ret = self._deserialize_fields(data, fields_dict, partial=partial,
+                                               dict_class=dict_class,
+                                               index_errors=index_errors, index=index)
+        except FailFast:
+            if ret is None:
+                ret = dict_class()
+        return ret
+
+    def validate(self, data, fields_dict, many=False, partial=False, index_errors=True,
+                 validator=None):
+        """Validate ``data`` based on the schema defined by ``fields_dict``, without
+        building the deserialized data. Missing, null and invalid values and the
+        validators of the fields are checked as by :meth:`deserialize`, and the
+        same errors are stored in ``self.errors``. No `ValidationError` is raised.
+
+        :param dict data: The data to validate.
+        :param dict fields_dict: Mapping of field names to :class:`Field` objects.
+        :param bool many: Set to `True` if ``data`` is a collection.
+        :param bool partial: If `True`, ignore missing fields.
+        :param bool index_errors: Whether to store the index of invalid items in
+            ``self.errors`` when ``many=True``.
+        :param callable validator: Function generated by
+            :func:`marshmallow.compiler.compile_validator` for ``fields_dict``. If
+            given, it is used in place of the generic loop over ``fields_dict``.
+        :return: ``self.errors``
+
+        .. versionadded:: 2.3.0
+        """
+        self.reset_errors()
+        if data is None:
+            return self.errors
+        items = enumerate(data) if many else [(None, data)]
+        try:
+            for idx, d in items:
+                if many and d is None:
                     continue
-                try:
-                    raw_value = data.get(attr_name, missing)
-                except AttributeError:  # Input data is not a dict
-                    errors = self.get_errors(index=index)
-                    msg = field_obj.error_messages['type'].format(
-                        input=data, input_type=data.__class__.__name__
-                    )
-                    self.error_field_names = [SCHEMA]
-                    self.error_fields = []
-                    errors = self.get_errors()
-                    errors.setdefault(SCHEMA, []).append(msg)
-                    # Input data type is incorrect, so we can bail out early
+                if validator is not None:
+                    validator(d, partial, self.store_error, self._store_type_error,
+                              idx if index_errors else None, idx)
+                else:
+                    for _ in self._iter_fields(d, fields_dict, partial=partial,
+                                               index_errors=index_errors, index=idx):
+                        pass
+                if self.fail_fast and self.errors:
                     break
-                field_name = attr_name
-                if raw_value is missing and field_obj.load_from:
-                    field_name = field_obj.load_from
-                    raw_value = data.get(field_obj.load_from, missing)
-                if raw_value is missing:
-                    if partial:
-                        continue
-                    _miss = field_obj.missing
-                    raw_value = _miss() if callable(_miss) else _miss
-                if raw_value is missing and not field_obj.required:
+        except FailFast:
+            pass
+        return self.errors
+
+    def _deserialize_fields(self, data, fields_dict, partial, dict_class,
+                            index_errors, index):
+        return dict_class(self._iter_fields(data, fields_dict, partial=partial,
+                                            index_errors=index_errors, index=index))
+
+    def _iter_fields(self, data, fields_dict, partial, index_errors, index):
+        """Deserialize each field of ``fields_dict`` from ``data`` and yield a
+        ``(key, value)`` pair for each value that is not missing, storing errors.
+        """
+        for attr_name, field_obj in iteritems(fields_dict):
+            if field_obj.dump_only:
+                continue
+            try:
+                raw_value = data.get(attr_name, missing)
+            except AttributeError:  # Input data is not a dict
+                self._store_type_error(field_obj, data, index)
+                # Input data type is incorrect, so we can bail out early
+                break
+            field_name = attr_name
+            if raw_value is missing and field_obj.load_from:
+                field_name = field_obj.load_from
+                raw_value = data.get(field_obj.load_from, missing)
+            if raw_value is missing:
+                if partial:
                     continue
+                _miss = field_obj.missing
+                raw_value = _miss() if callable(_miss) else _miss
+            if raw_value is missing and not field_obj.required:
+                continue
 
+            if _can_inline_deserialize(field_obj):
+                value = _deserialize_or_error(field_obj, raw_value,
+                                              field_obj.load_from or attr_name, data)
+                if isinstance(value, ValidationError):
+                    value = self.store_error(value, field_name, field_obj,
+                                             index=(index if index_errors else None))
+            else:
                 getter = lambda val: field_obj.deserialize(
                     val,
                     field_obj.load_from or attr_name,
@@ -288,21 +624,70 @@ class Unmarshaller(ErrorStore):
                     field_obj=field_obj,
                     index=(index if index_errors else None)
                 )
-                if value is not missing:
-                    key = fields_dict[attr_name].attribute or attr_name
-                    items.append((key, value))
-            ret = dict_class(items)
+            if value is not missing:
+                yield field_obj.attribute or attr_name, value
+
+    def _validate_many(self, data, result, fields_dict, many, index_errors, index=None):
+        """Run the validators that were skipped by a deserializer generated with
+        ``validate_many=True``. The deserialized values of each such field are
+        passed to :meth:`Field._validate_many <marshmallow.fields.Field._validate_many>`
+        at once. Invalid values are removed from ``result`` and their errors are
+        stored.
+
+        :param data: The data that was deserialized.
+        :param result: The deserialized data.
+        :param dict fields_dict: Mapping of field names to :class:`Field` objects.
+        :param bool many: Whether ``data`` is a collection.
+        :param bool index_errors: Whether to store the index of invalid items.
+        :param int index: Index of the item if ``many`` is `False`.
+
+        If ``index_errors`` is `False`, the messages of the deferred validators are
+        stored after the other messages of the same field.
+        """
+        if many:
+            items = [(idx, d, r) for idx, (d, r) in enumerate(zip(data, result))
+                     if r is not None]
         else:
-            ret = None
+            items = [(index, data, result)]
+        results = [item[2] for item in items]
+        for attr_name, field_obj in iteritems(fields_dict):
+            if field_obj.dump_only or not can_validate_many(field_obj):
+                continue
+            key = field_obj.attribute or attr_name
+            values = [r.get(key, missing) for r in results]
+            # Missing and null values are not validated
+            skip_none = field_obj.allow_none is True
+            positions = None
+            if any([value is missing or (skip_none and value is None) for value in values]):
+                positions = [
+                    position for position, value in enumerate(values)
+                    if value is not missing and not (skip_none and value is None)
+                ]
+                values = [values[position] for position in positions]
+            if not values:
+                continue
+            errors = field_obj._validate_many(values)
+            for position in sorted(errors):
+                idx, d, r = items[position if positions is None else positions[position]]
+                field_name = attr_name
+                if field_obj.load_from and d.get(attr_name, missing) is missing:
+                    field_name = field_obj.load_from
+                del r[key]
+                self.store_error(ValidationError(errors[position]), field_name, field_obj,
+                                 index=idx if index_errors else None)
 
-        if self.errors and not self._pending:
-            raise ValidationError(
-                self.errors,
-                field_names=self.error_field_names,
-                fields=self.error_fields,
-                data=ret,
-            )
-        return ret
+    def _store_type_error(self, field_obj, data, index=None):
+        """Store the error for input ``data`` that is not a mapping."""
+        errors = self.get_errors(index=index)
+        msg = field_obj.error_messages['type'].format(
+            input=data, input_type=data.__class__.__name__
+        )
+        self.error_field_names = [SCHEMA]
+        self.error_fields = []
+        errors = self.get_errors()
+        errors.setdefault(SCHEMA, []).append(msg)
+        if self.fail_fast:
+            raise FailFast()
 
     # Make an instance callable
     __call__ = deserialize
@@ -8,15 +8,17 @@ import datetime as dt
 import decimal
 import inspect
 import json
+import threading
 import types
 import uuid
 import warnings
 from collections import namedtuple
 import functools
 
-from marshmallow import base, fields, utils, class_registry, marshalling
+from marshmallow import (base, fields, utils, class_registry, marshalling, compiler,
+                         columnar)
 from marshmallow.compat import (with_metaclass, iteritems, text_type,
-                                binary_type, OrderedDict)
+                                binary_type, basestring, OrderedDict)
 from marshmallow.exceptions import ValidationError
 from marshmallow.orderedset import OrderedSet
 from marshmallow.decorators import (PRE_DUMP, POST_DUMP, PRE_LOAD, POST_LOAD,
@@ -204,6 +206,8 @@ class SchemaOpts(object):
         self.include = getattr(meta, 'include', {})
         self.load_only = getattr(meta, 'load_only', ())
         self.dump_only = getattr(meta, 'dump_only', ())
+        self.dump_by_column = getattr(meta, 'dump_by_column', False)
+        self.fail_fast = getattr(meta, 'fail_fast', False)
 
 
 class BaseSchema(base.SchemaABC):
@@ -284,6 +288,13 @@ class BaseSchema(base.SchemaABC):
     #: DEPRECATED: Function used to get values of an object.
     __accessor__ = None
 
+    # Serializes the binding of implicit fields with the choice of the generated
+    # function to dump them with
+    _implicit_fields_lock = threading.RLock()
+    # Number of object types for which generated functions are kept, so that
+    # dumping objects of many types doesn't grow the schema without bound
+    _MAX_TYPED_SERIALIZERS = 8
+
     class Meta(object):
         """Options object for a Schema.
 
@@ -317,14 +328,21 @@ class BaseSchema(base.SchemaABC):
             of invalid items in a collection.
         - ``load_only``: Tuple or list of fields to exclude from serialized results.
         - ``dump_only``: Tuple or list of fields to exclude from deserialization
+        - ``dump_by_column``: If `True`, `Schema.dump` serializes collections one
+            field at a time instead of one object at a time, so that fields that
+            implement ``_serialize_many`` convert all values at once. Schemas
+            with `fields.Nested` fields always dump collections this way, unless
+            the nested schema's results depend on being dumped one object at a time.
+        - ``fail_fast``: If `True`, `Schema.load` and `Schema.validate` stop at
+            the first validation error.
         """
         pass
 
     def __init__(self, extra=None, only=(), exclude=(), prefix='', strict=False,
                  many=False, context=None, load_only=(), dump_only=(),
                  partial=False):
-        # copy declared fields from metaclass
-        self.declared_fields = copy.deepcopy(self._declared_fields)
+        # Declared fields are shared with the class until they are bound
+        self.declared_fields = copy.copy(self._declared_fields)
         self.many = many
         self.only = only
         self.exclude = exclude
@@ -336,11 +354,20 @@ class BaseSchema(base.SchemaABC):
         self.partial = partial
         #: Dictionary mapping field_names -> :class:`Field` objects
         self.fields = self.dict_class()
-        #: Callable marshalling object
-        self._marshal = marshalling.Marshaller(
-            prefix=self.prefix
-        )
-        #: Callable unmarshalling object
+        # (De)serialization functions generated for `self.fields` by `compile`
+        self._serializer = None
+        self._deserializer = None
+        # Function generated for `self.fields` by `validate`
+        self._validator = None
+        # Serialization functions specialized for the type of the dumped objects
+        self._typed_serializers = OrderedDict()
+        # Functions generated by `dumps` to serialize objects to JSON text
+        self._json_serializers = OrderedDict()
+        self._dumped = False
+        self._loaded = False
+        #: Marshaller used by the most recent call to `dump`
+        self._marshal = marshalling.Marshaller(prefix=self.prefix)
+        #: Unmarshaller used by the most recent call to `load` or `validate`
         self._unmarshal = marshalling.Unmarshaller()
         if extra:
             warnings.warn(
@@ -350,6 +377,11 @@ class BaseSchema(base.SchemaABC):
             )
         self.extra = extra
         self.context = context or {}
+        # Snapshot of the options the bound fields were computed from
+        self._binding_key = None
+        # Whether the fields include implicit fields whose classes are
+        # inferred from the serialized object
+        self._has_implicit_fields = False
         self._update_fields(many=many)
 
     def __repr__(self):
@@ -357,18 +389,18 @@ class BaseSchema(base.SchemaABC):
             ClassName=self.__class__.__name__, self=self
         )
 
-    def _postprocess(self, data, many, obj):
+    def _postprocess(self, data, many, obj, errors):
         if self.extra:
             if many:
                 for each in data:
                     each.update(self.extra)
             else:
                 data.update(self.extra)
-        if self._marshal.errors:
+        if errors:
             # TODO: Remove self.__error_handler__ in a later release
             error_handler = self.handle_error or self.__error_handler__
             if callable(error_handler):
-                error_handler(self._marshal.errors, obj)
+                error_handler(errors, obj)
 
         return data
 
@@ -451,6 +483,110 @@ class BaseSchema(base.SchemaABC):
 
     ##### Serialization/Deserialization API #####
 
+    def compile(self):
+        """Generate serialization and deserialization functions specialized for
+        the schema's bound fields, with the per-field work of :meth:`dump` and
+        :meth:`load` (attribute reads, output keys, defaults, missing values and
+        formatting) unrolled into straight-line code.
+
+        :meth:`dump` and :meth:`load` (and :meth:`validate`) compile the schema automatically when
+        they process a collection or when the schema instance is reused, and keep the
+        functions until the schema's fields are updated. The configuration of each
+        field is read when the functions are generated, so setting an attribute of
+        a bound field discards them.
+
+        .. versionadded:: 2.3.0
+        """
+        self._typed_serializers = OrderedDict()
+        self._json_serializers = OrderedDict()
+        self._validator = None
+        self._compile_dump()
+        self._compile_load()
+
+    def _compile_dump(self, obj_type=None, encode=False):
+        if encode:
+            compile_func = compiler.compile_json_serializer
+        else:
+            compile_func = compiler.compile_serializer
+        serializer = compile_func(self.fields, prefix=self.prefix, obj_type=obj_type)
+        if not encode and obj_type is None:
+            self._serializer = serializer
+            return serializer
+        serializers = self._json_serializers if encode else self._typed_serializers
+        if len(serializers) >= self._MAX_TYPED_SERIALIZERS:
+            # Forget the oldest type
+            serializers.popitem(last=False)
+        serializers[obj_type] = serializer
+        return serializer
+
+    def _get_serializer(self, obj, many, encode=False):
+        """Return the generated function to serialize ``obj`` with, or `None` if
+        ``obj`` should be serialized by the generic `Marshaller` loop. If ``encode``
+        is `True`, the function returns JSON text.
+        """
+        obj_type = None
+        if self._has_default_accessor():
+            if not many:
+                obj_type = type(obj)
+            elif isinstance(obj, (list, tuple)) and obj:
+                # Collections are expected to be homogenous
+                obj_type = type(obj[0])
+        if encode:
+            serializer = self._json_serializers.get(obj_type)
+        elif obj_type is None:
+            serializer = self._serializer
+        else:
+            serializer = self._typed_serializers.get(obj_type)
+        if serializer is None and (many or self._dumped):
+            # Generating the function only pays off once it is reused
+            serializer = self._compile_dump(obj_type, encode=encode)
+        return serializer
+
+    def _can_dump_at_once(self):
+        """Return `True` if dumping a list of objects with ``many=True`` gives the
+        same results as dumping each object with ``many=False``, so that
+        `fields.Nested` may serialize the nested objects of a whole collection
+        with a single call to :meth:`dump`.
+        """
+        if (self.strict or self.__processors__[(PRE_DUMP, True)] or
+                self.__processors__[(POST_DUMP, True)]):
+            return False
+        # Processors that are passed the original data would be passed the list
+        for tag_name in (PRE_DUMP, POST_DUMP):
+            for attr_name in self.__processors__[(tag_name, False)]:
+                processor_kwargs = getattr(self, attr_name).__marshmallow_kwargs__
+                if processor_kwargs[(tag_name, False)].get('pass_original', False):
+                    return False
+        klass = type(self)
+        return all(
+            compiler._get_func(klass, name) is compiler._get_func(BaseSchema, name)
+            for name in ('dump', '_do_dump', 'handle_error')
+        )
+
+    def _batches_nested(self):
+        """Return `True` if the schema has `Nested <fields.Nested>` fields that
+        serialize the nested objects of a whole collection at once. Collections
+        are then dumped one field at a time.
+        """
+        return any(
+            isinstance(field_obj, fields.Nested) and not field_obj.load_only and
+            compiler.can_serialize_many(field_obj) and field_obj._can_serialize_many()
+            for field_obj in self.fields.values()
+        )
+
+    def _has_default_accessor(self):
+        # Attribute lookups can only be specialized for the default accessor
+        return (getattr(self.get_attribute, '__func__', None) is
+                compiler._get_func(BaseSchema, 'get_attribute'))
+
+    def _compile_load(self):
+        self._deserializer = compiler.compile_deserializer(self.fields, validate_many=True)
+        return self._deserializer
+
+    def _compile_validate(self):
+        self._validator = compiler.compile_validator(self.fields)
+        return self._validator
+
     def dump(self, obj, many=None, update_fields=True, **kwargs):
         """Serialize an object to native Python data types according to this
         Schema's fields.
@@ -465,44 +601,42 @@ class BaseSchema(base.SchemaABC):
         :rtype: `MarshalResult`, a `collections.namedtuple`
 
         .. versionadded:: 1.0.0
-        """
-        many = self.many if many is None else bool(many)
-        if not many and utils.is_collection(obj) and not utils.is_keyed_tuple(obj):
-            warnings.warn('Implicit collection handling is deprecated. Set '
-                            'many=True to serialize a collection.',
-                            category=DeprecationWarning)
 
-        if isinstance(obj, types.GeneratorType):
-            obj = list(obj)
+        .. versionchanged:: 2.3.0
+            Fields are only updated if ``only``, ``exclude``, ``load_only``,
+            ``dump_only``, ``ordered`` or ``prefix`` changed since they were last bound, or if
+            the schema has implicit fields (class Meta ``fields`` or ``additional``).
 
-        processed_obj = self._invoke_dump_processors(PRE_DUMP, obj, many, original_data=obj)
+        .. versionchanged:: 2.3.0
+            Errors are collected per call, so a schema instance may be used
+            by multiple threads at once.
+        """
+        result, errors, _ = self._do_dump(obj, many, update_fields, **kwargs)
+        return MarshalResult(result, errors)
 
-        if update_fields:
-            self._update_fields(processed_obj, many=many)
+    def dump_iter(self, objs, update_fields=True):
+        """Lazily serialize an iterable of objects, one object at a time.
 
-        try:
-            preresult = self._marshal(
-                processed_obj,
-                self.fields,
-                many=many,
-                # TODO: Remove self.__accessor__ in a later release
-                accessor=self.get_attribute or self.__accessor__,
-                dict_class=self.dict_class,
-                index_errors=self.opts.index_errors,
-                **kwargs
-            )
-        except ValidationError as error:
-            errors = self._marshal.errors
-            preresult = error.data
-            if self.strict:
-                raise error
-        else:
-            errors = {}
-        result = self._postprocess(preresult, many, obj=obj)
+        Unlike ``dump(objs, many=True)``, the objects are pulled from ``objs``
+        only as the results are consumed, and no list of results is built, so
+        a large query or generator can be serialized in constant memory. Each
+        object is processed as if passed to ``dump(obj, many=False)``: its
+        ``pre_dump`` and ``post_dump`` methods are invoked with ``many=False``
+        and its validation errors are returned with its result. ::
 
-        result = self._invoke_dump_processors(POST_DUMP, result, many, original_data=obj)
+            for data, errors in schema.dump_iter(query):
+                ...
 
-        return MarshalResult(result, errors)
+        :param objs: An iterable of objects to serialize.
+        :param bool update_fields: Whether to update the schema's field classes.
+        :return: A generator of `MarshalResult` tuples of the form
+            (``data``, ``errors``), one for each object. If the schema is strict,
+            a `ValidationError` is raised for the first invalid object instead.
+
+        .. versionadded:: 2.3.0
+        """
+        for obj in objs:
+            yield self.dump(obj, many=False, update_fields=update_fields)
 
     def dumps(self, obj, many=None, update_fields=True, *args, **kwargs):
         """Same as :meth:`dump`, except return a JSON-encoded string.
@@ -517,12 +651,156 @@ class BaseSchema(base.SchemaABC):
         :rtype: `MarshalResult`, a `collections.namedtuple`
 
         .. versionadded:: 1.0.0
+
+        .. versionchanged:: 2.3.0
+            If the ``json_module`` class Meta option is `json`, no JSON arguments
+            are passed and the schema has no ``post_dump`` methods, the JSON text is
+            generated directly from the objects instead of from the output of `dump`.
         """
-        deserialized, errors = self.dump(obj, many=many, update_fields=update_fields)
-        ret = self.opts.json_module.dumps(deserialized, *args, **kwargs)
+        if args or kwargs or not self._can_encode_json():
+            deserialized, errors = self.dump(obj, many=many, update_fields=update_fields)
+            ret = self.opts.json_module.dumps(deserialized, *args, **kwargs)
+            return MarshalResult(ret, errors)
+        ret, errors, encoded = self._do_dump(obj, many, update_fields, encode=True)
+        if not encoded:
+            ret = self.opts.json_module.dumps(ret)
         return MarshalResult(ret, errors)
 
-    def load(self, data, many=None, partial=None):
+    def dump_stream(self, objs, fp, many=None, update_fields=True, ndjson=False,
+                    chunk_size=1000, **kwargs):
+        """Same as :meth:`dumps`, except write the JSON-encoded output to the
+        file-like object ``fp`` incrementally.
+
+        If ``many`` is `True`, the objects are serialized with :meth:`dump_iter`, so
+        ``pre_dump`` and ``post_dump`` methods are invoked for each object with
+        ``many=False``. The encoded objects are written as a JSON array, or
+        one per line if ``ndjson`` is `True`, in chunks of ``chunk_size`` objects.
+        ``fp`` is flushed after each chunk. If the schema has ``pre_dump`` or
+        ``post_dump`` methods with ``pass_many=True``, the whole collection is
+        serialized with :meth:`dump` before it is written instead. Additional
+        keyword arguments are passed to the ``dumps`` function of the
+        ``json_module`` class Meta option.
+
+        :param objs: The object or iterable of objects to serialize.
+        :param fp: A file-like object opened in text mode.
+        :param bool many: Whether to serialize `objs` as a collection. If `None`, the
+            value for `self.many` is used.
+        :param bool update_fields: Whether to update the schema's field classes.
+        :param bool ndjson: Whether to write newline-delimited JSON instead of a
+            JSON array.
+        :param int chunk_size: Number of objects to write to ``fp`` at once.
+        :return: A dictionary of validation errors. If the schema is strict, a
+            `ValidationError` is raised for the first invalid object instead,
+            leaving the output incomplete.
+        :rtype: dict
+
+        .. versionadded:: 2.3.0
+        """
+        many = self.many if many is None else bool(many)
+        json_dumps = self.opts.json_module.dumps
+        # pass_many methods expect the whole collection, which can't be streamed
+        if (not many or self.__processors__[(PRE_DUMP, True)] or
+                self.__processors__[(POST_DUMP, True)]):
+            if many and not isinstance(objs, (list, tuple)):
+                objs = list(objs)
+            data, errors = self.dump(objs, many=many, update_fields=update_fields)
+            if many and ndjson and isinstance(data, list):
+                fp.write(''.join(json_dumps(each, **kwargs) + '\n' for each in data))
+            else:
+                fp.write(json_dumps(data, **kwargs))
+                if ndjson:
+                    fp.write('\n')
+            return errors
+        if not ndjson:
+            fp.write('[')
+        separator = '\n' if ndjson else (kwargs.get('separators') or (', ', ': '))[0]
+        errors = {}
+        chunk = []
+        count = 0
+        for data, item_errors in self.dump_iter(objs, update_fields=update_fields):
+            if item_errors:
+                if self.opts.index_errors:
+                    errors[count] = item_errors
+                else:
+                    errors.update(item_errors)
+            chunk.append(json_dumps(data, **kwargs))
+            count += 1
+            if len(chunk) >= chunk_size:
+                self._write_chunk(fp, chunk, separator, ndjson, first=count == len(chunk))
+                chunk = []
+        if chunk:
+            self._write_chunk(fp, chunk, separator, ndjson, first=count == len(chunk))
+        if not ndjson:
+            fp.write(']')
+        return errors
+
+    def dump_columns(self, objs, update_fields=True):
+        """Serialize a collection of objects to columns: a dictionary that maps
+        each output key to the list of the values of all objects for that key. ::
+
+            data, errors = schema.dump_columns(users)
+            data['age']  # array([42, 36, ...])
+
+        The columns of `Integer`, `Float`, `Number`, `Decimal`, `Boolean` and
+        `DateTime` fields are `numpy` arrays of ``int64``, ``float64``, ``bool``
+        and ``datetime64[us]`` values, unless a value is missing, null or
+        invalid. Datetimes are converted to UTC. The columns of other fields, and
+        the columns that can't be arrays, are lists of serialized values in which
+        missing and invalid values are `None`. Validation errors are indexed by
+        the position of the object, as with ``dump(objs, many=True)``.
+
+        ``pre_dump`` and ``post_dump`` methods are not invoked.
+
+        :param objs: An iterable of objects to serialize.
+        :param bool update_fields: Whether to update the schema's field classes.
+        :return: A tuple of the form (``data``, ``errors``)
+        :rtype: `MarshalResult`, a `collections.namedtuple`
+        :raises: RuntimeError if `numpy` is not installed.
+
+        .. versionadded:: 2.3.0
+        """
+        if not columnar.numpy_available:
+            raise RuntimeError('dump_columns requires the numpy library')
+        if not isinstance(objs, (list, tuple)):
+            objs = list(objs)
+        if update_fields and self._fields_outdated():
+            self._update_fields(objs, many=True)
+        marshal = marshalling.Marshaller(prefix=self.prefix)
+        self._marshal = marshal
+        result = columnar.dump_columns(
+            objs,
+            self.fields,
+            # TODO: Remove self.__accessor__ in a later release
+            accessor=self.get_attribute or self.__accessor__,
+            store_error=marshal.store_error,
+            prefix=self.prefix,
+            dict_class=self.dict_class,
+            index_errors=self.opts.index_errors,
+            obj_type=type(objs[0]) if objs and self._has_default_accessor() else None,
+        )
+        errors = marshal.errors
+        if errors:
+            exc = ValidationError(
+                errors,
+                field_names=marshal.error_field_names,
+                fields=marshal.error_fields,
+                data=result
+            )
+            if self.strict:
+                raise exc
+        return MarshalResult(result, errors)
+
+    @staticmethod
+    def _write_chunk(fp, chunk, separator, ndjson, first):
+        """Write a list of JSON-encoded objects to ``fp`` and flush it."""
+        if not (first or ndjson):
+            fp.write(separator)
+        fp.write(separator.join(chunk))
+        if ndjson:
+            fp.write(separator)
+        fp.flush()
+
+    def load(self, data, many=None, partial=None, fail_fast=None):
         """Deserialize a data structure to an object defined by this Schema's
         fields and :meth:`make_object`.
 
@@ -531,12 +809,20 @@ class BaseSchema(base.SchemaABC):
             value for `self.many` is used.
         :param bool partial: Whether to ignore missing fields. If `None`, the
             value for `self.partial` is used.
+        :param bool fail_fast: Whether to stop at the first validation error. The
+            remaining fields, items and validators are skipped, so ``errors``
+            holds a single error and ``data`` is incomplete. If `None`, the value
+            of the ``fail_fast`` class Meta option is used.
         :return: A tuple of the form (``data``, ``errors``)
         :rtype: `UnmarshalResult`, a `collections.namedtuple`
 
         .. versionadded:: 1.0.0
+
+        .. versionchanged:: 2.3.0
+            Added ``fail_fast`` parameter.
         """
-        result, errors = self._do_load(data, many, partial=partial, postprocess=True)
+        result, errors = self._do_load(data, many, partial=partial, postprocess=True,
+                                       fail_fast=fail_fast)
         return UnmarshalResult(data=result, errors=errors)
 
     def loads(self, json_data, many=None, *args, **kwargs):
@@ -556,28 +842,270 @@ class BaseSchema(base.SchemaABC):
         # passing in positional args after `many` for use by `json.loads`, but
         # ideally we shouldn't have to do this.
         partial = kwargs.pop('partial', None)
+        fail_fast = kwargs.pop('fail_fast', None)
 
         data = self.opts.json_module.loads(json_data, *args, **kwargs)
-        return self.load(data, many=many, partial=partial)
+        return self.load(data, many=many, partial=partial, fail_fast=fail_fast)
+
+    def load_iter(self, source, partial=None):
+        """Lazily deserialize an iterable of records, one record at a time.
+
+        Each record is processed as if passed to ``load(record, many=False)``:
+        its ``pre_load`` and ``post_load`` methods are invoked with ``many=False``
+        and its validation errors are returned with its result. Records that
+        are strings are decoded with the ``json_module`` class Meta option,
+        so ``source`` may be a file of newline-delimited JSON. Blank lines are
+        skipped. ::
+
+            with open('users.ndjson') as fp:
+                for index, data, errors in schema.load_iter(fp):
+                    ...
+
+        :param source: An iterable of dictionaries or JSON-encoded strings.
+        :param bool partial: Whether to ignore missing fields. If `None`, the
+            value for `self.partial` is used.
+        :return: A generator of tuples of the form (``index``, ``data``, ``errors``),
+            where ``index`` is the position of the record in ``source``, not
+            counting blank lines. The errors of a string that isn't valid JSON
+            are stored under the ``_schema`` key. If the schema is strict, a
+            `ValidationError` is raised for the first invalid record instead.
+
+        .. versionadded:: 2.3.0
+        """
+        json_loads = self.opts.json_module.loads
+        index = 0
+        for record in source:
+            if isinstance(record, basestring):
+                if not record.strip():
+                    continue
+                try:
+                    record = json_loads(record)
+                except ValueError as err:
+                    # A malformed record doesn't end the iteration
+                    unmarshal = marshalling.Unmarshaller()
+                    unmarshal.store_error(ValidationError('Invalid JSON: {0}'.format(err)),
+                                          marshalling.SCHEMA, None)
+                    self._handle_load_errors(unmarshal, unmarshal.errors, record)
+                    yield index, None, unmarshal.errors
+                    index += 1
+                    continue
+            data, errors = self._do_load(record, many=False, partial=partial)
+            yield index, data, errors
+            index += 1
 
-    def validate(self, data, many=None):
+    def loads_stream(self, fp, partial=None, chunk_size=65536):
+        """Same as :meth:`load_iter`, except it takes a file-like object containing
+        a JSON array as input.
+
+        The array is read from ``fp`` incrementally and each of its elements is
+        decoded and deserialized as soon as it is complete, so that memory use is
+        bounded by the size of the largest element rather than the whole array. ::
+
+            for index, data, errors in schema.loads_stream(request.stream):
+                ...
+
+        :param fp: A file-like object containing a JSON array.
+        :param bool partial: Whether to ignore missing fields. If `None`, the
+            value for `self.partial` is used.
+        :param int chunk_size: Number of characters to read from ``fp`` at once.
+            Elements are decoded with the ``JSONDecoder`` class of the ``json_module``
+            class Meta option if it has one, else with `json.JSONDecoder`.
+        :return: A generator of tuples of the form (``index``, ``data``, ``errors``).
+        :raises: ValueError if ``fp`` does not contain a JSON array.
+
+        .. versionadded:: 2.3.0
+        """
+        decoder_class = getattr(self.opts.json_module, 'JSONDecoder', json.JSONDecoder)
+        records = utils.iter_json_array(fp, decoder=decoder_class(), chunk_size=chunk_size)
+        return self._load_records(records, partial=partial)
+
+    def load_columns(self, columns, partial=None):
+        """Deserialize columns: a dictionary that maps each input key to a list or
+        `numpy` array of values, one per record. All columns must have the same
+        length. This is the inverse of :meth:`dump_columns`. ::
+
+            data, errors = schema.load_columns({'name': names, 'age': ages})
+
+        Arrays of booleans, numbers and ``datetime64`` values that need no
+        conversion for their `Boolean`, `Integer`, `Float`, `Number` or
+        `DateTime` field are converted at once; only the validators of the field
+        are called for each value. Other columns are deserialized one value at a
+        time. Columns of those fields are returned as `numpy` arrays, unless a
+        value is null or invalid. Invalid values are `None`, and validation errors
+        are indexed by the position of the record, as with ``load(data, many=True)``.
+
+        ``pre_load`` and ``post_load`` methods and schema-level validators are
+        not invoked.
+
+        :param dict columns: The columns to deserialize.
+        :param bool partial: Whether to ignore missing columns. If `None`, the
+            value for `self.partial` is used.
+        :return: A tuple of the form (``data``, ``errors``)
+        :rtype: `UnmarshalResult`, a `collections.namedtuple`
+        :raises: RuntimeError if `numpy` is not installed, ValueError if the
+            columns don't all have the same length.
+
+        .. versionadded:: 2.3.0
+        """
+        if not columnar.numpy_available:
+            raise RuntimeError('load_columns requires the numpy library')
+        partial = self.partial if partial is None else bool(partial)
+        unmarshal = marshalling.Unmarshaller()
+        self._unmarshal = unmarshal
+        result = columnar.load_columns(
+            columns,
+            self.fields,
+            store_error=unmarshal.store_error,
+            partial=partial,
+            dict_class=self.dict_class,
+            index_errors=self.opts.index_errors,
+        )
+        errors = unmarshal.errors
+        if errors:
+            exc = ValidationError(
+                errors,
+                field_names=unmarshal.error_field_names,
+                fields=unmarshal.error_fields,
+                data=columns
+            )
+            self.handle_error(exc, columns)
+            if self.strict:
+                raise exc
+        return UnmarshalResult(data=result, errors=errors)
+
+    def validate(self, data, many=None, fail_fast=None):
         """Validate `data` against the schema, returning a dictionary of
         validation errors.
 
         :param dict data: The data to validate.
         :param bool many: Whether to validate `data` as a collection. If `None`, the
             value for `self.many` is used.
+        :param bool fail_fast: Whether to stop at the first validation error. If
+            `None`, the value of the ``fail_fast`` class Meta option is used.
         :return: A dictionary of validation errors.
         :rtype: dict
 
         .. versionadded:: 1.1.0
+
+        .. versionchanged:: 2.3.0
+            Added ``fail_fast`` parameter. The deserialized data is not built
+            unless the schema has ``validates`` or ``validates_schema`` methods.
         """
-        _, errors = self._do_load(data, many, postprocess=False)
-        return errors
+        if (self.__processors__[(VALIDATES, False)] or
+                self.__processors__[(VALIDATES_SCHEMA, False)] or
+                self.__processors__[(VALIDATES_SCHEMA, True)]):
+            # These validators receive the deserialized data
+            _, errors = self._do_load(data, many, postprocess=False, fail_fast=fail_fast)
+            return errors
+        return self._do_validate(data, many, fail_fast=fail_fast)
 
     ##### Private Helpers #####
 
-    def _do_load(self, data, many=None, partial=None, postprocess=True):
+    def _do_dump(self, obj, many=None, update_fields=True, encode=False, **kwargs):
+        """Serialize `obj`, returning the serialized result, a dictionary of
+        validation errors and whether the result is already JSON-encoded.
+
+        :param bool encode: Whether to serialize `obj` directly to JSON text if
+            possible. Only pass `True` if the result is passed to `json.dumps` with
+            its default arguments and there are no ``post_dump`` methods.
+        :return: A tuple of the form (`data`, `errors`, `encoded`)
+        """
+        many = self.many if many is None else bool(many)
+        if not many and utils.is_collection(obj) and not utils.is_keyed_tuple(obj):
+            warnings.warn('Implicit collection handling is deprecated. Set '
+                            'many=True to serialize a collection.',
+                            category=DeprecationWarning)
+
+        if isinstance(obj, types.GeneratorType):
+            obj = list(obj)
+
+        processed_obj = self._invoke_dump_processors(PRE_DUMP, obj, many, original_data=obj)
+
+        if update_fields and self._has_implicit_fields:
+            # The implicit fields depend on the dumped object. Bind them and pick
+            # the serializer for them under the lock, so that a concurrent dump
+            # of an object with other attribute types can't swap them in between
+            with self._implicit_fields_lock:
+                fields_dict, serializer, encoded, by_column, obj_type = self._prepare_dump(
+                    processed_obj, many, update_fields, encode, kwargs)
+        else:
+            fields_dict, serializer, encoded, by_column, obj_type = self._prepare_dump(
+                processed_obj, many, update_fields, encode, kwargs)
+
+        marshal = marshalling.Marshaller(prefix=self.prefix)
+        self._marshal = marshal
+        try:
+            preresult = marshal(
+                processed_obj,
+                fields_dict,
+                many=many,
+                # TODO: Remove self.__accessor__ in a later release
+                accessor=self.get_attribute or self.__accessor__,
+                dict_class=self.dict_class,
+                index_errors=self.opts.index_errors,
+                serializer=serializer,
+                by_column=by_column,
+                obj_type=obj_type,
+                **kwargs
+            )
+        except ValidationError as error:
+            errors = marshal.errors
+            preresult = error.data
+            if self.strict:
+                raise error
+        else:
+            errors = {}
+        if encoded and many and processed_obj is not None:
+            preresult = '[' + ', '.join(preresult) + ']'
+        result = self._postprocess(preresult, many, obj=obj, errors=errors)
+
+        result = self._invoke_dump_processors(POST_DUMP, result, many, original_data=obj)
+
+        return result, errors, encoded
+
+    def _prepare_dump(self, obj, many, update_fields, encode, kwargs):
+        """Return the bound fields to serialize ``obj`` with, the generated function
+        to serialize it with, whether that function returns JSON text, whether to
+        serialize ``obj`` one field at a time and the type of its items.
+        """
+        if update_fields and self._fields_outdated():
+            self._update_fields(obj, many=many)
+        fields_dict = self.fields
+
+        serializer = None
+        if encode and not kwargs:
+            serializer = self._get_serializer(obj, many, encode=True)
+        encoded = serializer is not None
+        by_column = (
+            many and not (kwargs or encoded) and obj is not None and
+            (self.opts.dump_by_column or self._batches_nested())
+        )
+        obj_type = None
+        if by_column:
+            if isinstance(obj, (list, tuple)) and obj and self._has_default_accessor():
+                obj_type = type(obj[0])
+        elif not (kwargs or encoded):
+            serializer = self._get_serializer(obj, many)
+        self._dumped = True
+        return fields_dict, serializer, encoded, by_column, obj_type
+
+    def _can_encode_json(self):
+        """Return `True` if :meth:`dumps` may serialize objects directly to JSON text."""
+        return (
+            self.opts.json_module is json and
+            not self.extra and
+            not self.__processors__[(POST_DUMP, False)] and
+            not self.__processors__[(POST_DUMP, True)] and
+            # Subclasses that override dump expect dumps to call it
+            compiler._get_func(type(self), 'dump') is compiler._get_func(BaseSchema, 'dump')
+        )
+
+    def _load_records(self, records, partial):
+        for index, record in enumerate(records):
+            data, errors = self._do_load(record, many=False, partial=partial)
+            yield index, data, errors
+
+    def _do_load(self, data, many=None, partial=None, postprocess=True, fail_fast=None):
         """Deserialize `data`, returning the deserialized result and a dictonary of
         validation errors.
 
@@ -587,56 +1115,128 @@ class BaseSchema(base.SchemaABC):
         :param bool partial: Whether to ignore missing fields. If `None`, the
             value for `self.partial` is used.
         :param bool postprocess: Whether to run post_load methods..
+        :param bool fail_fast: Whether to stop at the first validation error. If
+            `None`, the value for `self.opts.fail_fast` is used.
         :return: A tuple of the form (`data`, `errors`)
         """
         many = self.many if many is None else bool(many)
         partial = self.partial if partial is None else bool(partial)
+        fail_fast = self.opts.fail_fast if fail_fast is None else bool(fail_fast)
 
         processed_data = self._invoke_load_processors(PRE_LOAD, data, many, original_data=data)
 
-        try:
-            result = self._unmarshal(
-                processed_data,
-                self.fields,
-                many=many,
-                partial=partial,
-                dict_class=self.dict_class,
-                index_errors=self.opts.index_errors,
-            )
-        except ValidationError as error:
-            result = error.data
+        if self._deserializer is not None:
+            deserializer = self._deserializer
+        elif many or self._loaded:
+            deserializer = self._compile_load()
         else:
-            errors = {}
-        self._invoke_field_validators(data=result, many=many)
-        errors = self._unmarshal.errors
+            # Generating the function only pays off once it is reused
+            deserializer = None
+        self._loaded = True
+
+        unmarshal = marshalling.Unmarshaller(fail_fast=fail_fast)
+
+        self._unmarshal = unmarshal
+        # Errors are collected without raising them
+        result = unmarshal.collect(
+            processed_data,
+            self.fields,
+            many=many,
+            partial=partial,
+            dict_class=self.dict_class,
+            index_errors=self.opts.index_errors,
+            deserializer=deserializer,
+            validate_many=deserializer is not None,
+        )
+        if not (fail_fast and unmarshal.errors):
+            try:
+                self._invoke_field_validators(unmarshal, data=result, many=many)
+            except marshalling.FailFast:
+                pass
+        errors = unmarshal.errors
         # Run schema-level migration
-        try:
-            self._invoke_validators(pass_many=True, data=result, original_data=data, many=many)
-        except ValidationError as err:
-            errors.update(err.messages)
-        try:
-            self._invoke_validators(pass_many=False, data=result, original_data=data, many=many)
-        except ValidationError as err:
-            errors.update(err.messages)
+        for pass_many in (True, False):
+            if fail_fast and errors:
+                break
+            try:
+                self._invoke_validators(unmarshal, pass_many=pass_many, data=result,
+                                        original_data=data, many=many)
+            except ValidationError as err:
+                errors.update(err.messages)
         if errors:
-            # TODO: Remove self.__error_handler__ in a later release
-            if self.__error_handler__ and callable(self.__error_handler__):
-                self.__error_handler__(errors, data)
-            exc = ValidationError(
-                errors,
-                field_names=self._unmarshal.error_field_names,
-                fields=self._unmarshal.error_fields,
-                data=data
-            )
-            self.handle_error(exc, data)
-            if self.strict:
-                raise exc
+            self._handle_load_errors(unmarshal, errors, data)
 
         if not errors and postprocess:
             result = self._invoke_load_processors(POST_LOAD, result, many, original_data=data)
 
         return result, errors
 
+    def _do_validate(self, data, many=None, partial=None, fail_fast=None):
+        """Validate `data` without building the deserialized data, returning a
+        dictionary of validation errors. Only call this if the schema has no
+        ``validates`` or ``validates_schema`` methods.
+
+        :param data: The data to validate.
+        :param bool many: Whether to validate `data` as a collection. If `None`, the
+            value for `self.many` is used.
+        :param bool partial: Whether to ignore missing fields. If `None`, the
+            value for `self.partial` is used.
+        :param bool fail_fast: Whether to stop at the first validation error. If
+            `None`, the value for `self.opts.fail_fast` is used.
+        :return: A dictionary of validation errors.
+        """
+        many = self.many if many is None else bool(many)
+        partial = self.partial if partial is None else bool(partial)
+        fail_fast = self.opts.fail_fast if fail_fast is None else bool(fail_fast)
+
+        processed_data = self._invoke_load_processors(PRE_LOAD, data, many, original_data=data)
+
+        if self._validator is None and (many or self._loaded):
+            self._compile_validate()
+        self._loaded = True
+
+        unmarshal = marshalling.Unmarshaller(fail_fast=fail_fast)
+
+        self._unmarshal = unmarshal
+        errors = unmarshal.validate(
+            processed_data,
+            self.fields,
+            many=many,
+            partial=partial,
+            index_errors=self.opts.index_errors,
+            validator=self._validator,
+        )
+        if errors:
+            self._handle_load_errors(unmarshal, errors, data)
+        return errors
+
+    def _handle_load_errors(self, unmarshal, errors, data):
+        """Pass the ``errors`` of loading ``data`` to the error handlers, and
+        raise them if the schema is strict.
+        """
+        # TODO: Remove self.__error_handler__ in a later release
+        if self.__error_handler__ and callable(self.__error_handler__):
+            self.__error_handler__(errors, data)
+        exc = ValidationError(
+            errors,
+            field_names=unmarshal.error_field_names,
+            fields=unmarshal.error_fields,
+            data=data
+        )
+        self.handle_error(exc, data)
+        if self.strict:
+            raise exc
+
+    def _get_binding_key(self):
+        return (self.ordered, self.only, self.exclude, self.load_only, self.dump_only,
+                self.prefix)
+
+    def _fields_outdated(self):
+        """Return `True` if the bound fields must be computed again before
+        serializing an object.
+        """
+        return self._has_implicit_fields or self._get_binding_key() != self._binding_key
+
     def _update_fields(self, obj=None, many=False):
         """Update fields based on the passed in object."""
         if self.only:
@@ -660,11 +1260,40 @@ class BaseSchema(base.SchemaABC):
         if excludes:
             field_names = field_names - excludes
         ret = self.__filter_fields(field_names, obj, many=many)
+        self._has_implicit_fields = any(
+            field_name not in self.declared_fields for field_name in ret
+        )
+        binding_key = self._get_binding_key()
+        rebind = binding_key != self._binding_key
+        if not rebind:
+            # Only bind the fields that are new since the last update, e.g.
+            # implicit fields whose inferred class changed
+            unbound = self.dict_class(
+                (field_name, field_obj) for field_name, field_obj in iteritems(ret)
+                if self.fields.get(field_name) is not field_obj
+            )
+        else:
+            unbound = ret
+            self._binding_key = tuple(copy.copy(each) for each in binding_key)
         # Set parents
-        self.__set_field_attrs(ret)
-        self.fields = ret
+        ret.update(self.__set_field_attrs(unbound))
+        if (rebind or type(ret) is not type(self.fields) or
+                list(iteritems(ret)) != list(iteritems(self.fields))):
+            self.fields = ret
+            # The compiled functions are specific to the bound fields
+            self._reset_compiled()
         return self.fields
 
+    def _reset_compiled(self):
+        """Discard the functions generated for the bound fields. Called when the
+        fields are bound again and when an attribute of a bound field is set.
+        """
+        self._serializer = None
+        self._typed_serializers = OrderedDict()
+        self._json_serializers = OrderedDict()
+        self._deserializer = None
+        self._validator = None
+
     def on_bind_field(self, field_name, field_obj):
         """Hook to modify a field when it is bound to the `Schema`. No-op by default."""
         return None
@@ -675,8 +1304,16 @@ class BaseSchema(base.SchemaABC):
 
         Also set field load_only and dump_only values if field_name was
         specified in ``class Meta``.
+
+        Fields that are still shared with the schema class are copied before
+        they are bound.
         """
-        for field_name, field_obj in iteritems(fields_dict):
+        for field_name, field_obj in list(iteritems(fields_dict)):
+            if (isinstance(field_obj, base.FieldABC) and
+                    field_obj is self._declared_fields.get(field_name)):
+                field_obj = field_obj._copy()
+                fields_dict[field_name] = field_obj
+                self.declared_fields[field_name] = field_obj
             try:
                 if field_name in self.load_only:
                     field_obj.load_only = True
@@ -731,9 +1368,14 @@ class BaseSchema(base.SchemaABC):
                         err_type = type(err)
                         raise err_type(
                             '"{0}" is not a valid field for {1}.'.format(key, obj))
-                    field_obj = self.TYPE_MAPPING.get(attribute_type, fields.Field)()
+                    field_class = self.TYPE_MAPPING.get(attribute_type, fields.Field)
                 else:  # Object is None
-                    field_obj = fields.Field()
+                    field_class = fields.Field
+                # Reuse the field inferred by a previous update if it has the
+                # same type, so that the compiled serializer stays valid
+                field_obj = self.fields.get(key)
+                if type(field_obj) is not field_class:
+                    field_obj = field_class()
                 # map key -> field (default to Raw)
                 ret[key] = field_obj
         return ret
@@ -757,7 +1399,7 @@ class BaseSchema(base.SchemaABC):
             data=data, many=many, original_data=original_data)
         return data
 
-    def _invoke_field_validators(self, data, many):
+    def _invoke_field_validators(self, unmarshal, data, many):
         for attr_name in self.__processors__[(VALIDATES, False)]:
             validator = getattr(self, attr_name)
             validator_kwargs = validator.__marshmallow_kwargs__[(VALIDATES, False)]
@@ -777,7 +1419,7 @@ class BaseSchema(base.SchemaABC):
                     except KeyError:
                         pass
                     else:
-                        self._unmarshal.call_and_store(
+                        unmarshal.call_and_store(
                             getter_func=validator,
                             data=value,
                             field_name=field_name,
@@ -790,14 +1432,14 @@ class BaseSchema(base.SchemaABC):
                 except KeyError:
                     pass
                 else:
-                    self._unmarshal.call_and_store(
+                    unmarshal.call_and_store(
                         getter_func=validator,
                         data=value,
                         field_name=field_name,
                         field_obj=field_obj
                     )
 
-    def _invoke_validators(self, pass_many, data, original_data, many):
+    def _invoke_validators(self, unmarshal, pass_many, data, original_data, many):
         errors = {}
         for attr_name in self.__processors__[(VALIDATES_SCHEMA, pass_many)]:
             validator = getattr(self, attr_name)
@@ -808,18 +1450,22 @@ class BaseSchema(base.SchemaABC):
             if many and not pass_many:
                 for idx, item in enumerate(data):
                     try:
-                        self._unmarshal.run_validator(validator,
-                                                  item, original_data, self.fields, many=many,
-                                                  index=idx, pass_original=pass_original)
+                        unmarshal.run_validator(validator,
+                                                item, original_data, self.fields, many=many,
+                                                index=idx, pass_original=pass_original)
                     except ValidationError as err:
                         errors.update(err.messages)
+                        if unmarshal.fail_fast:
+                            raise ValidationError(errors)
             else:
                 try:
-                    self._unmarshal.run_validator(validator,
-                                              data, original_data, self.fields, many=many,
-                                              pass_original=pass_original)
+                    unmarshal.run_validator(validator,
+                                            data, original_data, self.fields, many=many,
+                                            pass_original=pass_original)
                 except ValidationError as err:
                     errors.update(err.messages)
+                    if unmarshal.fail_fast:
+                        raise ValidationError(errors)
         if errors:
             raise ValidationError(errors)
         return None
@@ -2,16 +2,22 @@
 """Utility methods for marshmallow."""
 from __future__ import absolute_import, unicode_literals
 
+import codecs
 import collections
 import datetime
 import functools
 import inspect
 import json
+import numbers
+import operator
+import re
+import threading
 import time
 import types
+import weakref
 from calendar import timegm
 from decimal import Decimal, ROUND_HALF_EVEN, Context, Inexact
-from email.utils import formatdate, parsedate
+from email.utils import formatdate
 from pprint import pprint as py_pprint
 
 from marshmallow.compat import OrderedDict, binary_type, text_type
@@ -132,6 +138,128 @@ def pprint(obj, *args, **kwargs):
     else:
         py_pprint(obj, *args, **kwargs)
 
+_JSON_NON_WHITESPACE = re.compile(r'\S')
+# Strings, unterminated strings, brackets and the delimiters that end a scalar
+_JSON_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|"|[\[\]{},\s]')
+
+
+def _json_value_end(text, start):
+    """Return the index after the JSON value starting at ``text[start]`` if its
+    strings and brackets are closed within ``text``, else `None`, in which case
+    the value may continue after ``text``. The value itself isn't validated.
+    """
+    depth = 0
+    for match in _JSON_TOKEN.finditer(text, start):
+        char = text[match.start()]
+        if char == '"':
+            if match.end() - match.start() == 1:  # Unterminated string
+                return None
+            if depth == 0:
+                return match.end()
+        elif char in '[{':
+            depth += 1
+        elif char in ']}':
+            if depth == 0:
+                return match.start()
+            depth -= 1
+            if depth == 0:
+                return match.end()
+        elif depth == 0:
+            return match.start()
+    return None
+
+
+def iter_json_array(fp, decoder=None, chunk_size=65536):
+    """Read a JSON array from a file-like object incrementally and yield each
+    of its elements, decoded, as soon as it is complete. Only the element being
+    read needs to be kept in memory. Bytes read from ``fp`` are decoded as UTF-8. ::
+
+        >>> import io
+        >>> list(iter_json_array(io.StringIO('[{"id": 1}, [2, "]"]]')))
+        [{'id': 1}, [2, ']']]
+
+    :param fp: A file-like object whose ``read`` method returns the JSON text.
+    :param decoder: Object with a ``raw_decode`` method used to decode each
+        element, e.g. a `json.JSONDecoder`, which is used by default.
+    :param int chunk_size: Number of characters to read from ``fp`` at once.
+    :raises: ValueError if the text is not a valid JSON array.
+    """
+    raw_decode = (decoder or json.JSONDecoder()).raw_decode
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+
+    def read(size):
+        chunk = fp.read(size)
+        while isinstance(chunk, binary_type):
+            text = text_decoder.decode(chunk, final=not chunk)
+            # A chunk may end in the middle of a multibyte character
+            if text or not chunk:
+                return text
+            chunk = fp.read(size)
+        return chunk
+
+    buf = ''
+    pos = 0
+    eof = False
+    # Read size, doubled while an element doesn't fit in the buffer so that
+    # large elements aren't decoded over and over again
+    size = chunk_size
+    # Delimiters that may come next, or None if an element must come next
+    expected = '['
+    while True:
+        match = _JSON_NON_WHITESPACE.search(buf, pos)
+        if match is not None and expected is None:
+            try:
+                element, end = raw_decode(buf, match.start())
+            except ValueError:
+                # Reading on can't fix an element that is already complete
+                if eof or _json_value_end(buf, match.start()) is not None:
+                    raise
+            else:
+                following = _JSON_NON_WHITESPACE.search(buf, end)
+                # The element may continue in the next chunk, e.g. a number
+                if following is not None or eof:
+                    pos = end
+                    expected = ',]'
+                    size = chunk_size
+                    yield element
+                    continue
+            match = None
+        if match is not None:
+            char = buf[match.start()]
+            pos = match.end()
+            if expected == '[':
+                if char != '[':
+                    raise ValueError('Expecting a JSON array.')
+                expected = ']'
+            elif char == ']' and ']' in expected:
+                break
+            elif char == ',' and ',' in expected:
+                expected = None
+            elif expected == ']':
+                # First element
+                pos = match.start()
+                expected = None
+            else:
+                raise ValueError('Unexpected {0!r} in JSON array.'.format(char))
+            continue
+        if eof:
+            raise ValueError('Unterminated JSON array.')
+        chunk = read(size)
+        if chunk:
+            buf = buf[pos:] + chunk
+            pos = 0
+            size *= 2
+        else:
+            eof = True
+    rest = buf[pos:]
+    while not rest.strip():
+        if eof:
+            return
+        rest = read(chunk_size)
+        eof = not rest
+    raise ValueError('Extra data after JSON array.')
+
+
 # From pytz: http://pytz.sourceforge.net/
 ZERO = datetime.timedelta(0)
 HOUR = datetime.timedelta(hours=1)
@@ -186,13 +314,17 @@ class UTC(datetime.tzinfo):
 UTC = utc = UTC()  # UTC is a singleton
 
 
+_WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+_MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep",
+           "Oct", "Nov", "Dec"]
+
+
 def local_rfcformat(dt):
     """Return the RFC822-formatted representation of a timezone-aware datetime
     with the UTC offset.
     """
-    weekday = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"][dt.weekday()]
-    month = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep",
-             "Oct", "Nov", "Dec"][dt.month - 1]
+    weekday = _WEEKDAYS[dt.weekday()]
+    month = _MONTHS[dt.month - 1]
     tz_offset = dt.strftime("%z")
     return "%s, %02d %s %04d %02d:%02d:%02d %s" % (weekday, dt.day, month,
         dt.year, dt.hour, dt.minute, dt.second, tz_offset)
@@ -207,11 +339,27 @@ def rfcformat(dt, localtime=False):
         e.g. "Sun, 10 Nov 2013 08:23:45 -0600"
     """
     if not localtime:
-        return formatdate(timegm(dt.utctimetuple()))
+        return rfcformat_utc(dt)
     else:
         return local_rfcformat(dt)
 
 
+def rfcformat_utc(dt):
+    """Return the RFC822-formatted UTC representation of a datetime object, as
+    ``rfcformat(dt)`` does, e.g. "Sun, 10 Nov 2013 14:23:45 -0000". Naive
+    datetimes are in UTC.
+
+    .. versionadded:: 2.3.0
+    """
+    if dt.tzinfo is not None and dt.utcoffset():
+        dt = dt.astimezone(UTC)
+    if 1900 <= dt.year <= 9999:
+        return "%s, %02d %s %04d %02d:%02d:%02d -0000" % (
+            _WEEKDAYS[dt.weekday()], dt.day, _MONTHS[dt.month - 1],
+            dt.year, dt.hour, dt.minute, dt.second)
+    return formatdate(timegm(dt.utctimetuple()))
+
+
 def isoformat(dt, localtime=False, *args, **kwargs):
     """Return the ISO8601-formatted UTC representation of a datetime object.
     """
@@ -225,6 +373,152 @@ def isoformat(dt, localtime=False, *args, **kwargs):
     return localized.isoformat(*args, **kwargs)
 
 
+def isoformat_utc(dt):
+    """Return the ISO8601-formatted UTC representation of a datetime object, as
+    ``isoformat(dt)`` does. Naive datetimes are in UTC and are formatted
+    without being localized.
+
+    .. versionadded:: 2.3.0
+    """
+    if dt.tzinfo is None:
+        return dt.isoformat() + '+00:00'
+    return dt.astimezone(UTC).isoformat()
+
+
+# Number of timestamp units per second, by unit
+TIMESTAMP_UNITS = {'s': 1, 'ms': 1000, 'us': 1000000}
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_EPOCH_DATE = _EPOCH.date()
+_EPOCH_UTC = datetime.datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_DAY = datetime.timedelta(days=1)
+
+
+def _delta_to_timestamp(delta, unit):
+    """Return the timedelta ``delta`` in ``unit``, rounded down."""
+    per_second = TIMESTAMP_UNITS[unit]
+    return ((delta.days * 86400 + delta.seconds) * per_second +
+            delta.microseconds // (1000000 // per_second))
+
+
+def _timestamp_to_delta(value, unit):
+    """Return the timedelta of ``value`` in ``unit``."""
+    if isinstance(value, bool) or not isinstance(value, numbers.Real):
+        raise TypeError('Timestamps must be numbers, not {0!r}'.format(value))
+    return datetime.timedelta(microseconds=value * (1000000 // TIMESTAMP_UNITS[unit]))
+
+
+def to_timestamp(dt, unit='s'):
+    """Return the integer number of seconds (``unit='s'``), milliseconds
+    (``unit='ms'``) or microseconds (``unit='us'``) since the Unix epoch of a
+    datetime or date object, rounded down. Naive datetimes and dates are in UTC.
+
+    .. versionadded:: 2.3.0
+    """
+    if isinstance(dt, datetime.datetime):
+        if dt.tzinfo is None:
+            delta = dt - _EPOCH
+        else:
+            delta = dt - _EPOCH_UTC
+    else:
+        delta = dt - _EPOCH_DATE
+    return _delta_to_timestamp(delta, unit)
+
+
+def from_timestamp(value, unit='s'):
+    """Return the timezone-aware UTC datetime of a number of seconds
+    (``unit='s'``), milliseconds (``unit='ms'``) or microseconds (``unit='us'``)
+    since the Unix epoch.
+
+    :raise TypeError: If ``value`` is not a number.
+    :raise OverflowError: If the datetime is out of range.
+
+    .. versionadded:: 2.3.0
+    """
+    return _EPOCH_UTC + _timestamp_to_delta(value, unit)
+
+
+def time_to_timestamp(t, unit='s'):
+    """Return the integer number of seconds, milliseconds or microseconds (see
+    :func:`to_timestamp`) since midnight of a time object, rounded down.
+
+    .. versionadded:: 2.3.0
+    """
+    delta = datetime.timedelta(hours=t.hour, minutes=t.minute, seconds=t.second,
+                               microseconds=t.microsecond)
+    return _delta_to_timestamp(delta, unit)
+
+
+def time_from_timestamp(value, unit='s'):
+    """Return the time object of a number of seconds, milliseconds or
+    microseconds (see :func:`from_timestamp`) since midnight.
+
+    :raise TypeError: If ``value`` is not a number.
+    :raise ValueError: If ``value`` is negative or not less than one day.
+
+    .. versionadded:: 2.3.0
+    """
+    delta = _timestamp_to_delta(value, unit)
+    if not datetime.timedelta(0) <= delta < _ONE_DAY:
+        raise ValueError('Timestamp is out of the range of a day: {0!r}'.format(value))
+    return (_EPOCH + delta).time()
+
+
+# Directives of `datetime.strftime` that `make_strftime` formats without it,
+# with the datetime attribute and the format of its value
+_STRFTIME_DIRECTIVES = {
+    'Y': ('year', '%04d'),
+    'm': ('month', '%02d'),
+    'd': ('day', '%02d'),
+    'H': ('hour', '%02d'),
+    'M': ('minute', '%02d'),
+    'S': ('second', '%02d'),
+    'f': ('microsecond', '%06d'),
+}
+
+
+def make_strftime(dateformat):
+    """Return a function that formats a datetime object as
+    ``dt.strftime(dateformat)`` does. If ``dateformat`` only contains the
+    numeric directives ``%Y``, ``%m``, ``%d``, ``%H``, ``%M``, ``%S`` and
+    ``%f``, the format is translated once into a ``%``-formatting template,
+    which is faster than `datetime.strftime`. The template is only used for
+    `datetime.datetime` objects; other objects are formatted by their
+    ``strftime`` method.
+
+    .. versionadded:: 2.3.0
+    """
+    parts = []
+    attrs = []
+    pos = 0
+    while pos < len(dateformat):
+        char = dateformat[pos]
+        if char != '%':
+            parts.append(char)
+            pos += 1
+            continue
+        directive = dateformat[pos + 1:pos + 2]
+        if directive == '%':
+            parts.append('%%')
+        elif directive in _STRFTIME_DIRECTIVES:
+            attr, template = _STRFTIME_DIRECTIVES[directive]
+            attrs.append(attr)
+            parts.append(template)
+        else:
+            return lambda dt: dt.strftime(dateformat)
+        pos += 2
+    template = ''.join(parts)
+    getter = operator.attrgetter(*attrs) if attrs else lambda dt: ()
+
+    def strftime(dt):
+        # Dates and subclasses of datetime are formatted by their own strftime.
+        # strftime does not pad years before 1000 on all platforms
+        if type(dt) is datetime.datetime and dt.year >= 1000:
+            return template % getter(dt)
+        return dt.strftime(dateformat)
+    return strftime
+
+
 def from_datestring(datestring):
     """Parse an arbitrary datestring and return a datetime object using
     dateutils' parser.
@@ -234,53 +528,368 @@ def from_datestring(datestring):
     else:
         raise RuntimeError('from_datestring requires the python-dateutil library')
 
-def from_rfc(datestring, use_dateutil=True):
-    """Parse a RFC822-formatted datetime string and return a datetime object.
 
-    Use dateutil's parser if possible.
+class FixedOffset(datetime.tzinfo):
+    """Fixed offset from UTC, in minutes east of UTC. Returned by the ISO8601
+    and RFC822 parsers for offsets other than zero.
+    """
+
+    def __init__(self, minutes):
+        self._minutes = minutes
+        self._offset = datetime.timedelta(minutes=minutes)
+
+    def utcoffset(self, dt):
+        return self._offset
+
+    def tzname(self, dt):
+        sign = '-' if self._minutes < 0 else '+'
+        return '{0}{1:02d}:{2:02d}'.format(sign, *divmod(abs(self._minutes), 60))
+
+    def dst(self, dt):
+        return ZERO
+
+    def __reduce__(self):
+        return FixedOffset, (self._minutes,)
+
+    def __repr__(self):
+        return '<FixedOffset {0}>'.format(self.tzname(None))
 
-    https://stackoverflow.com/questions/885015/how-to-parse-a-rfc-2822-date-time-into-a-python-datetime
+
+# tzinfo objects by offset in minutes, shared by all parsed datetimes
+_offsets = {0: UTC}
+
+
+def _get_tzinfo(minutes):
+    try:
+        return _offsets[minutes]
+    except KeyError:
+        return _offsets.setdefault(minutes, FixedOffset(minutes))
+
+
+_iso_date = r'(\d{4})-(\d{2})-(\d{2})'
+_iso_time = r'(\d{2}):(\d{2})(?::(\d{2})(?:[.,](\d+))?)?'
+_iso_offset = r'(Z|[+-]\d{2}(?::?\d{2})?)?'
+
+_iso_datetime_re = re.compile(
+    r'^' + _iso_date + r'[T ]' + _iso_time + r'\s*' + _iso_offset + r'$', re.IGNORECASE)
+_iso_date_re = re.compile(r'^' + _iso_date + r'$')
+_iso_time_re = re.compile(r'^' + _iso_time + r'\s*' + _iso_offset + r'$', re.IGNORECASE)
+
+_rfc_months = dict((month, idx) for idx, month in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'],
+    start=1))
+# Offsets in hours of the named zones of RFC822
+_rfc_zones = {'ut': 0, 'utc': 0, 'gmt': 0, 'z': 0, 'est': -5, 'edt': -4, 'cst': -6,
+              'cdt': -5, 'mst': -7, 'mdt': -6, 'pst': -8, 'pdt': -7}
+
+_rfc_re = re.compile(
+    r'^\s*(?:(?:mon|tue|wed|thu|fri|sat|sun),\s*)?'
+    r'(\d{1,2})\s+([a-z]{3})\s+(\d{4}|\d{2})\s+'
+    r'(\d{2}):(\d{2})(?::(\d{2}))?\s*'
+    r'([+-]\d{4}|[a-z]{1,3})?\s*$',
+    re.IGNORECASE)
+
+
+def _parse_iso_offset(offset):
+    """Return the tzinfo for the ISO8601 UTC offset ``offset``, or `None`."""
+    if offset is None:
+        return None
+    if offset in ('Z', 'z'):
+        return UTC
+    minutes = int(offset[1:3]) * 60 + int(offset[-2:] if len(offset) > 3 else 0)
+    return _get_tzinfo(-minutes if offset[0] == '-' else minutes)
+
+
+def _parse_fraction(fraction):
+    """Return the microseconds of the decimal fraction of a second ``fraction``."""
+    if fraction is None:
+        return 0
+    # Digits beyond microseconds are truncated
+    return int(fraction[:6].ljust(6, '0'))
+
+
+def _match(regex, string):
+    """Return the match of ``regex`` for ``string``, or raise `ValueError`."""
+    if isinstance(string, binary_type):
+        string = string.decode('ascii')
+    match = regex.match(string)
+    if match is None:
+        raise ValueError('Invalid date string: {0!r}'.format(string))
+    return match
+
+
+def parse_iso(datestring):
+    """Parse an ISO8601-formatted datetime string, e.g.
+    ``'2014-12-22T03:12:58.019077+00:00'``, and return a datetime object.
+
+    The separator between the date and the time may be ``T`` or a space, the
+    seconds and the fraction of a second are optional and the UTC offset may
+    be ``Z``, ``+HH``, ``+HHMM`` or ``+HH:MM``. The result is timezone-aware
+    if and only if ``datestring`` has an offset.
+
+    :raise ValueError: If ``datestring`` is not a valid ISO8601 datetime.
+
+    .. versionadded:: 2.3.0
     """
-    # Use dateutil's parser if possible
-    if dateutil_available and use_dateutil:
-        return parser.parse(datestring)
+    (year, month, day, hour, minute, second,
+     fraction, offset) = _match(_iso_datetime_re, datestring).groups()
+    return datetime.datetime(
+        int(year), int(month), int(day), int(hour), int(minute),
+        int(second) if second else 0, _parse_fraction(fraction),
+        _parse_iso_offset(offset))
+
+
+def parse_iso_date(datestring):
+    """Parse an ISO8601-formatted date string, e.g. ``'2014-12-22'``, and return
+    a date object. The date of an ISO8601 datetime string is accepted too.
+
+    :raise ValueError: If ``datestring`` is not a valid ISO8601 date or datetime.
+
+    .. versionadded:: 2.3.0
+    """
+    if len(datestring) > 10:
+        return parse_iso(datestring).date()
+    year, month, day = _match(_iso_date_re, datestring).groups()
+    return datetime.date(int(year), int(month), int(day))
+
+
+def parse_iso_time(timestring):
+    """Parse an ISO8601-formatted time string, e.g. ``'03:12:58.019077'``, and
+    return a naive time object. A UTC offset is accepted but ignored.
+
+    :raise ValueError: If ``timestring`` is not a valid ISO8601 time.
+
+    .. versionadded:: 2.3.0
+    """
+    hour, minute, second, fraction, _ = _match(_iso_time_re, timestring).groups()
+    return datetime.time(int(hour), int(minute), int(second) if second else 0,
+                         _parse_fraction(fraction))
+
+
+def parse_rfc(datestring):
+    """Parse a RFC822-formatted datetime string, e.g.
+    ``'Sun, 10 Nov 2013 08:23:45 -0600'``, and return a datetime object.
+
+    The day of the week and the seconds are optional, two-digit years are
+    read as in RFC2822 and the zone may be a numeric offset or one of the
+    zone names of RFC822. The result is timezone-aware if and only if
+    ``datestring`` has a zone.
+
+    :raise ValueError: If ``datestring`` is not a valid RFC822 datetime.
+
+    .. versionadded:: 2.3.0
+    """
+    (day, month_name, year, hour, minute, second,
+     zone) = _match(_rfc_re, datestring).groups()
+    try:
+        month = _rfc_months[month_name.lower()]
+    except KeyError:
+        raise ValueError('Invalid month: {0!r}'.format(month_name))
+    year = int(year)
+    if year < 100:
+        year += 2000 if year < 50 else 1900
+    if zone is None:
+        tzinfo = None
+    elif zone[0] in '+-':
+        minutes = int(zone[1:3]) * 60 + int(zone[3:5])
+        tzinfo = _get_tzinfo(-minutes if zone[0] == '-' else minutes)
     else:
-        parsed = parsedate(datestring)  # as a tuple
-        timestamp = time.mktime(parsed)
-        return datetime.datetime.fromtimestamp(timestamp)
+        try:
+            tzinfo = _get_tzinfo(_rfc_zones[zone.lower()] * 60)
+        except KeyError:
+            raise ValueError('Invalid zone: {0!r}'.format(zone))
+    return datetime.datetime(year, month, int(day), int(hour), int(minute),
+                             int(second) if second else 0, 0, tzinfo)
+
+
+def _parse(func, string, use_dateutil, convert=None):
+    """Parse ``string`` with ``func``, falling back to dateutil's parser if
+    ``use_dateutil`` is `True` and dateutil is installed. ``convert`` is
+    applied to the datetime returned by dateutil's parser.
+    """
+    try:
+        return func(string)
+    except ValueError:
+        if dateutil_available and use_dateutil:
+            ret = parser.parse(string)
+            return convert(ret) if convert else ret
+        raise
+
+
+def from_rfc(datestring, use_dateutil=False):
+    """Parse a RFC822-formatted datetime string and return a datetime object.
+    See :func:`parse_rfc`.
 
+    :param bool use_dateutil: If `True`, strings that are not valid RFC822 are
+        parsed with dateutil's parser, if it is installed.
 
-def from_iso(datestring, use_dateutil=True):
+    .. versionchanged:: 2.3.0
+        dateutil's parser is only used if ``use_dateutil`` is `True`.
+    """
+    return _parse(parse_rfc, datestring, use_dateutil)
+
+
+def from_iso(datestring, use_dateutil=False):
     """Parse an ISO8601-formatted datetime string and return a datetime object.
+    The datetime is timezone-aware if ``datestring`` has a UTC offset. See
+    :func:`parse_iso`.
+
+    :param bool use_dateutil: If `True`, strings that are not valid ISO8601 are
+        parsed with dateutil's parser, if it is installed.
 
-    Use dateutil's parser if possible and return a timezone-aware datetime.
+    .. versionchanged:: 2.3.0
+        dateutil's parser is only used if ``use_dateutil`` is `True`.
     """
-    # Use dateutil's parser if possible
-    if dateutil_available and use_dateutil:
-        return parser.parse(datestring)
-    else:
-        # Strip off timezone info.
-        return datetime.datetime.strptime(datestring[:19], '%Y-%m-%dT%H:%M:%S')
+    return _parse(parse_iso, datestring, use_dateutil)
+
+
+def from_iso_time(timestring, use_dateutil=False):
+    """Parse an ISO8601-formatted time string and return a datetime.time
+    object. See :func:`parse_iso_time`.
 
+    :param bool use_dateutil: If `True`, strings that are not valid ISO8601 are
+        parsed with dateutil's parser, if it is installed.
 
-def from_iso_time(timestring, use_dateutil=True):
-    """Parse an ISO8601-formatted datetime string and return a datetime.time
-    object.
+    .. versionchanged:: 2.3.0
+        dateutil's parser is only used if ``use_dateutil`` is `True`.
     """
-    if dateutil_available and use_dateutil:
-        return parser.parse(timestring).time()
-    else:
-        if len(timestring) > 8:  # has microseconds
-            fmt = '%H:%M:%S.%f'
-        else:
-            fmt = '%H:%M:%S'
-        return datetime.datetime.strptime(timestring, fmt).time()
+    return _parse(parse_iso_time, timestring, use_dateutil, datetime.datetime.time)
+
+
+def from_iso_date(datestring, use_dateutil=False):
+    """Parse an ISO8601-formatted date string and return a datetime.date
+    object. See :func:`parse_iso_date`.
+
+    :param bool use_dateutil: If `True`, strings that are not valid ISO8601 are
+        parsed with dateutil's parser, if it is installed.
+
+    .. versionchanged:: 2.3.0
+        dateutil's parser is only used if ``use_dateutil`` is `True`.
+    """
+    return _parse(parse_iso_date, datestring, use_dateutil, datetime.datetime.date)
+
+
+# Clock used for the expiration of cache entries
+_clock = getattr(time, 'monotonic', time.time)
+
+CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class LRUCache(object):
+    """A thread-safe mapping of at most ``maxsize`` entries, which evicts its
+    least recently used entry to make room for a new one. The number of entries
+    of all instances together is also bounded by `LRUCache.total_maxsize`.
+
+    Only store immutable values: the same object is returned to every caller.
+
+    :param int maxsize: Maximum number of entries.
+    :param float ttl: If set, entries expire this many seconds after they are
+        stored.
+
+    .. versionadded:: 2.3.0
+    """
+    #: Maximum number of entries of all caches in the process
+    total_maxsize = 100000
+
+    _total_size = 0
+    _lock = threading.Lock()
+    # Weak references to the live caches. When a cache is garbage collected, its
+    # entries are queued in _released and subtracted from _total_size by the
+    # next call to `set`, since the lock may be held when the collection happens
+    _refs = set()
+    _released = []
+
+    def __init__(self, maxsize=1024, ttl=None):
+        if maxsize < 1:
+            raise ValueError('maxsize must be a positive integer.')
+        self.maxsize = maxsize
+        self.ttl = ttl
+        #: Number of calls to `get` that found the key
+        self.hits = 0
+        #: Number of calls to `get` that did not find the key
+        self.misses = 0
+        self._data = OrderedDict()
+        data = self._data
+        LRUCache._refs.add(weakref.ref(self, lambda ref: LRUCache._release(ref, data)))
+
+    @classmethod
+    def _release(cls, ref, data):
+        cls._refs.discard(ref)
+        cls._released.append(data)
+
+    def get(self, key, default=None):
+        """Return the value for ``key`` and mark it as the most recently used,
+        or return ``default`` if ``key`` is not cached.
+        """
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            if self.ttl is not None:
+                value, expires = value
+                if _clock() >= expires:
+                    LRUCache._total_size -= 1
+                    self.misses += 1
+                    return default
+                self._data[key] = (value, expires)
+            else:
+                self._data[key] = value
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """Cache ``value`` for ``key``, evicting the least recently used entry if
+        the cache, or all caches together, are full.
+        """
+        data = self._data
+        if self.ttl is not None:
+            value = (value, _clock() + self.ttl)
+        with self._lock:
+            released = LRUCache._released
+            while released:
+                LRUCache._total_size -= len(released.pop())
+            if key in data:
+                del data[key]
+                LRUCache._total_size -= 1
+            if len(data) >= self.maxsize or LRUCache._total_size >= self.total_maxsize:
+                if not data:
+                    # Other caches use up the whole process-wide budget
+                    return
+                data.popitem(last=False)
+                LRUCache._total_size -= 1
+            data[key] = value
+            LRUCache._total_size += 1
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            LRUCache._total_size -= len(self._data)
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def cache_info(self):
+        """Return the statistics of the cache as a named tuple of the form
+        (``hits``, ``misses``, ``maxsize``, ``currsize``), like the ``cache_info``
+        method of functions decorated with `functools.lru_cache`.
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        try:
+            value = self._data[key]
+        except KeyError:
+            return False
+        return self.ttl is None or _clock() < value[1]
+
+    def __repr__(self):
+        return '<LRUCache(hits={0}, misses={1}, maxsize={2}, currsize={3})>'.format(
+            *self.cache_info())
 
-def from_iso_date(datestring, use_dateutil=True):
-    if dateutil_available and use_dateutil:
-        return parser.parse(datestring).date()
-    else:
-        return datetime.datetime.strptime(datestring[:10], '%Y-%m-%d').date()
 
 def ensure_text_type(val):
     if isinstance(val, binary_type):
@@ -316,15 +925,17 @@ def _get_value_for_keys(keys, obj, default):
 
 
 def _get_value_for_key(key, obj, default):
-    try:
-        return obj[key]
-    except (KeyError, AttributeError, IndexError, TypeError):
+    # Objects without __getitem__ can only raise a TypeError here
+    if hasattr(obj, '__getitem__'):
         try:
-            attr = getattr(obj, key)
-            return attr() if callable(attr) else attr
-        except AttributeError:
-            return default
-    return default
+            return obj[key]
+        except (KeyError, AttributeError, IndexError, TypeError):
+            pass
+    try:
+        attr = getattr(obj, key)
+        return attr() if callable(attr) else attr
+    except AttributeError:
+        return default
 
 
 def callable_or_raise(obj):
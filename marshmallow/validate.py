@@ -3,19 +3,51 @@
 
 from __future__ import unicode_literals
 
+import collections
+import numbers
 import re
 from operator import attrgetter
 
 from marshmallow.compat import basestring, text_type, zip_longest
 from marshmallow.exceptions import ValidationError
+from marshmallow.utils import LRUCache
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Error message of values for which a validator returns False, the default
+# ``validator_failed`` message of fields
+_VALIDATOR_FAILED = 'Invalid value.'
+
+
+def _is_numeric_array(values):
+    return (
+        numpy is not None and isinstance(values, numpy.ndarray) and
+        values.ndim == 1 and values.dtype.kind in 'biuf'
+    )
+
+
+def _get_errors(values, indices, format_error):
+    """Return the dictionary returned by `Validator.validate_many` for the
+    invalid ``values`` at ``indices``.
+    """
+    if isinstance(values, numpy.ndarray if numpy is not None else ()):
+        # Format Python scalars rather than numpy ones
+        invalid = values[indices].tolist()
+    else:
+        invalid = [values[idx] for idx in indices]
+    return dict((idx, [format_error(value)]) for idx, value in zip(indices, invalid))
 
 
 class Validator(object):
     """Base abstract class for validators.
 
     .. note::
-        This class does not provide any behavior. It is only used to
-        add a useful `__repr__` implementation for validators.
+        This class only provides a useful `__repr__` implementation and a
+        default :meth:`validate_many`.
     """
 
     def __repr__(self):
@@ -33,6 +65,68 @@ class Validator(object):
         """
         return ''
 
+    def validate_many(self, values):
+        """Validate each value of the sequence ``values`` and return a dictionary
+        that maps the position of each invalid value to its list of error
+        messages. Subclasses may override this to validate all values at once.
+
+        As for the validators of fields, a value for which the validator returns
+        `False` is invalid.
+
+        .. versionadded:: 2.3.0
+        """
+        errors = {}
+        for idx, value in enumerate(values):
+            try:
+                if self(value) is False:
+                    errors[idx] = [_VALIDATOR_FAILED]
+            except ValidationError as err:
+                errors[idx] = err.messages
+        return errors
+
+
+# Immutable collections whose membership test may be replaced by a lookup in a
+# set of their hashable elements. Mutable choices are scanned on every call, so
+# that changes made to them after the validator is created are honoured
+_INDEXABLE_TYPES = (tuple, frozenset)
+
+
+class _Index(object):
+    """Membership test of ``iterable``, which looks up hashable values in a set
+    of the hashable elements of ``iterable`` instead of scanning it.
+    """
+
+    def __init__(self, iterable):
+        self.iterable = iterable
+        #: Number of occurrences of each hashable element, or `None` if
+        #: ``iterable`` isn't indexable
+        self.counts = None
+        #: Unhashable elements
+        self.unhashable = []
+        if isinstance(iterable, _INDEXABLE_TYPES):
+            self.counts = collections.Counter()
+            for each in iterable:
+                try:
+                    self.counts[each] += 1
+                except TypeError:
+                    self.unhashable.append(each)
+
+    def __contains__(self, value):
+        """Return whether ``value`` is an element of ``iterable``, or `False` if
+        membership can't be tested.
+        """
+        try:
+            if self.counts is None:
+                return value in self.iterable
+            try:
+                if value in self.counts:
+                    return True
+            except TypeError:  # Unhashable value
+                return value in self.unhashable
+            return bool(self.unhashable) and value in self.unhashable
+        except TypeError:
+            return False
+
 
 class URL(Validator):
     """Validate a URL.
@@ -175,6 +269,27 @@ class Range(Validator):
     def _format_error(self, value, message):
         return (self.error or message).format(input=value, min=self.min, max=self.max)
 
+    def _get_message(self, checked):
+        """Return the message for the invalid ``checked`` value or length."""
+        if self.min is not None and checked < self.min:
+            return self.message_min if self.max is None else self.message_all
+        return self.message_max if self.min is None else self.message_all
+
+    def _invalid_indices(self, checked):
+        """Return the indices of the values of ``checked`` that are out of range."""
+        min_, max_ = self.min, self.max
+        if _is_numeric_array(checked):
+            invalid = numpy.zeros(len(checked), dtype=bool)
+            if min_ is not None:
+                invalid |= checked < min_
+            if max_ is not None:
+                invalid |= checked > max_
+            return numpy.flatnonzero(invalid).tolist()
+        return [
+            idx for idx, value in enumerate(checked)
+            if (min_ is not None and value < min_) or (max_ is not None and value > max_)
+        ]
+
     def __call__(self, value):
         if self.min is not None and value < self.min:
             message = self.message_min if self.max is None else self.message_all
@@ -186,6 +301,16 @@ class Range(Validator):
 
         return value
 
+    def validate_many(self, values):
+        """Same as :meth:`Validator.validate_many`, with the values compared in a
+        single pass. Numeric `numpy` arrays are compared by `numpy`.
+        """
+        return _get_errors(
+            values,
+            self._invalid_indices(values),
+            lambda value: self._format_error(value, self._get_message(value)),
+        )
+
 
 class Length(Range):
     """Validator which succeeds if the value passed to it has a
@@ -217,6 +342,16 @@ class Length(Range):
 
         return value
 
+    def validate_many(self, values):
+        """Same as :meth:`Validator.validate_many`, with the lengths compared in a
+        single pass.
+        """
+        return _get_errors(
+            values,
+            self._invalid_indices([len(value) for value in values]),
+            lambda value: self._format_error(value, self._get_message(len(value))),
+        )
+
 
 class Equal(Validator):
     """Validator which succeeds if the ``value`` passed to it is
@@ -274,6 +409,14 @@ class Regexp(Validator):
 
         return value
 
+    def validate_many(self, values):
+        """Same as :meth:`Validator.validate_many`, with the values matched in a
+        single pass.
+        """
+        match = self.regex.match
+        indices = [idx for idx, value in enumerate(values) if match(value) is None]
+        return _get_errors(values, indices, self._format_error)
+
 
 class Predicate(Validator):
     """Call the specified ``method`` of the ``value`` object. The
@@ -312,7 +455,8 @@ class Predicate(Validator):
 class NoneOf(Validator):
     """Validator which fails if ``value`` is a member of ``iterable``.
 
-    :param iterable iterable: A sequence of invalid values.
+    :param iterable iterable: A sequence of invalid values. A tuple or frozenset
+        is indexed so that validating a value doesn't scan it.
     :param str error: Error message to raise in case of a validation error. Can be
         interpolated using `{input}` and `{values}`.
     """
@@ -324,6 +468,14 @@ class NoneOf(Validator):
         self.values_text = ', '.join(text_type(each) for each in self.iterable)
         self.error = error or self.default_message
 
+    @property
+    def iterable(self):
+        return self._index.iterable
+
+    @iterable.setter
+    def iterable(self, value):
+        self._index = _Index(value)
+
     def _repr_args(self):
         return 'iterable={0!r}'.format(self.iterable)
 
@@ -334,19 +486,25 @@ class NoneOf(Validator):
         )
 
     def __call__(self, value):
-        try:
-            if value in self.iterable:
-                raise ValidationError(self._format_error(value))
-        except TypeError:
-            pass
+        if value in self._index:
+            raise ValidationError(self._format_error(value))
 
         return value
 
+    def validate_many(self, values):
+        """Same as :meth:`Validator.validate_many`, without raising an exception
+        per invalid value.
+        """
+        index = self._index
+        indices = [idx for idx, value in enumerate(values) if value in index]
+        return _get_errors(values, indices, self._format_error)
+
 
 class OneOf(Validator):
     """Validator which succeeds if ``value`` is a member of ``choices``.
 
-    :param iterable choices: A sequence of valid values.
+    :param iterable choices: A sequence of valid values. A tuple or frozenset is
+        indexed so that validating a value doesn't scan it.
     :param iterable labels: Optional sequence of labels to pair with the choices.
     :param str error: Error message to raise in case of a validation error. Can be
         interpolated with `{input}`, `{choices}` and `{labels}`.
@@ -361,6 +519,14 @@ class OneOf(Validator):
         self.labels_text = ', '.join(text_type(label) for label in self.labels)
         self.error = error or self.default_message
 
+    @property
+    def choices(self):
+        return self._index.iterable
+
+    @choices.setter
+    def choices(self, value):
+        self._index = _Index(value)
+
     def _repr_args(self):
         return 'choices={0!r}, labels={1!r}'.format(self.choices, self.labels)
 
@@ -372,14 +538,24 @@ class OneOf(Validator):
         )
 
     def __call__(self, value):
-        try:
-            if value not in self.choices:
-                raise ValidationError(self._format_error(value))
-        except TypeError:
+        if value not in self._index:
             raise ValidationError(self._format_error(value))
 
         return value
 
+    def validate_many(self, values):
+        """Same as :meth:`Validator.validate_many`, without raising an exception
+        per invalid value. If ``values`` is a numeric `numpy` array and all
+        choices are real numbers, membership is tested by `numpy.isin`.
+        """
+        if (_is_numeric_array(values) and
+                all(isinstance(choice, numbers.Real) for choice in self.choices)):
+            valid = numpy.isin(values, list(self.choices))
+            return _get_errors(values, numpy.flatnonzero(~valid).tolist(), self._format_error)
+        index = self._index
+        indices = [idx for idx, value in enumerate(values) if value not in index]
+        return _get_errors(values, indices, self._format_error)
+
     def options(self, valuegetter=text_type):
         """Return a generator over the (value, label) pairs, where value
         is a string associated with each choice. This convenience method
@@ -413,6 +589,37 @@ class ContainsOnly(OneOf):
         return super(ContainsOnly, self)._format_error(value_text)
 
     def __call__(self, value):
+        counts = self._index.counts
+        if counts is None:
+            return self._validate_list(value)
+
+        if not value and self.choices:
+            raise ValidationError(self._format_error(value))
+
+        # Each choice may only be used once: count the occurrences of the
+        # hashable elements and remove the unhashable ones from a copy
+        used = collections.Counter()
+        unhashable = None
+        for val in value:
+            try:
+                used[val] += 1
+            except TypeError:
+                if unhashable is None:
+                    unhashable = list(self._index.unhashable)
+                try:
+                    del unhashable[unhashable.index(val)]
+                except ValueError:
+                    raise ValidationError(self._format_error(value))
+            else:
+                if used[val] > counts[val]:
+                    raise ValidationError(self._format_error(value))
+
+        return value
+
+    def _validate_list(self, value):
+        """Validate ``value`` against a list of the choices, for choices that
+        aren't indexed.
+        """
         choices = list(self.choices)
 
         if not value and choices:
@@ -429,3 +636,63 @@ class ContainsOnly(OneOf):
                 del choices[index]
 
         return value
+
+    # OneOf.validate_many tests the membership of each value, not of its elements
+    validate_many = Validator.validate_many
+
+
+class Cached(Validator):
+    """Validator which memoizes the outcome of another validator for each
+    input, so that repeated values are only validated once. Both successes and
+    failures are cached: a cached failure raises a new `ValidationError` with
+    the same messages. Unhashable inputs are always passed to ``validator``.
+
+    Only wrap validators whose outcome depends on the input alone.
+
+    :param callable validator: The validator to memoize.
+    :param int maxsize: Maximum number of cached inputs. The least recently
+        used input is forgotten first.
+    :param float ttl: If set, outcomes are forgotten this many seconds after
+        they were cached.
+
+    .. versionadded:: 2.3.0
+    """
+
+    def __init__(self, validator, maxsize=1024, ttl=None):
+        self.validator = validator
+        self.cache = LRUCache(maxsize, ttl=ttl)
+
+    def __repr__(self):
+        return '<{0}(validator={1!r}, maxsize={2!r}, ttl={3!r})>'.format(
+            self.__class__.__name__, self.validator, self.cache.maxsize, self.cache.ttl)
+
+    def __call__(self, value):
+        # Include the type so that equal values of distinct types, such as
+        # 1 and True, get their own outcome
+        key = (type(value), value)
+        try:
+            outcome = self.cache.get(key)
+        except TypeError:  # Unhashable value
+            return self.validator(value)
+        if outcome is None:
+            try:
+                outcome = (True, self.validator(value))
+            except ValidationError as error:
+                outcome = (False, (error.messages, error.field_names, error.kwargs))
+            self.cache.set(key, outcome)
+        valid, result = outcome
+        if valid:
+            return result
+        messages, field_names, kwargs = result
+        messages = messages.copy() if isinstance(messages, dict) else list(messages)
+        raise ValidationError(messages, list(field_names), **kwargs)
+
+    def cache_info(self):
+        """Return the statistics of the cache as a named tuple of the form
+        (``hits``, ``misses``, ``maxsize``, ``currsize``).
+        """
+        return self.cache.cache_info()
+
+    def cache_clear(self):
+        """Forget all cached outcomes and reset the statistics."""
+        self.cache.clear()
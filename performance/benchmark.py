@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""Simple benchmarks for marshmallow.
+
+Usage: ::
+
+    $ python performance/benchmark.py
+    $ python performance/benchmark.py --iterations 5000
+"""
+from __future__ import print_function, unicode_literals
+
+import argparse
+import datetime as dt
+import gc
+import timeit
+
+try:
+    import tracemalloc
+except ImportError:  # Python < 3.4
+    tracemalloc = None
+
+from marshmallow import Schema, fields, validate
+
+
+class AuthorSchema(Schema):
+    id = fields.Int(required=True)
+    first_name = fields.Str(required=True)
+    last_name = fields.Str(required=True)
+    email = fields.Email()
+    homepage = fields.Url()
+    created = fields.DateTime()
+
+
+class QuoteSchema(Schema):
+    id = fields.Int(required=True)
+    author = fields.Nested(AuthorSchema)
+    content = fields.Str(required=True, validate=validate.Length(max=500))
+    tags = fields.List(fields.Str())
+    score = fields.Float()
+    posted_at = fields.DateTime()
+    book_title = fields.Str()
+    page_number = fields.Int()
+    line_number = fields.Int()
+    col_number = fields.Int()
+
+
+def make_quote(i):
+    return {
+        'id': i,
+        'author': {
+            'id': i,
+            'first_name': 'Foo',
+            'last_name': 'Bar',
+            'email': 'foo@bar.com',
+            'homepage': 'http://foo.com',
+            'created': dt.datetime(2015, 10, 26, 12),
+        },
+        'content': 'Everything is awesome.',
+        'tags': ['cool', 'awesome'],
+        'score': 4.2,
+        'posted_at': dt.datetime(2015, 10, 27, 12),
+        'book_title': 'The Book',
+        'page_number': 42,
+        'line_number': 7,
+        'col_number': 1,
+    }
+
+
+def instantiate():
+    schema = QuoteSchema(only=('id', 'author', 'content'))
+    # Access the nested schema so that it is instantiated as well
+    schema.fields['author'].schema
+    return schema
+
+
+def run_timeit(func, iterations, repeat=3):
+    best = min(timeit.repeat(func, number=iterations, repeat=repeat))
+    return best / iterations * 1e6
+
+
+def memory_per_instance(iterations):
+    """Return the number of bytes allocated per schema instance, or `None` if
+    tracemalloc is unavailable.
+    """
+    if tracemalloc is None:
+        return None
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    instances = [instantiate() for _ in range(iterations)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del instances
+    return size / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run marshmallow benchmarks.')
+    parser.add_argument('--iterations', type=int, default=1000,
+                        help='Number of iterations of each benchmark.')
+    args = parser.parse_args()
+    iterations = args.iterations
+
+    print('Schema instantiation: {0:.2f} usec/instance'.format(
+        run_timeit(instantiate, iterations)))
+    size = memory_per_instance(iterations)
+    if size is not None:
+        print('Schema memory: {0:.0f} bytes/instance'.format(size))
+
+    quotes = [make_quote(i) for i in range(iterations)]
+    schema = QuoteSchema(many=True)
+    print('Dump: {0:.2f} usec/object'.format(
+        run_timeit(lambda: schema.dump(quotes), 1) / iterations))
+    data = schema.dump(quotes).data
+    print('Load: {0:.2f} usec/object'.format(
+        run_timeit(lambda: schema.load(data), 1) / iterations))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,576 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import datetime as dt
+import json
+import uuid
+from collections import namedtuple
+
+from marshmallow import Schema, fields, validate, utils, post_dump
+from marshmallow.compiler import (
+    compile_serializer, compile_json_serializer, compile_deserializer, compile_validator,
+    can_validate_many, can_serialize_many,
+    get_accessor_strategy, MAPPING, ATTRIBUTE
+)
+from marshmallow.marshalling import Marshaller, Unmarshaller
+from marshmallow.exceptions import ValidationError
+
+from tests.base import User, UserSchema, UserMetaSchema, BlogSchema
+
+
+def generic_dump(schema, obj, many=False):
+    marshal = Marshaller(prefix=schema.prefix)
+    try:
+        data = marshal(obj, schema.fields, many=many,
+                       accessor=schema.get_attribute,
+                       dict_class=schema.dict_class)
+    except ValidationError as err:
+        data = err.data
+    return data, marshal.errors
+
+
+def compiled_dump(schema, obj, many=False, obj_type=None):
+    marshal = Marshaller(prefix=schema.prefix)
+    try:
+        data = marshal(obj, schema.fields, many=many,
+                       accessor=schema.get_attribute,
+                       dict_class=schema.dict_class,
+                       serializer=schema._compile_dump(obj_type))
+    except ValidationError as err:
+        data = err.data
+    return data, marshal.errors
+
+
+Point = namedtuple('Point', ['name', 'age', 'address'])
+
+
+class Dummy(object):
+    age = 42
+
+    @property
+    def address(self):
+        raise AttributeError('address')
+
+    def name(self):
+        return 'Dummy'
+
+    def keys(self):
+        raise AttributeError('keys')
+
+
+class DottedSchema(Schema):
+    name = fields.Str()
+    age = fields.Int()
+    city = fields.Str(attribute='address.city')
+    address_name = fields.Raw(attribute='address.name')
+    keys = fields.Raw()
+
+
+class TestAccessorStrategy:
+
+    @pytest.mark.parametrize(('obj_type', 'expected'), [
+        (dict, MAPPING),
+        (Point, ATTRIBUTE),
+        (User, ATTRIBUTE),
+        (tuple, None),
+        (list, None),
+    ])
+    def test_get_accessor_strategy(self, obj_type, expected):
+        assert get_accessor_strategy(obj_type) == expected
+
+
+class TestCompileSerializer:
+
+    @pytest.mark.parametrize('SchemaClass', [UserSchema, UserMetaSchema, BlogSchema])
+    def test_compiled_output_matches_generic_output(self, SchemaClass, blog):
+        obj = blog if SchemaClass is BlogSchema else blog.user
+        schema = SchemaClass()
+        schema._update_fields(obj)
+        assert compiled_dump(schema, obj) == generic_dump(schema, obj)
+
+    def test_compiled_errors_match_generic_errors(self):
+        users = [User('Monty', age='badage', email='invalid'),
+                 User('Mick', email='mick@stones.com')]
+        schema = UserSchema(many=True)
+        data, errors = compiled_dump(schema, users, many=True)
+        assert (data, errors) == generic_dump(schema, users, many=True)
+        assert set(errors[0]) == set(['age', 'email', 'is_old'])
+        assert 1 not in errors
+
+    def test_prefix_dump_to_and_load_only(self):
+        fields_dict = {
+            'name': fields.String(dump_to='NaMe'),
+            'email': fields.Email(load_only=True),
+        }
+        serialize = compile_serializer(fields_dict, prefix='usr_')
+        marshal = Marshaller()
+        result = serialize(User('Mick', email='mick@stones.com'), Schema().get_attribute,
+                           dict, marshal.store_error, None)
+        assert result == {'usr_NaMe': 'Mick'}
+
+    def test_defaults(self):
+        fields_dict = {
+            'missing': fields.Field(),
+            'default': fields.Integer(default=42),
+            'callable_default': fields.String(default=lambda: 'called'),
+        }
+        serialize = compile_serializer(fields_dict)
+        marshal = Marshaller()
+        result = serialize({}, Schema().get_attribute, dict, marshal.store_error, None)
+        assert result == {'default': 42, 'callable_default': 'called'}
+
+    def test_inlined_formatters(self):
+        fields_dict = {
+            'string': fields.String(),
+            'bytes': fields.String(),
+            'integer': fields.Integer(),
+            'float': fields.Float(),
+            'none': fields.Integer(),
+        }
+        data = {'string': 'foo', 'bytes': b'bar', 'integer': '42', 'float': 4,
+                'none': None}
+        serialize = compile_serializer(fields_dict)
+        marshal = Marshaller()
+        result = serialize(data, Schema().get_attribute, dict, marshal.store_error, None)
+        assert result == {'string': 'foo', 'bytes': 'bar', 'integer': 42,
+                          'float': 4.0, 'none': None}
+        assert type(result['float']) is float
+
+    @pytest.mark.parametrize('SchemaClass', [UserSchema, UserMetaSchema, BlogSchema])
+    def test_typed_output_matches_generic_output(self, SchemaClass, blog):
+        obj = blog if SchemaClass is BlogSchema else blog.user
+        schema = SchemaClass()
+        schema._update_fields(obj)
+        assert (compiled_dump(schema, obj, obj_type=type(obj)) ==
+                generic_dump(schema, obj))
+
+    def test_can_serialize_many(self):
+        class MyInteger(fields.Integer):
+            def _format_num(self, value):
+                return int(value) * 2
+
+        assert can_serialize_many(fields.Integer())
+        assert can_serialize_many(fields.Decimal())
+        assert can_serialize_many(fields.DateTime())
+        # Email validates the value in _validated
+        assert not can_serialize_many(fields.Email())
+        assert not can_serialize_many(MyInteger())
+
+    @pytest.mark.parametrize('obj', [
+        {'name': 'Mick', 'age': 42, 'address': {'city': 'London'}},
+        {'keys': 'x', 'age': 'bad'},
+        Point(name='Mick', age=42, address=Point(name='home', age=1, address=None)),
+        Point(name=None, age=None, address={'city': 'London'}),
+        User('Mick', age=42),
+        Dummy(),
+    ])
+    def test_accessor_strategies(self, obj):
+        schema = DottedSchema()
+        for obj_type in (type(obj), dict, User):
+            assert (compiled_dump(schema, obj, obj_type=obj_type) ==
+                    generic_dump(schema, obj))
+
+    def test_inlined_formatter_errors(self):
+        serialize = compile_serializer({'age': fields.Integer()})
+        marshal = Marshaller()
+        result = serialize({'age': 'bad'}, Schema().get_attribute, dict,
+                           marshal.store_error, 3)
+        assert result == {}
+        assert marshal.errors == {3: {'age': ['Not a valid integer.']}}
+
+
+class JSONSchema(Schema):
+    name = fields.Str(dump_to='"quoted" name')
+    nickname = fields.Str(default=None)
+    age = fields.Int()
+    score = fields.Float()
+    ratio = fields.Number(as_string=True)
+    active = fields.Boolean()
+    created = fields.DateTime()
+    uid = fields.UUID()
+    tags = fields.List(fields.Str())
+    data = fields.Dict()
+    nested = fields.Nested('self', only=('name', 'age'), many=True)
+    raw = fields.Raw()
+    password = fields.Str(load_only=True)
+
+    class Meta:
+        ordered = True
+
+
+def json_dumps_both(obj, prefix='', obj_type=None):
+    schema = JSONSchema()
+    results = []
+    for compile_func in (compile_serializer, compile_json_serializer):
+        serialize = compile_func(schema.fields, prefix=prefix, obj_type=obj_type)
+        marshal = Marshaller()
+        result = serialize(obj, schema.get_attribute, schema.dict_class,
+                           marshal.store_error, None)
+        results.append((result, marshal.errors))
+    (data, errors), encoded = results
+    return json.dumps(data), encoded[0], errors, encoded[1]
+
+
+class TestCompileJSONSerializer:
+
+    @pytest.mark.parametrize('obj', [
+        {},
+        {'name': 'Mick', 'age': 42, 'score': 4.2, 'ratio': 0.5, 'active': 'yes',
+         'created': dt.datetime(2015, 10, 26, 12, 30), 'uid': uuid.UUID(int=1),
+         'tags': ['a', 'b'], 'data': {'k': [1, None]}, 'raw': (1, 2), 'password': 'x',
+         'nested': [{'name': 'Keith', 'age': 41}]},
+        {'name': 'Mïck "Jagger"\n', 'nickname': 'M', 'age': True, 'score': float('nan'),
+         'active': None, 'created': None, 'uid': None, 'nested': None, 'raw': None},
+        {'score': float('inf'), 'age': '42', 'active': 0},
+        {'score': float('-inf'), 'age': 'bad', 'created': 'bad', 'uid': 'bad',
+         'nested': [{'age': 'bad'}]},
+    ])
+    @pytest.mark.parametrize('obj_type', [None, dict])
+    def test_output_matches_json_dumps(self, obj, obj_type):
+        expected, encoded, expected_errors, errors = json_dumps_both(obj, obj_type=obj_type)
+        assert encoded == expected
+        assert errors == expected_errors
+
+    def test_prefix(self):
+        expected, encoded, _, _ = json_dumps_both({'name': 'Mick'}, prefix='usr_')
+        assert encoded == expected
+        assert json.loads(encoded)['usr_"quoted" name'] == 'Mick'
+
+
+def sort_messages(errors):
+    if isinstance(errors, dict):
+        return dict((key, sort_messages(value)) for key, value in errors.items())
+    return sorted(errors)
+
+
+def unmarshal_both(fields_dict, data, many=False, partial=False, index_errors=True,
+                   validate_many=False):
+    results = []
+    deserializer = compile_deserializer(fields_dict, validate_many=validate_many)
+    for deserializer in (None, deserializer):
+        unmarshal = Unmarshaller()
+        try:
+            data_ = unmarshal(data, fields_dict, many=many, partial=partial,
+                              index_errors=index_errors, deserializer=deserializer,
+                              validate_many=validate_many and deserializer is not None)
+        except ValidationError as err:
+            data_ = err.data
+        if validate_many:
+            # Errors of deferred validators are stored after the other errors, so
+            # the order of merged messages and of the field names may differ
+            results.append((data_, sort_messages(unmarshal.errors)))
+        else:
+            results.append((data_, unmarshal.errors, unmarshal.error_field_names))
+    return results
+
+
+class TestCompileDeserializer:
+
+    @pytest.fixture
+    def fields_dict(self):
+        return {
+            'name': fields.String(required=True),
+            'age': fields.Integer(validate=validate.Range(min=18)),
+            'email': fields.Email(load_from='EmailAddress', attribute='email_address'),
+            'nickname': fields.Str(missing='anonymous'),
+            'tags': fields.List(fields.Str(), missing=list),
+            'score': fields.Float(allow_none=True),
+            'homepage': fields.Url(dump_only=True),
+            'active': fields.Boolean(),
+            'raw': fields.Raw(),
+        }
+
+    @pytest.mark.parametrize('data', [
+        {'name': 'Mick', 'age': '42', 'EmailAddress': 'mick@stones.com', 'score': None},
+        {'name': 'Mick', 'email': 'mick@stones.com', 'EmailAddress': 'invalid'},
+        {'name': 42, 'age': '12', 'EmailAddress': 'invalid', 'score': 'bad', 'active': 'no'},
+        {'name': None, 'age': None, 'nickname': b'bytes', 'raw': [1, 2], 'homepage': 'x'},
+        {},
+        'not a dict',
+    ])
+    @pytest.mark.parametrize('partial', [False, True])
+    @pytest.mark.parametrize('validate_many', [False, True])
+    def test_compiled_results_match_generic_results(self, fields_dict, data, partial,
+                                                    validate_many):
+        generic, compiled = unmarshal_both(fields_dict, data, partial=partial,
+                                           validate_many=validate_many)
+        assert compiled == generic
+
+    @pytest.mark.parametrize('index_errors', [False, True])
+    @pytest.mark.parametrize('validate_many', [False, True])
+    def test_compiled_many_results_match_generic_results(self, fields_dict, index_errors,
+                                                         validate_many):
+        data = [{'name': 'Mick', 'age': '12'}, None, 'not a dict', {'age': 'bad'},
+                {'name': 'Keith', 'age': 17, 'EmailAddress': 'invalid'},
+                {'name': 'Ron', 'age': 70, 'email': 'ron@stones.com'}]
+        generic, compiled = unmarshal_both(fields_dict, data, many=True,
+                                           index_errors=index_errors,
+                                           validate_many=validate_many)
+        assert compiled == generic
+
+    def test_validate_many_skips_deferred_validators(self, fields_dict):
+        source = compile_deserializer(fields_dict).__source__
+        batched_source = compile_deserializer(fields_dict, validate_many=True).__source__
+        # The validators of age and email are deferred
+        assert (batched_source.count('validation_error_') ==
+                source.count('validation_error_') - 2)
+        assert can_validate_many(fields_dict['age'])
+        assert not can_validate_many(fields_dict['name'])
+
+    def test_validate_many_with_custom_validators(self):
+        calls = []
+
+        def validator(value):
+            calls.append(value)
+            return value != 'invalid'
+
+        fields_dict = {
+            'name': fields.Str(validate=[validator, validate.Length(max=3)]),
+            'flag': fields.Raw(validate=validate.OneOf([True, False])),
+        }
+        data = [{'name': 'invalid', 'flag': False}, {'name': 'ok', 'flag': True}]
+        generic, compiled = unmarshal_both(fields_dict, data, many=True, validate_many=True)
+        assert compiled == generic
+        assert compiled[1][0] == {
+            'name': ['Invalid value.', 'Longer than maximum length 3.'],
+            # OneOf returns the value, and False is treated as a failed validation
+            'flag': ['Invalid value.'],
+        }
+
+    def test_missing_callable_is_called_for_each_item(self, fields_dict):
+        deserialize = compile_deserializer(fields_dict)
+        unmarshal = Unmarshaller()
+        args = (False, dict, unmarshal.store_error, unmarshal._store_type_error, None, None)
+        first = deserialize({'name': 'Mick'}, *args)
+        second = deserialize({'name': 'Keith'}, *args)
+        assert first['tags'] == [] and second['tags'] == []
+        assert first['tags'] is not second['tags']
+
+    def test_nested_schema_errors_match(self):
+        fields_dict = {'user': fields.Nested(UserSchema, required=True),
+                       'blogs': fields.Nested(BlogSchema, many=True)}
+        data = {'blogs': [{'title': 42, 'user': {'age': 'bad'}}]}
+        generic, compiled = unmarshal_both(fields_dict, data)
+        assert compiled == generic
+
+
+class TestCompileValidator:
+
+    @pytest.mark.parametrize('data', [
+        {'name': 'Mick', 'age': '42', 'EmailAddress': 'mick@stones.com', 'score': None},
+        {'name': 42, 'age': '12', 'EmailAddress': 'invalid', 'score': 'bad', 'active': 'no'},
+        {'name': None, 'age': None, 'nickname': b'bytes', 'raw': [1, 2]},
+        {},
+        'not a dict',
+    ])
+    @pytest.mark.parametrize('partial', [False, True])
+    def test_errors_match_deserializer_errors(self, data, partial):
+        fields_dict = {
+            'name': fields.String(required=True),
+            'age': fields.Integer(validate=validate.Range(min=18)),
+            'email': fields.Email(load_from='EmailAddress', attribute='email_address'),
+            'nickname': fields.Str(missing='anonymous'),
+            'score': fields.Float(allow_none=True),
+            'active': fields.Boolean(),
+            'raw': fields.Raw(),
+        }
+        expected = Unmarshaller()
+        expected.collect(data, fields_dict, partial=partial)
+        for validator in (None, compile_validator(fields_dict)):
+            unmarshal = Unmarshaller()
+            errors = unmarshal.validate(data, fields_dict, partial=partial,
+                                        validator=validator)
+            assert errors == expected.errors
+            assert unmarshal.error_field_names == expected.error_field_names
+
+    def test_generated_function_builds_no_output(self):
+        fields_dict = {'name': fields.Str(attribute='username'), 'age': fields.Int()}
+        source = compile_validator(fields_dict).__source__
+        assert 'dict_class' not in source
+        assert 'key_' not in source
+
+
+class TestSchemaCompile:
+
+    def test_compile_generates_functions(self, user):
+        schema = UserSchema()
+        schema.compile()
+        assert callable(schema._serializer)
+        assert callable(schema._deserializer)
+
+    def test_dump_many_compiles_schema(self, user):
+        schema = UserSchema(many=True)
+        assert not schema._typed_serializers
+        schema.dump([user, user])
+        assert schema._typed_serializers[User] is not None
+
+    def test_dump_compiles_reused_schema(self, user):
+        schema = UserSchema()
+        schema.dump(user)
+        assert not schema._typed_serializers
+        schema.dump(user)
+        serialize = schema._typed_serializers[User]
+        schema.dump(user)
+        assert schema._typed_serializers[User] is serialize
+
+    def test_serializers_are_kept_for_a_bounded_number_of_types(self):
+        class NameSchema(Schema):
+            name = fields.Str()
+
+        schema = NameSchema(many=True)
+        max_types = schema._MAX_TYPED_SERIALIZERS
+        types = [type('Named{0}'.format(i), (object, ), {'name': 'x'})
+                 for i in range(max_types + 2)]
+        for each in types:
+            assert schema.dump([each()]).data == [{'name': 'x'}]
+            assert schema.dumps([each()]).data == '[{"name": "x"}]'
+        assert list(schema._typed_serializers) == types[2:]
+        assert list(schema._json_serializers) == types[2:]
+
+    def test_changing_fields_discards_serializer(self, user):
+        schema = UserSchema(many=True)
+        schema.dump([user])
+        serialize = schema._typed_serializers[User]
+        schema.exclude = ('name', )
+        data = schema.dump([user]).data
+        assert 'name' not in data[0]
+        assert schema._typed_serializers[User] is not serialize
+
+    def test_load_many_compiles_schema(self):
+        schema = UserSchema(many=True)
+        result = schema.load([{'name': 'Mick', 'age': 'bad'}, {'name': 'Keith'}])
+        assert schema._deserializer is not None
+        assert result.errors == {0: {'age': ['Not a valid number.']}}
+
+    def test_load_compiles_reused_schema(self):
+        schema = UserSchema()
+        schema.load({'name': 'Mick'})
+        assert schema._deserializer is None
+        schema.load({'name': 'Mick'})
+        deserialize = schema._deserializer
+        assert deserialize is not None
+        result = schema.load({'name': 'Keith', 'email': 'invalid'})
+        assert schema._deserializer is deserialize
+        assert result.errors == {'email': ['Not a valid email address.']}
+
+    def test_dump_reads_fields_changed_after_compiling(self):
+        class MySchema(Schema):
+            x = fields.Int()
+            y = fields.Str()
+
+        schema = MySchema()
+        objs = [{'x': 1, 'z': 'a'}, {'x': 2, 'z': 'b'}]
+        for _ in range(2):
+            schema.dump(objs, many=True)
+            schema.dumps(objs, many=True)
+        assert schema._serializer is not None or schema._typed_serializers
+        schema.fields['y'].default = 'none'
+        schema.fields['x'].dump_to = 'X'
+        assert schema.dump(objs, many=True).data == [
+            {'X': 1, 'y': 'none'}, {'X': 2, 'y': 'none'}]
+        schema.fields['y'].attribute = 'z'
+        assert schema.dump(objs[0]).data == {'X': 1, 'y': 'a'}
+        assert json.loads(schema.dumps(objs, many=True).data) == [
+            {'X': 1, 'y': 'a'}, {'X': 2, 'y': 'b'}]
+
+    def test_load_reads_fields_changed_after_compiling(self):
+        class MySchema(Schema):
+            x = fields.Int()
+            y = fields.Int()
+
+        schema = MySchema()
+        data = [{'x': 1, 'y': None}, {'X': 2}]
+        for _ in range(2):
+            schema.load(data, many=True)
+            schema.validate(data, many=True)
+        assert schema._deserializer is not None and schema._validator is not None
+        schema.fields['x'].load_from = 'X'
+        schema.fields['x'].required = True
+        schema.fields['y'].allow_none = True
+        schema.fields['y'].missing = 5
+        schema.fields['y'].validators = [validate.Range(max=4)]
+        result = schema.load(data, many=True)
+        assert result.data == [{'x': 1, 'y': None}, {'x': 2}]
+        assert result.errors == {1: {'y': ['Must be at most 4.']}}
+        assert schema.validate(data, many=True) == result.errors
+        assert schema.load({'y': 3}).errors == {'X': ['Missing data for required field.']}
+
+    def test_implicit_fields_keep_serializer(self, user):
+        schema = UserMetaSchema(many=True)
+        schema.dump([user])
+        serialize = schema._typed_serializers[User]
+        schema.dump([user])
+        assert schema._typed_serializers[User] is serialize
+
+    @pytest.mark.parametrize('many', [False, True])
+    def test_dumps_encodes_json_directly(self, many):
+        schema = JSONSchema(many=many)
+        obj = {'name': 'Mick', 'age': 42, 'nested': [{'name': 'Keith'}]}
+        if many:
+            obj = [obj, {'age': 'bad'}]
+        for _ in range(2):
+            data, errors = schema.dumps(obj)
+            expected = schema.dump(obj)
+            assert data == json.dumps(expected.data)
+            assert errors == expected.errors
+        assert schema._json_serializers
+
+    def test_dumps_encodes_timestamps(self):
+        class TimestampSchema(Schema):
+            created = fields.DateTime(format='timestamp')
+
+        schema = TimestampSchema(many=True)
+        objs = [{'created': dt.datetime(2013, 11, 10, 1, 23, 45)}, {'created': None}]
+        assert schema.dumps(objs).data == json.dumps(schema.dump(objs).data)
+        assert schema._json_serializers
+
+    def test_dumps_encodes_defaults_of_other_types(self):
+        class DefaultsSchema(Schema):
+            a = fields.Float(default=0)
+            b = fields.String(default=5)
+            c = fields.Integer(default='n/a')
+            d = fields.Boolean(default=lambda: 'yes')
+            e = fields.DateTime(format='timestamp', default='never')
+
+        schema = DefaultsSchema(many=True)
+        objs = [{}, {'a': 1.5, 'b': 'x', 'c': 2, 'd': True}]
+        data, errors = schema.dumps(objs)
+        assert json.loads(data) == schema.dump(objs).data
+        assert data == json.dumps(schema.dump(objs).data)
+        assert not errors
+        assert schema._json_serializers
+
+    def test_dumps_strict_raises(self):
+        schema = JSONSchema(strict=True, many=True)
+        with pytest.raises(ValidationError) as excinfo:
+            schema.dumps([{'age': 'bad'}])
+        assert excinfo.value.messages == {0: {'age': ['Not a valid integer.']}}
+
+    def test_dumps_with_post_dump_uses_dump(self):
+        class MySchema(JSONSchema):
+            @post_dump
+            def add_envelope(self, data):
+                data['enveloped'] = True
+                return data
+
+        schema = MySchema(many=True)
+        data = schema.dumps([{'name': 'Mick'}]).data
+        assert json.loads(data)[0]['enveloped'] is True
+        assert not schema._json_serializers
+
+    def test_dumps_with_arguments_uses_dump(self):
+        schema = JSONSchema(many=True)
+        data = schema.dumps([{'name': 'Mick'}], indent=2).data
+        assert data == json.dumps(schema.dump([{'name': 'Mick'}]).data, indent=2)
+        assert not schema._json_serializers
+
+    def test_custom_accessor_disables_typed_serializers(self, user):
+        class MySchema(UserSchema):
+            def get_attribute(self, attr, obj, default):
+                return utils.get_value(attr, obj, default)
+
+        schema = MySchema(many=True)
+        schema.dump([user])
+        assert not schema._typed_serializers
+        assert schema._serializer is not None
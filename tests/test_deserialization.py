@@ -323,10 +323,16 @@ class TestFieldDeserialization:
         assert_datetime_equal(field.deserialize(datestring), dtime)
 
         field = fields.DateTime()
+        with pytest.raises(ValidationError) as excinfo:
+            field.deserialize(datestring)
+        assert msg in str(excinfo)
+
+        field = fields.DateTime(use_dateutil=True)
         if utils.dateutil_available:
             assert_datetime_equal(field.deserialize(datestring), dtime)
         else:
-            assert msg in str(excinfo)
+            with pytest.raises(ValidationError):
+                field.deserialize(datestring)
 
     @pytest.mark.parametrize('fmt', ['rfc', 'rfc822'])
     def test_rfc_datetime_field_deserialization(self, fmt):
@@ -352,6 +358,37 @@ class TestFieldDeserialization:
         if utils.dateutil_available:
             assert result.tzinfo is not None
 
+    @pytest.mark.parametrize(('fmt', 'value'), [
+        ('timestamp', 1384046625),
+        ('timestamp', 1384046625.5),
+        ('timestamp_ms', 1384046625500),
+        ('timestamp_us', 1384046625500000),
+    ])
+    def test_timestamp_datetime_field_deserialization(self, fmt, value):
+        field = fields.DateTime(format=fmt)
+        result = field.deserialize(value)
+        expected = dt.datetime(2013, 11, 10, 1, 23, 45, tzinfo=utils.UTC)
+        assert result.tzinfo is not None
+        assert result.replace(microsecond=0) == expected
+        assert field.deserialize(0) == dt.datetime(1970, 1, 1, tzinfo=utils.UTC)
+
+    @pytest.mark.parametrize('value', ['1384046625', None, True, [], 10 ** 20])
+    def test_invalid_timestamp_datetime_field_deserialization(self, value):
+        field = fields.DateTime(format='timestamp', allow_none=False)
+        with pytest.raises(ValidationError) as excinfo:
+            field.deserialize(value)
+        assert excinfo.value.messages == [
+            'Field may not be null.' if value is None else 'Not a valid datetime.']
+
+    def test_timestamp_date_and_time_field_deserialization(self):
+        assert fields.Date(format='timestamp').deserialize(1384046625) == dt.date(2013, 11, 10)
+        field = fields.Time(format='timestamp_ms')
+        assert field.deserialize(5025006) == dt.time(1, 23, 45, 6000)
+        assert field.deserialize(0) == dt.time(0)
+        for value in (-1, 86400000, 'bad'):
+            with pytest.raises(ValidationError):
+                field.deserialize(value)
+
     def test_time_field_deserialization(self):
         field = fields.Time()
         t = dt.time(1, 23, 45)
@@ -580,6 +617,51 @@ class TestFieldDeserialization:
             field.deserialize(['good', 42])
         assert excinfo.value.args[0] == 'Not a valid string.'
 
+    @pytest.mark.parametrize(('container', 'values', 'expected'), [
+        (fields.Int(), [1, '2', 3.5], [1, 2, 3]),
+        (fields.Float(), [1, 2.5], [1.0, 2.5]),
+        (fields.Str(), ['a', 'b'], ['a', 'b']),
+        (fields.UUID(), [str(uuid.UUID(int=1))], [uuid.UUID(int=1)]),
+        (fields.Int(allow_none=True), [1, None], [1, None]),
+    ])
+    def test_list_field_deserialize_primitive_containers(self, container, values, expected):
+        result = fields.List(container).deserialize(values)
+        assert result == expected
+        assert all(type(each) is type(exp) for each, exp in zip(result, expected))
+
+    @pytest.mark.parametrize(('container', 'values', 'message'), [
+        (fields.Int(), [1, None, 'a'], 'Field may not be null.'),
+        (fields.Int(), [1, 'a', None], 'Not a valid integer.'),
+        (fields.UUID(), ['a'], 'Not a valid UUID.'),
+        (fields.Int(validate=validate.Range(max=1)), [1, 2, 'a'],
+         'Must be at most 1.'),
+    ])
+    def test_list_field_deserialize_primitive_containers_raises_first_error(
+            self, container, values, message):
+        with pytest.raises(ValidationError) as excinfo:
+            fields.List(container).deserialize(values)
+        assert excinfo.value.messages == [message]
+
+    @pytest.mark.parametrize('container', [fields.Int(), fields.Float(), fields.UUID()])
+    def test_list_field_deserialize_primitive_containers_with_null(self, container):
+        field = fields.List(container)
+        with pytest.raises(ValidationError) as excinfo:
+            field.deserialize([None])
+        assert excinfo.value.messages == ['Field may not be null.']
+
+        class MySchema(Schema):
+            ids = fields.List(container)
+
+        values = [str(uuid.UUID(int=1))] if isinstance(container, fields.UUID) else [1]
+        data, errors = MySchema().load({'ids': values + [None]})
+        assert errors == {'ids': ['Field may not be null.']}
+
+    def test_deserialize_many_reports_errors_per_index(self):
+        results, errors = fields.Int()._deserialize_many([1, 'a', '3', 'b'], None, None)
+        assert results[0] == 1 and results[2] == 3
+        assert sorted(errors) == [1, 3]
+        assert errors[1].messages == ['Not a valid integer.']
+
     @pytest.mark.parametrize('value',
     [
         'notalist',
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 import pytest
 
-from marshmallow import fields, Schema, ValidationError
+from marshmallow import fields, utils, Schema, ValidationError
 from marshmallow.marshalling import missing
 
 from tests.base import ALL_FIELDS, User
@@ -165,3 +165,108 @@ class TestErrorMessages:
 
         assert 'doesntexist' in excinfo.value.args[0]
         assert 'MyField' in excinfo.value.args[0]
+
+
+def test_make_error_returns_validation_error():
+    field = fields.Integer()
+    error = field.make_error('invalid')
+    assert isinstance(error, ValidationError)
+    assert error.messages == ['Not a valid integer.']
+    with pytest.raises(ValidationError):
+        field.fail('invalid')
+
+
+class PrefixedInteger(fields.Integer):
+    def fail(self, key, **kwargs):
+        try:
+            super(PrefixedInteger, self).fail(key, **kwargs)
+        except ValidationError as error:
+            raise ValidationError(['{0}: {1}'.format(key, msg) for msg in error.messages])
+
+
+def test_make_error_uses_overridden_fail():
+    field = PrefixedInteger()
+    assert field.make_error('invalid').messages == ['invalid: Not a valid integer.']
+    with pytest.raises(ValidationError) as excinfo:
+        field.deserialize('bad')
+    assert excinfo.value.messages == ['invalid: Not a valid integer.']
+
+
+@pytest.mark.parametrize('many', [False, True])
+def test_schemas_report_errors_of_overridden_fail(many):
+    class PrefixedSchema(Schema):
+        num = PrefixedInteger(required=True, validate=lambda value: value > 0)
+        other = PrefixedInteger(allow_none=False)
+
+    schema = PrefixedSchema(many=many)
+    data = [{'num': 'bad', 'other': None}, {'num': -1}, {}]
+    expected = {
+        0: {
+            'num': ['invalid: Not a valid integer.'],
+            'other': ['null: Field may not be null.'],
+        },
+        1: {'num': ['validator_failed: Invalid value.']},
+        2: {'num': ['required: Missing data for required field.']},
+    }
+    for _ in range(2):  # The schema generates its functions when reused
+        if many:
+            assert schema.load(data).errors == expected
+            assert schema.validate(data) == expected
+        else:
+            for idx, item in enumerate(data):
+                assert schema.load(item).errors == expected[idx]
+
+
+def test_deserialize_or_error_returns_errors_of_builtin_fields():
+    assert fields.Integer()._deserialize_or_error('42', 'num', {}) == 42
+    error = fields.Integer()._deserialize_or_error('bad', 'num', {})
+    assert isinstance(error, ValidationError)
+    error = fields.UUID()._deserialize_or_error('bad', 'uid', {})
+    assert error.messages == ['Not a valid UUID.']
+
+
+class TestFieldCache:
+
+    @pytest.mark.parametrize(('field', 'value'), [
+        (fields.DateTime(cache=True), '2013-11-10T01:23:45+00:00'),
+        (fields.Date(cache=True), '2013-11-10'),
+        (fields.Time(cache=True), '01:23:45'),
+        (fields.UUID(cache=True), '12345678-1234-5678-1234-567812345678'),
+        (fields.Decimal(places=2, cache=True), '1.005'),
+    ])
+    def test_repeated_inputs_are_parsed_once(self, field, value):
+        first = field.deserialize(value)
+        second = field.deserialize(value)
+        assert first == second
+        assert field.cache.cache_info() == (1, 1, 1024, 1)
+
+    def test_errors_and_non_string_inputs_are_not_cached(self):
+        field = fields.UUID(cache=10)
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                field.deserialize('invalid')
+        field = fields.Decimal(cache=10)
+        assert field.deserialize(1.5) == field.deserialize(1.5)
+        assert len(field.cache) == 0
+        assert field.cache.maxsize == 10
+
+    def test_cache_key_includes_datetime_format(self):
+        cache = utils.LRUCache()
+
+        class MySchema(Schema):
+            created = fields.DateTime(cache=cache)
+
+            class Meta:
+                dateformat = '%Y'
+
+        value = '2013'
+        assert MySchema().load({'created': value}).data['created'].year == 2013
+        with pytest.raises(ValidationError):
+            fields.DateTime(cache=cache).deserialize(value)
+
+    @pytest.mark.parametrize('field_class', [fields.Str, fields.Int, fields.Field, fields.List])
+    def test_fields_with_mutable_results_cannot_be_cached(self, field_class):
+        args = (fields.Str(),) if field_class is fields.List else ()
+        with pytest.raises(ValueError):
+            field_class(*args, cache=True)
+        assert field_class(*args, cache=False).cache is None
@@ -2,6 +2,9 @@
 
 import pytest
 
+import datetime as dt
+import decimal
+
 from marshmallow import fields
 from marshmallow.marshalling import Marshaller, Unmarshaller, missing
 from marshmallow.exceptions import ValidationError
@@ -102,6 +105,51 @@ class TestMarshaller:
         assert 1 not in marshal.errors
         assert 'email' in marshal.errors
 
+    @pytest.mark.parametrize('obj_type', [None, dict])
+    @pytest.mark.parametrize('index_errors', [False, True])
+    def test_serialize_by_column_matches_serialize_by_row(self, obj_type, index_errors):
+        fields_dict = {
+            'name': fields.String(dump_to='NaMe'),
+            'age': fields.Integer(default=lambda: 18),
+            'score': fields.Float(),
+            'ratio': fields.Number(as_string=True),
+            'price': fields.Decimal(places=2),
+            'created': fields.DateTime(),
+            'birthday': fields.DateTime(format='rfc'),
+            'email': fields.Email(),
+            'password': fields.String(load_only=True),
+        }
+        objs = [
+            {'name': 'Mick', 'age': 42, 'score': 4, 'ratio': 0.5,
+             'price': decimal.Decimal('1.234'), 'created': dt.datetime(2015, 10, 26),
+             'birthday': dt.datetime(1943, 7, 26), 'email': 'mick@stones.com'},
+            {'name': b'Keith', 'age': '41', 'score': None, 'price': 'NaN',
+             'created': 'bad', 'email': 'invalid', 'password': 'secret'},
+            {'score': 'bad', 'price': 2, 'created': None},
+        ]
+        results = []
+        for by_column in (False, True):
+            marshal = Marshaller(prefix='usr_')
+            try:
+                data = marshal(objs, fields_dict, many=True, index_errors=index_errors,
+                               by_column=by_column, obj_type=obj_type)
+            except ValidationError as err:
+                data = err.data
+            results.append((data, marshal.errors))
+        assert results[1] == results[0]
+        data, errors = results[1]
+        assert data[2]['usr_age'] == 18
+        assert 'usr_name' not in data[2]
+
+    def test_serialize_by_column_calls_overridden_serialize(self, marshal):
+        class UpperString(fields.String):
+            def _serialize(self, value, attr, obj):
+                return value.upper()
+
+        data = marshal([{'name': 'Mick'}, {'name': 'Keith'}], {'name': UpperString()},
+                       many=True, by_column=True, obj_type=dict)
+        assert data == [{'name': 'MICK'}, {'name': 'KEITH'}]
+
 class TestUnmarshaller:
 
     @pytest.fixture
@@ -260,3 +308,29 @@ class TestUnmarshaller:
         assert 'years' not in result
 
         assert 'always_invalid' not in unmarshal.errors
+
+    def test_collect_stores_errors_without_raising(self, unmarshal):
+        fields_dict = {
+            'email': fields.Email(),
+            'age': fields.Integer(),
+            'uid': fields.UUID(required=True),
+        }
+        result = unmarshal.collect({'email': 'bademail', 'age': 'bad'}, fields_dict)
+        assert result == {}
+        assert set(unmarshal.errors) == {'email', 'age', 'uid'}
+        assert unmarshal.errors['age'] == ['Not a valid integer.']
+        assert unmarshal.errors['uid'] == ['Missing data for required field.']
+
+    def test_deserialize_field_that_raises_errors(self, unmarshal):
+        class Odd(fields.Integer):
+            def _deserialize(self, value, attr, data):
+                value = super(Odd, self)._deserialize(value, attr, data)
+                if value % 2 == 0:
+                    raise ValidationError('Not odd.')
+                return value
+
+        fields_dict = {'num': Odd()}
+        assert unmarshal.deserialize({'num': '3'}, fields_dict) == {'num': 3}
+        with pytest.raises(ValidationError) as excinfo:
+            unmarshal.deserialize({'num': '4'}, fields_dict)
+        assert excinfo.value.messages == {'num': ['Not odd.']}
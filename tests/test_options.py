@@ -51,6 +51,40 @@ class TestUnordered:
         assert type(result.data) is dict
 
 
+class TestDumpByColumn:
+
+    class ByColumnUserSchema(UserSchema):
+        class Meta:
+            dump_by_column = True
+
+    class OrderedByColumnSchema(Schema):
+        name = fields.Str()
+        email = fields.Email()
+        age = fields.Integer()
+
+        class Meta:
+            ordered = True
+            dump_by_column = True
+
+    def test_dump_by_column_matches_dump(self, user):
+        users = [user, User('Keith', age='bad', email='invalid')]
+        result = self.ByColumnUserSchema(many=True).dump(users)
+        expected = UserSchema(many=True).dump(users)
+        assert result == expected
+        assert 1 in result.errors
+
+    def test_dump_by_column_keeps_order(self, user):
+        data = self.OrderedByColumnSchema(many=True).dump([user, user]).data
+        assert isinstance(data[0], OrderedDict)
+        assert list(data[0]) == ['name', 'email', 'age']
+
+    def test_dump_by_column_strict(self):
+        schema = self.OrderedByColumnSchema(many=True, strict=True)
+        with pytest.raises(ValidationError) as excinfo:
+            schema.dump([{'age': 'bad'}])
+        assert excinfo.value.messages == {0: {'age': ['Not a valid integer.']}}
+
+
 class KeepOrder(Schema):
     class Meta:
         ordered = True
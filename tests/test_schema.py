@@ -2,15 +2,18 @@
 # -*- coding: utf-8 -*-
 
 import simplejson as json
+import datetime as dt
 import decimal
+import io
 import random
+import threading
 from collections import namedtuple
 
 import pytest
 
 from marshmallow import (
-    Schema, fields, utils, MarshalResult, UnmarshalResult,
-    validates, validates_schema
+    Schema, fields, utils, validate, columnar, marshalling, MarshalResult, UnmarshalResult,
+    validates, validates_schema, pre_dump, post_dump, post_load
 )
 from marshmallow.exceptions import ValidationError
 from marshmallow.compat import OrderedDict
@@ -162,6 +165,53 @@ def test_dump_many():
     assert data[0] == s.dump(u1).data
 
 
+def test_dump_iter():
+    s = UserSchema(many=True)
+    pulled = []
+
+    def users():
+        for user in (User('Mick'), User('Keith', email='invalid')):
+            pulled.append(user)
+            yield user
+
+    results = s.dump_iter(users())
+    assert pulled == []
+    first = next(results)
+    assert len(pulled) == 1
+    assert type(first) == MarshalResult
+    assert first == s.dump(pulled[0], many=False)
+    data, errors = next(results)
+    assert data['name'] == 'Keith'
+    assert errors == {'email': ['Not a valid email address.']}
+    assert list(results) == []
+
+
+def test_dump_iter_invokes_processors_per_item():
+    class MySchema(Schema):
+        name = fields.Str()
+
+        @pre_dump(pass_many=True)
+        def check_many(self, obj, many):
+            assert many is False
+            return obj
+
+        @post_dump
+        def upper(self, data):
+            data['name'] = data['name'].upper()
+            return data
+
+    results = MySchema().dump_iter([{'name': 'mick'}, {'name': 'keith'}])
+    assert [data for data, _ in results] == [{'name': 'MICK'}, {'name': 'KEITH'}]
+
+
+def test_dump_iter_strict_raises_for_first_invalid_item():
+    s = UserSchema(strict=True)
+    results = s.dump_iter([User('Mick'), User('Keith', email='invalid')])
+    assert next(results).data['name'] == 'Mick'
+    with pytest.raises(ValidationError):
+        next(results)
+
+
 def test_multiple_errors_can_be_stored_for_a_given_index():
     class MySchema(Schema):
         foo = fields.Str(validate=lambda x: len(x) > 3)
@@ -217,6 +267,92 @@ def test_dumps_returns_a_marshalresult(user):
     assert type(result.data) == str
     assert type(result.errors) == dict
 
+class TestDumpStream:
+
+    class FlushCounter(io.StringIO):
+        flushes = 0
+
+        def flush(self):
+            self.flushes += 1
+
+    @pytest.mark.parametrize('count', [0, 1, 4, 5])
+    @pytest.mark.parametrize('chunk_size', [1, 2, 1000])
+    def test_dump_stream_json_array(self, count, chunk_size):
+        users = [User('User {0}'.format(i)) for i in range(count)]
+        s = UserSchema(many=True)
+        fp = self.FlushCounter()
+        errors = s.dump_stream(users, fp, chunk_size=chunk_size)
+        assert errors == {}
+        assert json.loads(fp.getvalue()) == json.loads(s.dumps(users).data)
+        assert fp.flushes == -(-count // chunk_size)
+
+    def test_dump_stream_ndjson(self):
+        users = [User('Mick'), User('Keith', email='invalid'), User('Ron')]
+        s = UserSchema()
+        fp = io.StringIO()
+        errors = s.dump_stream(iter(users), fp, many=True, ndjson=True, chunk_size=2,
+                               separators=(',', ':'))
+        assert errors == {1: {'email': ['Not a valid email address.']}}
+        lines = fp.getvalue().split('\n')
+        assert lines[-1] == ''
+        assert [json.loads(line) for line in lines[:-1]] == s.dump(users, many=True).data
+
+    def test_dump_stream_single_object(self, user):
+        s = UserSchema()
+        fp = io.StringIO()
+        assert s.dump_stream(user, fp) == {}
+        assert fp.getvalue() == s.dumps(user).data
+
+    @pytest.mark.parametrize('ndjson', [False, True])
+    def test_dump_stream_with_pass_many_processors(self, ndjson):
+        class EnvelopeSchema(Schema):
+            name = fields.Str()
+
+            @pre_dump(pass_many=True)
+            def sort(self, objs, many):
+                return sorted(objs, key=lambda obj: obj.name) if many else objs
+
+            @post_dump(pass_many=True)
+            def wrap(self, data, many):
+                return {'users': data, 'count': len(data)} if many else data
+
+        users = [User('Ron'), User('Mick')]
+        s = EnvelopeSchema(many=True)
+        fp = io.StringIO()
+        assert s.dump_stream(iter(users), fp, ndjson=ndjson) == {}
+        expected = {'users': [{'name': 'Mick'}, {'name': 'Ron'}], 'count': 2}
+        assert json.loads(fp.getvalue()) == expected
+        assert fp.getvalue().endswith('\n') is ndjson
+
+    def test_dump_stream_ndjson_with_pass_many_pre_dump(self):
+        class SortedSchema(Schema):
+            name = fields.Str()
+
+            @pre_dump(pass_many=True)
+            def sort(self, objs, many):
+                return sorted(objs, key=lambda obj: obj.name) if many else objs
+
+        fp = io.StringIO()
+        SortedSchema(many=True).dump_stream([User('Ron'), User('Mick')], fp, ndjson=True)
+        assert fp.getvalue() == '{"name": "Mick"}\n{"name": "Ron"}\n'
+
+    def test_dump_stream_uses_json_module(self, user):
+        class textjson(object):
+            @staticmethod
+            def dumps(val):
+                return '"encoded"'
+
+        class MySchema(Schema):
+            name = fields.Str()
+
+            class Meta:
+                json_module = textjson
+
+        fp = io.StringIO()
+        MySchema(many=True).dump_stream([user, user], fp)
+        assert fp.getvalue() == '["encoded", "encoded"]'
+
+
 def test_dumping_single_object_with_collection_schema():
     s = UserSchema(many=True)
     user = UserSchema('Mick')
@@ -262,6 +398,329 @@ def test_loads_returns_an_unmarshalresult(user):
     assert type(result.data) == User
     assert type(result.errors) == dict
 
+def test_load_iter():
+    s = UserSchema(many=True)
+    records = iter([{'name': 'Mick'}, {'name': 'Keith', 'email': 'invalid'}])
+    results = s.load_iter(records)
+    index, data, errors = next(results)
+    assert index == 0
+    assert type(data) == User
+    assert data.name == 'Mick'
+    assert errors == {}
+    index, data, errors = next(results)
+    assert index == 1
+    assert data == {'name': 'Keith'}
+    assert errors == {'email': ['Not a valid email address.']}
+    assert list(results) == []
+
+
+def test_load_iter_from_ndjson_file():
+    s = UserSchema()
+    fp = io.StringIO('{"name": "Mick"}\n\n{"name": "Keith", "age": "bad"}\n')
+    results = list(s.load_iter(fp))
+    assert [index for index, _, _ in results] == [0, 1]
+    assert results[0][1].name == 'Mick'
+    assert results[1][2] == {'age': ['Not a valid number.']}
+
+
+def test_load_iter_continues_after_malformed_json():
+    s = UserSchema()
+    fp = io.StringIO('{"name": "Mick"}\n{"name": \n{"name": "Keith"}\n')
+    results = list(s.load_iter(fp))
+    assert [index for index, _, _ in results] == [0, 1, 2]
+    index, data, errors = results[1]
+    assert data is None
+    assert list(errors) == ['_schema']
+    assert errors['_schema'][0].startswith('Invalid JSON: ')
+    assert results[0][1].name == 'Mick'
+    assert results[2][1].name == 'Keith'
+    assert results[2][2] == {}
+
+
+def test_load_iter_strict_raises_for_malformed_json():
+    s = UserSchema(strict=True)
+    results = s.load_iter(['{"name": "Mick"}', 'bad'])
+    assert next(results)[1].name == 'Mick'
+    with pytest.raises(ValidationError) as excinfo:
+        next(results)
+    assert excinfo.value.field_names == ['_schema']
+
+
+def test_load_iter_strict_raises_for_first_invalid_record():
+    s = UserSchema(strict=True)
+    results = s.load_iter(['{"name": "Mick"}', '{"name": "Keith", "age": "bad"}'])
+    assert next(results)[1].name == 'Mick'
+    with pytest.raises(ValidationError):
+        next(results)
+
+
+def test_loads_stream():
+    s = UserSchema()
+    fp = io.StringIO('[{"name": "Mick"}, {"name": "Keith", "age": "bad"}]')
+    results = s.loads_stream(fp, chunk_size=8)
+    index, data, errors = next(results)
+    assert (index, data.name, errors) == (0, 'Mick', {})
+    # The rest of the array has not been read yet
+    assert fp.tell() < len(fp.getvalue())
+    index, data, errors = next(results)
+    assert (index, errors) == (1, {'age': ['Not a valid number.']})
+    assert list(results) == []
+
+
+@pytest.mark.skipif(not columnar.numpy_available, reason='numpy is not installed')
+class TestColumns:
+
+    class ColumnSchema(Schema):
+        id = fields.Int()
+        name = fields.Str()
+        score = fields.Float(validate=validate.Range(min=0))
+        active = fields.Bool()
+        created = fields.DateTime()
+        price = fields.Decimal(places=2)
+
+    def make_rows(self, count):
+        return [{
+            'id': i,
+            'name': 'row {0}'.format(i),
+            'score': i / 2.0,
+            'active': bool(i % 2),
+            'created': dt.datetime(2015, 1, 1, i, tzinfo=utils.UTC),
+            'price': decimal.Decimal('1.5'),
+        } for i in range(count)]
+
+    def test_dump_columns(self):
+        numpy = columnar.numpy
+        rows = self.make_rows(3)
+        data, errors = self.ColumnSchema().dump_columns(iter(rows))
+        assert errors == {}
+        assert data['id'].dtype == numpy.int64
+        assert data['id'].tolist() == [0, 1, 2]
+        assert data['name'] == ['row 0', 'row 1', 'row 2']
+        assert data['score'].tolist() == [0.0, 0.5, 1.0]
+        assert data['active'].tolist() == [False, True, False]
+        assert data['price'].dtype == numpy.float64
+        assert data['created'].dtype == numpy.dtype('datetime64[us]')
+        assert data['created'].tolist() == [row['created'].replace(tzinfo=None)
+                                            for row in rows]
+
+    def test_dump_columns_matches_dump(self):
+        rows = self.make_rows(4)
+        rows[1]['id'] = '42'
+        rows[2]['score'] = None
+        del rows[3]['name']
+        s = self.ColumnSchema()
+        data = s.dump_columns(rows).data
+        dumped = s.dump(rows, many=True).data
+        assert data['id'].tolist() == [row['id'] for row in dumped]
+        assert data['score'] == [row['score'] for row in dumped]
+        assert data['name'] == ['row 0', 'row 1', 'row 2', None]
+
+    def test_dump_columns_of_objects(self):
+        class Point(object):
+            def __init__(self, x):
+                self.x = x
+
+            def y(self):
+                return self.x * 2
+
+        class PointSchema(Schema):
+            x = fields.Int()
+            y = fields.Int()
+
+        data = PointSchema().dump_columns([Point(1), Point(2)]).data
+        assert data['x'].tolist() == [1, 2]
+        # Callable attributes are called, as with dump
+        assert data['y'].tolist() == [2, 4]
+
+    def test_dump_columns_errors(self):
+        rows = self.make_rows(3)
+        rows[1]['id'] = 'invalid'
+        s = self.ColumnSchema()
+        data, errors = s.dump_columns(rows)
+        assert data['id'] == [0, None, 2]
+        assert errors == {1: {'id': ['Not a valid integer.']}}
+        s.strict = True
+        with pytest.raises(ValidationError):
+            s.dump_columns(rows)
+
+    def test_load_columns_roundtrip(self):
+        numpy = columnar.numpy
+        s = self.ColumnSchema()
+        columns = s.dump_columns(self.make_rows(3)).data
+        data, errors = s.load_columns(columns)
+        assert errors == {}
+        for key in ('id', 'score', 'active', 'created'):
+            assert isinstance(data[key], numpy.ndarray)
+            assert data[key].tolist() == columns[key].tolist()
+        assert data['name'] == columns['name']
+        assert data['price'].tolist() == [1.5, 1.5, 1.5]
+
+    def test_load_columns_errors(self):
+        numpy = columnar.numpy
+        data, errors = self.ColumnSchema().load_columns({
+            'id': ['1', 'invalid'],
+            'score': numpy.array([1.0, -1.0]),
+            'created': numpy.array(['2015-01-01', 'NaT'], dtype='datetime64[D]'),
+        })
+        assert data['id'] == [1, None]
+        assert data['score'] == [1.0, None]
+        assert data['created'] == [dt.datetime(2015, 1, 1), None]
+        assert errors == {
+            1: {
+                'id': ['Not a valid integer.'],
+                'score': ['Must be at least 0.'],
+                'created': ['Field may not be null.'],
+            },
+        }
+
+    def test_load_columns_missing_columns(self):
+        class RequiredSchema(Schema):
+            id = fields.Int(required=True)
+            name = fields.Str(missing='anonymous')
+            email = fields.Str()
+
+        s = RequiredSchema()
+        data, errors = s.load_columns({'id': [1, 2]})
+        assert data['name'] == ['anonymous', 'anonymous']
+        assert 'email' not in data
+        assert errors == {}
+        data, errors = s.load_columns({'name': ['Mick']})
+        assert errors == {0: {'id': ['Missing data for required field.']}}
+        data, errors = s.load_columns({'name': ['Mick']}, partial=True)
+        assert data == {'name': ['Mick']}
+        assert errors == {}
+
+    def test_load_columns_of_different_lengths(self):
+        with pytest.raises(ValueError):
+            self.ColumnSchema().load_columns({'id': [1, 2], 'name': ['Mick']})
+
+    def test_timestamp_columns(self):
+        numpy = columnar.numpy
+
+        class TimestampSchema(Schema):
+            created = fields.DateTime(format='timestamp_ms')
+
+        s = TimestampSchema()
+        rows = self.make_rows(3)
+        columns = s.dump_columns(rows).data
+        assert columns['created'].dtype == numpy.int64
+        dumped = s.dump(rows, many=True).data
+        assert columns['created'].tolist() == [row['created'] for row in dumped]
+        data, errors = s.load_columns(columns)
+        assert errors == {}
+        assert data['created'].tolist() == [row['created'].replace(tzinfo=None)
+                                            for row in rows]
+
+    def test_load_columns_of_unsigned_integers_out_of_int64_range(self):
+        numpy = columnar.numpy
+
+        class UnsignedSchema(Schema):
+            id = fields.Int()
+            count = fields.Float()
+            created = fields.DateTime(format='timestamp')
+
+        values = numpy.array([1, 2 ** 63, 2 ** 64 - 1], dtype='uint64')
+        data, errors = UnsignedSchema().load_columns(
+            {'id': values, 'count': values, 'created': values})
+        assert data['id'] == [1, None, None]
+        assert data['count'].tolist() == [1.0, 2.0 ** 63, 2.0 ** 64]
+        assert data['created'][0] == dt.datetime(1970, 1, 1, 0, 0, 1, tzinfo=utils.UTC)
+        assert data['created'][1:] == [None, None]
+        assert errors == {
+            1: {'id': ['Not a valid integer.'], 'created': ['Not a valid datetime.']},
+            2: {'id': ['Not a valid integer.'], 'created': ['Not a valid datetime.']},
+        }
+        values = numpy.array([1, 2], dtype='uint64')
+        data, errors = UnsignedSchema().load_columns({'id': values})
+        assert data['id'].dtype == numpy.int64
+        assert data['id'].tolist() == [1, 2]
+
+    def test_null_values_are_found_by_identity(self):
+        class EqualToAll(object):
+            def __eq__(self, other):
+                return True
+
+        assert not columnar._has_null([EqualToAll()])
+        assert columnar._has_null([EqualToAll(), None])
+        assert columnar._has_null([utils.missing])
+
+
+def test_columns_require_numpy(monkeypatch):
+    monkeypatch.setattr(columnar, 'numpy_available', False)
+    with pytest.raises(RuntimeError):
+        UserSchema().dump_columns([])
+    with pytest.raises(RuntimeError):
+        UserSchema().load_columns({})
+
+
+class TestFailFast:
+
+    class FailFastSchema(Schema):
+        name = fields.Str(required=True)
+        age = fields.Int(validate=validate.Range(min=18))
+        email = fields.Email()
+
+        def __init__(self, *args, **kwargs):
+            super(TestFailFast.FailFastSchema, self).__init__(*args, **kwargs)
+            self.calls = []
+
+        @validates('email')
+        def validate_email(self, value):
+            self.calls.append('email')
+
+        @validates_schema
+        def validate_all(self, data):
+            self.calls.append('schema')
+            raise ValidationError('Invalid data.')
+
+        @validates_schema(pass_many=True)
+        def validate_many(self, data, many):
+            self.calls.append('many')
+
+    def test_load_stops_at_first_error(self):
+        schema = self.FailFastSchema()
+        for _ in range(2):  # Generic and compiled deserialization
+            schema.calls = []
+            errors = schema.load({'age': 'bad', 'email': 'invalid'}, fail_fast=True).errors
+            assert len(errors) == 1
+            assert schema.calls == []
+
+    def test_load_runs_validators_until_first_error(self):
+        schema = self.FailFastSchema()
+        errors = schema.load({'name': 'Mick', 'email': 'mick@stones.com'},
+                             fail_fast=True).errors
+        assert errors == {'_schema': ['Invalid data.']}
+        assert schema.calls == ['email', 'many', 'schema']
+
+    def test_load_many_stops_at_first_invalid_item(self):
+        schema = self.FailFastSchema(many=True)
+        data = [{'name': 'Mick', 'age': 42}, {'name': 'Keith', 'age': 12},
+                {'age': 'bad'}]
+        result = schema.load(data, fail_fast=True)
+        assert result.errors == {1: {'age': ['Must be at least 18.']}}
+        assert result.data == [{'name': 'Mick', 'age': 42}, {'name': 'Keith'}]
+        assert schema.calls == []
+
+    def test_fail_fast_meta_option(self):
+        class MySchema(self.FailFastSchema):
+            class Meta:
+                fail_fast = True
+                strict = True
+
+        with pytest.raises(ValidationError) as excinfo:
+            MySchema().loads('{"age": "bad", "email": "invalid"}')
+        assert len(excinfo.value.messages) == 1
+        with pytest.raises(ValidationError) as excinfo:
+            MySchema().validate({'age': 12}, fail_fast=False)
+        assert set(excinfo.value.messages) == set(['name', 'age', '_schema'])
+
+    def test_load_without_fail_fast_collects_all_errors(self):
+        schema = self.FailFastSchema()
+        errors = schema.load({'age': 'bad', 'email': 'invalid'}).errors
+        assert set(errors) == set(['name', 'age', 'email', '_schema'])
+        assert schema.calls == ['many', 'schema']
+
+
 def test_loads_many():
     s = UserSchema()
     in_data = [{'name': 'Mick'}, {'name': 'Keith'}]
@@ -309,6 +768,166 @@ def test_on_bind_field_hook():
     assert schema.fields['foo'].metadata['fname'] == 'foo'
 
 
+def test_fields_are_bound_once_across_dumps():
+    bound = []
+
+    class MySchema(Schema):
+        foo = fields.Str()
+        bar = fields.Int()
+
+        def on_bind_field(self, field_name, field_obj):
+            bound.append(field_name)
+
+    schema = MySchema()
+    assert sorted(bound) == ['bar', 'foo']
+    for _ in range(3):
+        schema.dump({'foo': 'x', 'bar': 1})
+    schema.dump([{'foo': 'x', 'bar': 1}], many=True)
+    assert len(bound) == 2
+
+
+@pytest.mark.parametrize('attr, value, expected', [
+    ('only', ('foo', ), {'foo': 'x'}),
+    ('exclude', ('foo', ), {'bar': 1}),
+    ('load_only', ('foo', ), {'bar': 1}),
+])
+def test_fields_are_rebound_when_options_change(attr, value, expected):
+    class MySchema(Schema):
+        foo = fields.Str()
+        bar = fields.Int()
+
+    schema = MySchema()
+    assert schema.dump({'foo': 'x', 'bar': 1}).data == {'foo': 'x', 'bar': 1}
+    setattr(schema, attr, value)
+    assert schema.dump({'foo': 'x', 'bar': 1}).data == expected
+
+
+def test_instances_share_unbound_fields_with_class():
+    class MySchema(Schema):
+        foo = fields.Str()
+        bar = fields.Int()
+
+    schema1 = MySchema(only=('foo', ))
+    schema2 = MySchema(only=('foo', ))
+    template = MySchema._declared_fields['foo']
+    assert template.parent is None
+    assert schema1.fields['foo'] is not template
+    assert schema1.fields['foo'] is not schema2.fields['foo']
+    assert schema1.fields['foo'].parent is schema1
+    assert schema1.declared_fields['foo'] is schema1.fields['foo']
+    # Fields that aren't bound are not copied
+    assert schema1.declared_fields['bar'] is MySchema._declared_fields['bar']
+    schema1.only = None
+    assert schema1.dump({'foo': 'x', 'bar': 1}).data == {'foo': 'x', 'bar': 1}
+    assert schema1.fields['bar'] is not MySchema._declared_fields['bar']
+    assert schema1.fields['bar'].parent is schema1
+
+
+def test_implicit_fields_are_inferred_on_each_dump():
+    class MySchema(Schema):
+        class Meta:
+            fields = ('foo', )
+
+    schema = MySchema()
+    assert schema.dump({'foo': 1}).data == {'foo': 1}
+    assert type(schema.fields['foo']) is fields.Integer
+    assert schema.dump({'foo': 'x'}).data == {'foo': 'x'}
+    assert type(schema.fields['foo']) is fields.String
+
+
+def test_marshal_and_unmarshal_attributes_hold_the_errors_of_the_last_call():
+    schema = UserSchema()
+    assert isinstance(schema._marshal, marshalling.Marshaller)
+    assert isinstance(schema._unmarshal, marshalling.Unmarshaller)
+    schema.dump({'name': 'Joe', 'age': 'bad'})
+    assert 'age' in schema._marshal.errors
+    schema.load({'email': 'bad'})
+    assert 'email' in schema._unmarshal.errors
+    schema.validate({'homepage': 'bad'})
+    assert 'homepage' in schema._unmarshal.errors
+    assert 'email' not in schema._unmarshal.errors
+
+
+class TestThreadSafety:
+
+    class ItemSchema(Schema):
+        id = fields.Int(required=True)
+        name = fields.Str()
+
+        @validates('name')
+        def validate_name(self, value):
+            if value.endswith('!'):
+                raise ValidationError('No shouting.')
+
+    def run_threads(self, target, count=8):
+        failures = []
+
+        def run(thread_idx):
+            try:
+                target(thread_idx)
+            except Exception as err:  # pragma: no cover
+                failures.append(err)
+        threads = [threading.Thread(target=run, args=(idx, )) for idx in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert failures == []
+
+    def test_shared_schema_dump(self):
+        schema = self.ItemSchema(many=True)
+
+        def dump(thread_idx):
+            for i in range(200):
+                items = [{'id': thread_idx, 'name': str(i)}] * 5
+                if i % 2:
+                    items.append({'id': 'bad', 'name': str(thread_idx)})
+                data, errors = schema.dump(items)
+                assert data[:5] == items[:5]
+                if i % 2:
+                    assert errors == {5: {'id': ['Not a valid integer.']}}
+                else:
+                    assert errors == {}
+
+        self.run_threads(dump)
+
+    def test_shared_schema_load(self):
+        schema = self.ItemSchema(many=True)
+
+        def load(thread_idx):
+            for i in range(200):
+                items = [{'id': thread_idx, 'name': str(i)}] * 5
+                if i % 2:
+                    items.append({'id': i, 'name': 'thread {0}!'.format(thread_idx)})
+                data, errors = schema.load(items)
+                assert data[:5] == items[:5]
+                if i % 2:
+                    assert errors == {5: {'name': ['No shouting.']}}
+                else:
+                    assert errors == {}
+
+        self.run_threads(load)
+
+    def test_shared_schema_dump_with_implicit_fields(self):
+        class ImplicitSchema(Schema):
+            class Meta:
+                fields = ('id', 'value')
+
+        schema = ImplicitSchema(many=True)
+
+        def dump(thread_idx):
+            for i in range(200):
+                # The inferred class of "value" changes from one dump to the next
+                value = i if (thread_idx + i) % 2 else dt.date(2015, 1, i % 28 + 1)
+                items = [{'id': thread_idx, 'value': value}] * 3
+                data, errors = schema.dump(items)
+                assert errors == {}
+                expected = value if isinstance(value, int) else value.isoformat()
+                assert data == [{'id': thread_idx, 'value': expected}] * 3
+
+        self.run_threads(dump)
+
+
 class TestValidate:
 
     def test_validate_returns_errors_dict(self):
@@ -364,6 +983,38 @@ class TestValidate:
         assert 'foo' in errors
         assert 'required' in errors['foo'][0]
 
+    @pytest.mark.parametrize('many', [False, True])
+    def test_validate_does_not_build_output(self, many):
+        class MySchema(Schema):
+            foo = fields.Int(required=True, attribute='bar')
+
+            @post_load
+            def fail(self, data):
+                raise AssertionError('post_load must not be called')
+
+        s = MySchema()
+        data = [{'foo': 1}, {'foo': 'bad'}, {}] if many else {'foo': 'bad'}
+        errors = s.validate(data, many=many)
+        if many:
+            assert errors == {1: {'foo': ['Not a valid integer.']},
+                              2: {'foo': ['Missing data for required field.']}}
+        else:
+            assert errors == {'foo': ['Not a valid integer.']}
+        # Run the generated validation function
+        assert s.validate(data, many=many) == errors
+
+    def test_validate_with_validates_methods(self):
+        class MySchema(Schema):
+            foo = fields.Int()
+
+            @validates('foo')
+            def validate_foo(self, value):
+                if value > 10:
+                    raise ValidationError('Too large.')
+
+        assert MySchema().validate({'foo': 42}) == {'foo': ['Too large.']}
+        assert MySchema().validate({'foo': 'bad'}) == {'foo': ['Not a valid integer.']}
+
 @pytest.mark.parametrize('SchemaClass',
     [UserSchema, UserMetaSchema])
 def test_fields_are_not_copies(SchemaClass):
@@ -1289,6 +1940,56 @@ class TestNestedSchema:
         data, errors = outer.load({})
         assert errors == expected
 
+    def test_nested_objects_of_collection_dumped_at_once(self, blog, monkeypatch):
+        class BatchedBlogSchema(Schema):
+            title = fields.Str()
+            user = fields.Nested(UserSchema, only=('name', 'age'))
+            collaborators = fields.Nested(UserSchema, only=('name', 'age'), many=True)
+            collaborator_names = fields.Nested(UserSchema, only='name', many=True,
+                                               attribute='collaborators')
+
+        blogs = [blog, Blog('Empty', user=None), blog]
+        schema = BatchedBlogSchema()
+        expected = [schema.dump(each).data for each in blogs]
+        calls = []
+        nested_schema = schema.fields['collaborators'].schema
+        dump = nested_schema.dump
+        monkeypatch.setattr(nested_schema, 'dump',
+                            lambda objs, **kwargs: calls.append(objs) or dump(objs, **kwargs))
+        data, errors = schema.dump(blogs, many=True)
+        assert data == expected
+        assert not errors
+        assert calls == [blog.collaborators * 2]
+        assert data[1]['user'] is None and data[1]['collaborators'] == []
+
+    def test_nested_objects_of_collection_dumped_one_at_a_time_if_not_equivalent(self, blog):
+        class EnvelopeSchema(Schema):
+            name = fields.Str()
+
+            @post_dump(pass_many=True)
+            def envelope(self, data, many):
+                return {'many': many, 'data': data}
+
+        class StrictUserSchema(Schema):
+            age = fields.Int()
+
+            class Meta:
+                strict = True
+
+        class BlogSchema(Schema):
+            user = fields.Nested(EnvelopeSchema)
+            collaborators = fields.Nested(StrictUserSchema, many=True)
+
+        schema = BlogSchema()
+        assert not schema._batches_nested()
+        blog.collaborators[1].age = 'bad'
+        data, errors = schema.dump([blog, blog], many=True)
+        assert data[0]['user'] == {'many': False, 'data': {'name': 'Monty'}}
+        assert errors == {
+            0: {'collaborators': {1: {'age': ['Not a valid integer.']}}},
+            1: {'collaborators': {1: {'age': ['Not a valid integer.']}}},
+        }
+
 class TestSelfReference:
 
     @pytest.fixture
@@ -1500,6 +2201,21 @@ class TestContext:
         data = serializer.dump(noncollab)[0]
         assert data['is_collab'] is False
 
+    def test_list_containers_use_context_of_their_schema_instance(self):
+        class InnerSchema(Schema):
+            who = fields.Function(lambda obj, ctx: ctx['who'])
+
+        class OuterSchema(Schema):
+            whos = fields.List(fields.Function(lambda obj, ctx: ctx['who']))
+            inners = fields.List(fields.Nested(InnerSchema))
+
+        obj = {'whos': [1], 'inners': [{}]}
+        first = OuterSchema(context={'who': 'A'})
+        second = OuterSchema(context={'who': 'B'})
+        for schema, who in ((first, 'A'), (second, 'B'), (first, 'A')):
+            data = schema.dump(obj).data
+            assert data == {'whos': [who], 'inners': [{'who': who}]}
+
     def test_function_field_raises_error_when_context_not_available(self):
         # only has a function field
         class UserFunctionContextSchema(Schema):
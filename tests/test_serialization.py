@@ -3,6 +3,7 @@
 from collections import namedtuple
 import datetime as dt
 import decimal
+import uuid
 
 import mock
 import pytest
@@ -11,7 +12,7 @@ from marshmallow import Schema, fields, utils
 from marshmallow.exceptions import ValidationError
 from marshmallow.compat import basestring, OrderedDict
 
-from tests.base import User, DummyModel, ALL_FIELDS
+from tests.base import User, DummyModel, ALL_FIELDS, central
 
 class DateTimeList:
     def __init__(self, dtimes):
@@ -418,6 +419,37 @@ class TestFieldSerialization:
         field = fields.DateTime(format=format)
         assert field.serialize("created", user) == user.created.strftime(format)
 
+    @pytest.mark.parametrize(('fmt', 'expected'), [
+        ('timestamp', 1384046625),
+        ('timestamp_ms', 1384046625006),
+        ('timestamp_us', 1384046625006789),
+    ])
+    def test_datetime_timestamp(self, fmt, expected):
+        naive = dt.datetime(2013, 11, 10, 1, 23, 45, 6789)
+        aware = central.localize(dt.datetime(2013, 11, 9, 19, 23, 45, 6789), is_dst=False)
+        field = fields.DateTime(format=fmt)
+        assert field._serialize(naive, 'created', None) == expected
+        assert field._serialize(aware, 'created', None) == expected
+        assert field._serialize_many([naive, aware], 'created', [None, None]) == (
+            [expected, expected], {})
+
+    def test_date_and_time_timestamp(self):
+        date_field = fields.Date(format='timestamp')
+        assert date_field.serialize('d', {'d': dt.date(2013, 11, 10)}) == 1384041600
+        time_field = fields.Time(format='timestamp_ms')
+        assert time_field.serialize('t', {'t': dt.time(1, 23, 45, 6789)}) == 5025006
+        with pytest.raises(ValidationError):
+            time_field.serialize('t', {'t': 'invalid'})
+        with pytest.raises(ValueError):
+            fields.Date(format='rfc')
+
+    def test_datetime_serialization_does_not_modify_field(self, user):
+        field = fields.DateTime()
+        field.serialize('created', user)
+        assert field.dateformat is None
+        field.dateformat = 'rfc'
+        assert field.serialize('created', user) == utils.rfcformat(user.created)
+
     def test_string_field(self):
         field = fields.String()
         user = User(name=b'foo')
@@ -625,6 +657,15 @@ class TestFieldSerialization:
         assert result[1] == 2
         assert result[2] == 3
 
+    def test_list_field_serialize_primitive_containers(self):
+        obj = IntegerList(['1', 2, None])
+        assert fields.List(fields.Int).serialize('ints', obj) == [1, 2, None]
+        obj = IntegerList([uuid.UUID(int=1), 'a'])
+        assert fields.List(fields.UUID).serialize('ints', obj) == [str(uuid.UUID(int=1)), 'a']
+        with pytest.raises(ValidationError) as excinfo:
+            fields.List(fields.Int).serialize('ints', IntegerList([1, 'a', 'b']))
+        assert excinfo.value.messages == ['Not a valid integer.']
+
     def test_bad_list_field(self):
         class ASchema(Schema):
             id = fields.Int()
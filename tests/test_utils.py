@@ -1,7 +1,12 @@
 # -*- coding: utf-8 -*-
 import datetime as dt
+import gc
+import io
+import json
 from collections import namedtuple
 from functools import partial
+from calendar import timegm
+from email.utils import formatdate
 
 import pytest
 
@@ -143,6 +148,39 @@ def test_isoformat_localtime():
     d = central.localize(dt.datetime(2013, 11, 10, 1, 23, 45), is_dst=False)
     assert utils.isoformat(d, localtime=True) == "2013-11-10T01:23:45-06:00"
 
+@pytest.mark.parametrize('d', [
+    dt.datetime(2013, 11, 10, 1, 23, 45),
+    dt.datetime(2013, 11, 10, 1, 23, 45, 6789),
+    central.localize(dt.datetime(2013, 11, 10, 1, 23, 45), is_dst=False),
+    dt.datetime(2013, 11, 10, 1, 23, 45, tzinfo=utils.UTC),
+])
+def test_utc_formatters_match_generic_formatters(d):
+    assert utils.isoformat_utc(d) == utils.isoformat(d)
+    assert utils.rfcformat_utc(d) == formatdate(timegm(d.utctimetuple()))
+
+@pytest.mark.parametrize('fmt', [
+    '%Y-%m-%d', '%d/%m/%Y %H:%M:%S.%f', '%H%M', '100%% %Y', 'no directive', '%a, %d %b %Y',
+    '%Y-%m-%d %z',
+])
+@pytest.mark.parametrize('d', [
+    dt.datetime(2013, 11, 10, 1, 23, 45, 6789),
+    dt.datetime(999, 1, 2, 3, 4, 5),
+])
+def test_make_strftime(fmt, d):
+    assert utils.make_strftime(fmt)(d) == d.strftime(fmt)
+
+class ShiftedDatetime(dt.datetime):
+    def strftime(self, fmt):
+        return 'shifted ' + super(ShiftedDatetime, self).strftime(fmt)
+
+@pytest.mark.parametrize('fmt', ['%Y-%m-%d %H:%M', 'no directive'])
+def test_make_strftime_of_other_types(fmt):
+    strftime = utils.make_strftime(fmt)
+    assert strftime(dt.date(2013, 11, 10)) == dt.date(2013, 11, 10).strftime(fmt)
+    assert strftime(ShiftedDatetime(2013, 11, 10, 1, 2)).startswith('shifted ')
+    with pytest.raises(AttributeError):
+        strftime('2013-11-10')
+
 def test_from_datestring():
     d = dt.datetime.now()
     rfc = utils.rfcformat(d)
@@ -200,6 +238,126 @@ def test_from_iso_date(use_dateutil):
     assert type(result) == dt.date
     assert_date_equal(result, d)
 
+@pytest.mark.parametrize(('value', 'expected'), [
+    ('2013-11-10T01:23:45', dt.datetime(2013, 11, 10, 1, 23, 45)),
+    ('2013-11-10 01:23', dt.datetime(2013, 11, 10, 1, 23)),
+    ('2013-11-10T01:23:45.5', dt.datetime(2013, 11, 10, 1, 23, 45, 500000)),
+    ('2013-11-10T01:23:45.123456789', dt.datetime(2013, 11, 10, 1, 23, 45, 123456)),
+    ('2013-11-10T01:23:45Z', dt.datetime(2013, 11, 10, 1, 23, 45, tzinfo=utils.UTC)),
+    ('2013-11-10T01:23:45+00:00', dt.datetime(2013, 11, 10, 1, 23, 45, tzinfo=utils.UTC)),
+    ('2013-11-10T01:23:45-06:00',
+     dt.datetime(2013, 11, 10, 1, 23, 45, tzinfo=utils.FixedOffset(-360))),
+    ('2013-11-10T01:23:45+0530',
+     dt.datetime(2013, 11, 10, 1, 23, 45, tzinfo=utils.FixedOffset(330))),
+    ('2013-11-10T01:23:45+01', dt.datetime(2013, 11, 10, 1, 23, 45, tzinfo=utils.FixedOffset(60))),
+])
+def test_parse_iso(value, expected):
+    result = utils.parse_iso(value)
+    assert result == expected
+    assert result.utcoffset() == expected.utcoffset()
+
+@pytest.mark.parametrize('value', [
+    '', 'badvalue', '2013-11-10', '2013-11-10T', '2013-11-10T1:23:45',
+    '2013-13-10T01:23:45', '2013-11-10T01:23:45+6', 'Sun, 10 Nov 2013 08:23:45 -0600',
+])
+def test_parse_iso_invalid(value):
+    with pytest.raises(ValueError):
+        utils.parse_iso(value)
+
+@pytest.mark.parametrize(('value', 'expected'), [
+    ('Sun, 10 Nov 2013 08:23:45 -0600',
+     dt.datetime(2013, 11, 10, 8, 23, 45, tzinfo=utils.FixedOffset(-360))),
+    ('10 Nov 2013 08:23:45 +0000', dt.datetime(2013, 11, 10, 8, 23, 45, tzinfo=utils.UTC)),
+    ('Sun, 10 Nov 13 08:23 GMT', dt.datetime(2013, 11, 10, 8, 23, tzinfo=utils.UTC)),
+    ('Sun, 10 Nov 2013 08:23:45 EST',
+     dt.datetime(2013, 11, 10, 8, 23, 45, tzinfo=utils.FixedOffset(-300))),
+    ('Sun, 10 Nov 2013 08:23:45', dt.datetime(2013, 11, 10, 8, 23, 45)),
+])
+def test_parse_rfc(value, expected):
+    result = utils.parse_rfc(value)
+    assert result == expected
+    assert result.utcoffset() == expected.utcoffset()
+
+@pytest.mark.parametrize('value', [
+    '', 'Sun, 10 Foo 2013 08:23:45 -0600', 'Sun, 10 Nov 2013 08:23:45 XYZ',
+    '2013-11-10T01:23:45',
+])
+def test_parse_rfc_invalid(value):
+    with pytest.raises(ValueError):
+        utils.parse_rfc(value)
+
+def test_parse_iso_time_and_date():
+    assert utils.parse_iso_time('01:23') == dt.time(1, 23)
+    assert utils.parse_iso_time('01:23:45.25Z') == dt.time(1, 23, 45, 250000)
+    assert utils.parse_iso_date('2014-08-21') == dt.date(2014, 8, 21)
+    assert utils.parse_iso_date('2014-08-21T01:23:45') == dt.date(2014, 8, 21)
+    for func, value in [(utils.parse_iso_time, '1:23'), (utils.parse_iso_date, '2014-8-21')]:
+        with pytest.raises(ValueError):
+            func(value)
+
+@pytest.mark.skipif(not utils.dateutil_available, reason='requires python-dateutil')
+def test_from_iso_falls_back_to_dateutil_if_requested():
+    value = 'Nov 10 2013 01:23:45'
+    with pytest.raises(ValueError):
+        utils.from_iso(value)
+    assert utils.from_iso(value, use_dateutil=True) == dt.datetime(2013, 11, 10, 1, 23, 45)
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = utils.LRUCache(maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+    assert 'b' not in cache
+    assert cache.get('b', utils.missing) is utils.missing
+    assert cache.get('c') == 3
+    assert cache.cache_info() == utils.CacheInfo(hits=2, misses=1, maxsize=2, currsize=2)
+    cache.clear()
+    assert cache.cache_info() == (0, 0, 2, 0)
+
+def test_lru_cache_total_maxsize(monkeypatch):
+    monkeypatch.setattr(utils.LRUCache, 'total_maxsize', utils.LRUCache._total_size + 3)
+    first, second = utils.LRUCache(), utils.LRUCache()
+    for key in range(3):
+        first.set(key, key)
+    # The other cache can't grow once the process-wide limit is reached
+    second.set('a', 1)
+    assert len(second) == 0
+    # A full cache evicts its own entries
+    first.set(3, 3)
+    assert len(first) == 3 and 0 not in first
+    first.clear()
+    second.set('a', 1)
+    assert len(second) == 1
+    second.clear()
+
+def test_lru_cache_releases_its_entries_when_collected(monkeypatch):
+    monkeypatch.setattr(utils.LRUCache, 'total_maxsize', utils.LRUCache._total_size + 3)
+    first = utils.LRUCache()
+    for key in range(3):
+        first.set(key, key)
+    del first
+    gc.collect()
+    second = utils.LRUCache()
+    for key in range(3):
+        second.set(key, key)
+    assert len(second) == 3
+    second.clear()
+
+def test_lru_cache_ttl(monkeypatch):
+    now = [0]
+    monkeypatch.setattr(utils, '_clock', lambda: now[0])
+    cache = utils.LRUCache(ttl=5)
+    cache.set('a', 1)
+    now[0] = 4
+    assert 'a' in cache
+    assert cache.get('a') == 1
+    now[0] = 5
+    assert 'a' not in cache
+    assert cache.get('a') is None
+    assert len(cache) == 0
+    assert cache.cache_info() == (1, 1, 1024, 0)
+
 def test_get_func_args():
     def f1(self, foo, bar):
         pass
@@ -213,3 +371,55 @@ def test_get_func_args():
 
     for func in [f1, f2, f3]:
         assert utils.get_func_args(func) == ['self', 'foo', 'bar']
+
+@pytest.mark.parametrize('text', [
+    '[]',
+    ' [ ]\n',
+    '[1]',
+    '[{"a": "x\\"]y\\\\", "b": [1, {"c": "}"}]}, 2, "\\u00e9", "é€", null]',
+    '[12345, 678]',
+    json.dumps([{'k{0}'.format(i): ['v"{0}'.format(i)] * i} for i in range(20)]),
+])
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 1000])
+def test_iter_json_array(text, chunk_size):
+    expected = json.loads(text)
+    for fp in (io.StringIO(text), io.BytesIO(text.encode('utf-8'))):
+        assert list(utils.iter_json_array(fp, chunk_size=chunk_size)) == expected
+
+def test_iter_json_array_is_incremental():
+    fp = io.StringIO('[{"id": 1}, {"id": 2}, ')
+    elements = utils.iter_json_array(fp, chunk_size=4)
+    assert next(elements) == {'id': 1}
+    assert next(elements) == {'id': 2}
+    with pytest.raises(ValueError):
+        next(elements)
+
+@pytest.mark.parametrize('text', [
+    '', '{}', '[1,]', '[,1]', '[1,,2]', '[1 2]', '[}', '[{]', '[1', '[1] 2'
+])
+def test_iter_json_array_invalid(text):
+    with pytest.raises(ValueError):
+        list(utils.iter_json_array(io.StringIO(text), chunk_size=2))
+
+@pytest.mark.parametrize('text', [
+    '[1, foo, ', '[{"a": 1}}, ', '[{"a": tru}, ', '["a" "b", ', '[[1, 2,]] '
+])
+def test_iter_json_array_invalid_before_eof(text):
+    class EndlessStream(object):
+        reads = 0
+
+        def read(self, size):
+            self.reads += 1
+            assert self.reads < 10, 'Read past an invalid element'
+            return text if self.reads == 1 else ' ' * size
+
+    with pytest.raises(ValueError):
+        list(utils.iter_json_array(EndlessStream(), chunk_size=4))
+
+def test_json_value_end():
+    assert utils._json_value_end('{"a": "}"}, 2', 0) == 10
+    assert utils._json_value_end('12, 3', 0) == 2
+    assert utils._json_value_end('"a\\"b", 3', 0) == 6
+    assert utils._json_value_end('[1, [2]', 0) is None
+    assert utils._json_value_end('"abc', 0) is None
+    assert utils._json_value_end('123', 0) is None
@@ -4,6 +4,11 @@ from __future__ import unicode_literals
 import re
 import pytest
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from marshmallow.compat import PY2
 from marshmallow import validate, ValidationError
 
@@ -577,6 +582,62 @@ def test_contains_only_unhashable_types():
     with pytest.raises(ValidationError):
         validate.ContainsOnly([])([1])
 
+@pytest.mark.parametrize('choices_type', [list, tuple])
+def test_contains_only_uses_each_choice_once(choices_type):
+    validator = validate.ContainsOnly(choices_type([1, 2, [3], [3]]))
+    assert validator([2, 1]) == [2, 1]
+    assert validator([[3], 1, [3]]) == [[3], 1, [3]]
+    with pytest.raises(ValidationError):
+        validator([1, 1])
+    with pytest.raises(ValidationError):
+        validator([[3], [3], [3]])
+    with pytest.raises(ValidationError):
+        validator([[4]])
+
+def test_contains_only_in_string():
+    assert validate.ContainsOnly('abc')('ca') == 'ca'
+    with pytest.raises(ValidationError):
+        validate.ContainsOnly('abc')('aa')
+
+@pytest.mark.parametrize('choices_type', [list, tuple])
+@pytest.mark.parametrize('validator_class', [validate.OneOf, validate.NoneOf])
+def test_membership_of_mixed_hashable_and_unhashable_choices(validator_class, choices_type):
+    validator = validator_class(choices_type([1, [2], 'a']))
+    values = [1, [2], 'a', 2, [1], {}, None]
+    expected = [value in [1, [2], 'a'] for value in values]
+    passed = [not validate_each(validator, [value]) for value in values]
+    if validator_class is validate.OneOf:
+        assert passed == expected
+    else:
+        assert passed == [not member for member in expected]
+    assert validator.validate_many(values) == validate_each(validator, values)
+
+def test_one_of_choices_can_be_reassigned():
+    validator = validate.OneOf([1, 2])
+    validator.choices = (3,)
+    assert validator(3) == 3
+    with pytest.raises(ValidationError):
+        validator(1)
+
+@pytest.mark.parametrize('validator_class', [validate.OneOf, validate.ContainsOnly])
+def test_changes_to_a_list_of_choices_are_honoured(validator_class):
+    choices = [1, 2]
+    validator = validator_class(choices)
+    value = 3 if validator_class is validate.OneOf else [3]
+    with pytest.raises(ValidationError):
+        validator(value)
+    choices.append(3)
+    assert validator(value) == value
+    assert validator.validate_many([value]) == {}
+
+def test_changes_to_a_list_of_invalid_values_are_honoured():
+    iterable = [1, 2]
+    validator = validate.NoneOf(iterable)
+    assert validator(3) == 3
+    iterable.append(3)
+    with pytest.raises(ValidationError):
+        validator(3)
+
 def test_containsonly_in_tuple():
     assert validate.ContainsOnly(())(()) == ()
     assert validate.ContainsOnly((1, 2, 3))((1,)) == (1,)
@@ -651,3 +712,134 @@ def test_containsonly_repr():
         '<ContainsOnly(choices=[1, 2, 3], labels={0!r}, error={1!r})>'
         .format(['a', 'b', 'c'], 'foo')
     )
+
+def validate_each(validator, values):
+    """Return the errors of calling ``validator`` on each value, in the form
+    returned by `Validator.validate_many`.
+    """
+    errors = {}
+    for idx, value in enumerate(values):
+        try:
+            validator(value)
+        except ValidationError as err:
+            errors[idx] = err.messages
+    return errors
+
+@pytest.mark.parametrize(('validator', 'values'), [
+    (validate.Range(1, 3), [0, 1, 2, 3, 4, 2.5, -1.5]),
+    (validate.Range(min=1), [0, 1, 2]),
+    (validate.Range(max=1, error='{input} > {max}'), [0, 1, 2]),
+    (validate.Length(1, 2), ['', 'a', 'ab', 'abc', [1, 2, 3]]),
+    (validate.OneOf([1, 2]), [1, 3, '1', [1], None]),
+    (validate.OneOf([[1], [2]]), [[1], [3], 'x']),
+    (validate.NoneOf([1, 2]), [1, 3, [1], None]),
+    (validate.NoneOf([[1], [2]]), [[1], [3], 'x']),
+    (validate.Regexp(r'\d+$'), ['1', 'a', '12', '']),
+    (validate.ContainsOnly([1, 2]), [[1], [1, 3], []]),
+    (validate.Equal(1), [1, 2]),
+])
+def test_validate_many_matches_call(validator, values):
+    assert validator.validate_many(values) == validate_each(validator, values)
+
+class IsPositive(validate.Validator):
+    def __call__(self, value):
+        return value > 0
+
+def test_validate_many_rejects_values_for_which_validator_returns_false():
+    assert IsPositive().validate_many([1, 0, 2]) == {1: ['Invalid value.']}
+    assert validate.Cached(IsPositive()).validate_many([0, 1]) == {0: ['Invalid value.']}
+
+@pytest.mark.parametrize('many', [False, True])
+def test_load_rejects_values_for_which_validator_returns_false(many):
+    from marshmallow import Schema, fields
+
+    class MySchema(Schema):
+        num = fields.Int(validate=IsPositive(), error_messages={'validator_failed': 'No.'})
+        nums = fields.List(fields.Int(validate=IsPositive()))
+
+    schema = MySchema()
+    data = {'num': 0, 'nums': [1, 0]}
+    for _ in range(2):
+        if many:
+            errors = schema.load([data], many=True).errors[0]
+        else:
+            errors = schema.load(data).errors
+        assert errors == {'num': ['No.'], 'nums': ['Invalid value.']}
+
+@pytest.mark.skipif(numpy is None, reason='numpy is not installed')
+@pytest.mark.parametrize(('validator', 'values'), [
+    (validate.Range(1, 3), [0, 1, 2, 3, 4]),
+    (validate.Range(min=0.5), [0.25, 0.5, 1.5]),
+    (validate.OneOf([1, 2.5]), [1, 2.5, 3]),
+    (validate.OneOf(['a', 1]), [1, 2]),
+])
+def test_validate_many_numpy_array(validator, values):
+    errors = validator.validate_many(numpy.array(values))
+    assert errors == validate_each(validator, values)
+    # Messages are formatted with Python scalars
+    assert all(isinstance(message, type('')) for messages in errors.values()
+               for message in messages)
+
+def test_cached_memoizes_successes_and_failures():
+    calls = []
+
+    def validator(value):
+        calls.append(value)
+        if value < 0:
+            raise ValidationError('Negative.')
+        return value
+
+    cached = validate.Cached(validator, maxsize=10)
+    assert cached(1) == 1
+    assert cached(1) == 1
+    for _ in range(2):
+        with pytest.raises(ValidationError) as excinfo:
+            cached(-1)
+        assert excinfo.value.messages == ['Negative.']
+    assert calls == [1, -1]
+    # Equal values of another type are validated separately
+    assert cached(True) is True
+    assert calls == [1, -1, True]
+    assert cached.cache_info() == (2, 3, 10, 3)
+    assert cached.validate_many([1, -1, 2]) == {1: ['Negative.']}
+    assert calls == [1, -1, True, 2]
+    cached.cache_clear()
+    assert cached.cache_info() == (0, 0, 10, 0)
+
+def test_cached_does_not_share_error_messages():
+    cached = validate.Cached(validate.Length(max=1))
+    with pytest.raises(ValidationError) as excinfo:
+        cached('ab')
+    excinfo.value.messages.append('Other.')
+    with pytest.raises(ValidationError) as excinfo:
+        cached('ab')
+    assert excinfo.value.messages == ['Longer than maximum length 1.']
+
+def test_cached_calls_validator_for_unhashable_values():
+    validator = validate.ContainsOnly([1, 2])
+    cached = validate.Cached(validator)
+    assert cached([1]) == [1]
+    with pytest.raises(ValidationError):
+        cached([3])
+    assert cached.cache_info().currsize == 0
+
+def test_cached_ttl(monkeypatch):
+    from marshmallow import utils
+    now = [0]
+    monkeypatch.setattr(utils, '_clock', lambda: now[0])
+    calls = []
+    cached = validate.Cached(calls.append, ttl=10)
+    cached('a')
+    now[0] = 9
+    cached('a')
+    assert calls == ['a']
+    now[0] = 10
+    cached('a')
+    assert calls == ['a', 'a']
+    assert cached.cache_info().misses == 2
+
+def test_cached_repr():
+    cached = validate.Cached(validate.Equal(1), maxsize=5, ttl=2)
+    assert repr(cached) == (
+        '<Cached(validator={0!r}, maxsize=5, ttl=2)>'.format(cached.validator)
+    )